@@ -0,0 +1,103 @@
+"""
+Build script for the web version
+Packs the game package (compiled to bytecode), web_integration.py and the
+assets (or the asset pack, if built) into one zip archive. game.js fetches it in a single request and
+unpacks it into Pyodide's file system, instead of fetching and writing
+every source file separately; bytecode skips compiling on page load.
+
+Usage: python build_web.py [--output bric_game.zip] [--source]
+"""
+import argparse
+import os
+import py_compile
+import sys
+import tempfile
+import zipfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Python version of the Pyodide release index.html loads (0.23.2);
+# bytecode only loads on the version that wrote it
+WEB_PYTHON = (3, 11)
+
+# Development tools that the browser never imports
+DESKTOP_ONLY = {"src/autopilot.py", "src/batch_runner.py", "src/benchmark.py"}
+
+# Files that are already compressed are stored as they are
+STORED_EXTENSIONS = {".png", ".gif", ".jpg", ".jpeg", ".ogg", ".mp3", ".wav", ".ttf", ".otf", ".pack"}
+
+def find_modules():
+    """Archive names of the Python modules the web version needs"""
+    modules = ["web_integration.py"]
+    for directory, subdirectories, files in os.walk(os.path.join(ROOT, "src")):
+        subdirectories[:] = sorted(name for name in subdirectories if name != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                archive_name = os.path.relpath(os.path.join(directory, name), ROOT).replace(os.sep, "/")
+                if archive_name not in DESKTOP_ONLY:
+                    modules.append(archive_name)
+    return modules
+
+def find_assets():
+    """
+    Archive names of the assets: the asset pack if one has been built
+    (see src/utils/asset_pack.py), else every file under assets/
+    """
+    if os.path.exists(os.path.join(ROOT, "assets.pack")):
+        return ["assets.pack"]
+    assets = []
+    for directory, subdirectories, files in os.walk(os.path.join(ROOT, "assets")):
+        subdirectories.sort()
+        for name in sorted(files):
+            assets.append(os.path.relpath(os.path.join(directory, name), ROOT).replace(os.sep, "/"))
+    return assets
+
+def compile_module(archive_name, build_dir):
+    """Compile a module to a .pyc file that is loaded without its source"""
+    compiled_path = os.path.join(build_dir, archive_name + "c")
+    os.makedirs(os.path.dirname(compiled_path), exist_ok=True)
+    # Unchecked hash-based bytecode never looks for the source file
+    py_compile.compile(os.path.join(ROOT, archive_name), cfile=compiled_path, dfile=archive_name,
+                       doraise=True, invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    return compiled_path
+
+def build(output, source=False):
+    """
+    Write the web archive to output
+    With source=True the modules are packed as .py files instead of bytecode
+    Returns the number of files packed
+    """
+    modules = find_modules()
+    assets = find_assets()
+    with tempfile.TemporaryDirectory() as build_dir, \
+            zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for archive_name in modules:
+            if source:
+                archive.write(os.path.join(ROOT, archive_name), archive_name)
+            else:
+                archive.write(compile_module(archive_name, build_dir), archive_name + "c")
+        for archive_name in assets:
+            extension = os.path.splitext(archive_name)[1].lower()
+            compression = zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+            archive.write(os.path.join(ROOT, archive_name), archive_name, compress_type=compression)
+    return len(modules) + len(assets)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the single-archive web bundle of Bric Game")
+    parser.add_argument("--output", default=os.path.join(ROOT, "bric_game.zip"),
+                        help="Archive to write (game.js loads bric_game.zip next to index.html)")
+    parser.add_argument("--source", action="store_true",
+                        help="Pack .py sources instead of bytecode")
+    args = parser.parse_args()
+    
+    if not args.source and sys.version_info[:2] != WEB_PYTHON:
+        version = ".".join(map(str, WEB_PYTHON))
+        sys.exit(f"Bytecode must be built with Python {version} to match Pyodide; "
+                 f"run this script with Python {version} or pass --source")
+    
+    count = build(args.output, args.source)
+    kind = "sources" if args.source else "bytecode"
+    print(f"Wrote {args.output}: {count} files ({kind}), {os.path.getsize(args.output) / 1024:.1f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,19 @@
  * This file handles loading the Python game via Pyodide and initializing it
  */
 
+// Single-archive build of the game made by build_web.py (loose files are used if it is missing)
+const BUNDLE_URL = 'bric_game.zip';
+
 // Main function to load and initialize the game
 async function initGame() {
     try {
+        // Startup milestones (ms since page navigation), logged once the game runs
+        const startupTimes = [];
+        const markStartup = (name) => startupTimes.push(`${name}: ${performance.now().toFixed(0)} ms`);
+        
+        // Start downloading the game bundle while Pyodide loads
+        const bundleRequest = fetch(BUNDLE_URL).catch(() => null);
+        
         // Get DOM elements
         const loadingOverlay = document.getElementById('loading-overlay');
         const loadingText = document.getElementById('loading-text');
@@ -17,84 +27,28 @@ async function initGame() {
         
         // Load Pyodide
         const pyodide = await loadPyodide();
+        markStartup('pyodide loaded');
         
         // Update loading message
         loadingText.textContent = 'Setting up environment...';
         
         // Install required packages
         await pyodide.loadPackagesFromImports('import pygame');
+        markStartup('pygame loaded');
         
         // Update loading message
         loadingText.textContent = 'Loading game files...';
-
-        // Define the Python game files to load
-        const gameFiles = [
-            'config.py',
-            'utils/helpers.py',
-            'components/game_object.py',
-            'components/paddle.py',
-            'components/ball.py', 
-            'components/brick.py',
-            'components/item.py',
-            'components/level.py',
-            'managers/collision.py',
-            'managers/sprite_manager.py',
-            'ui/text.py',
-            'game.py',
-            'main.py',
-            '__init__.py'
-        ];
-        
-        // Create necessary directories in the Pyodide file system
-        pyodide.runPython(`
-            import os
-            os.makedirs('src/components', exist_ok=True)
-            os.makedirs('src/managers', exist_ok=True)
-            os.makedirs('src/ui', exist_ok=True)
-            os.makedirs('src/utils', exist_ok=True)
-            os.makedirs('assets/images', exist_ok=True)
-        `);
-        
-        // Fetch and load all game files
-        for (const file of gameFiles) {
-            try {
-                const response = await fetch(`src/${file}`);
-                if (!response.ok) {
-                    console.warn(`Failed to load ${file}: ${response.status} ${response.statusText}`);
-                    continue;
-                }
-                const content = await response.text();
-                
-                // Create necessary directories for this file
-                const dir = `src/${file.substring(0, file.lastIndexOf('/'))}`; 
-                if (file.includes('/')) {
-                    pyodide.runPython(`os.makedirs('${dir}', exist_ok=True)`);
-                }
-                
-                // Write the file content to the Pyodide filesystem
-                pyodide.FS.writeFile(`src/${file}`, content);
-                console.log(`Loaded: ${file}`);
-            } catch (err) {
-                console.error(`Error loading ${file}:`, err);
-                // Continue with other files
-            }
-        }
         
-        // Load the web integration file
-        try {
-            const response = await fetch('web_integration.py');
-            if (response.ok) {
-                const content = await response.text();
-                pyodide.FS.writeFile('web_integration.py', content);
-                console.log('Loaded web integration module');
-            } else {
-                throw new Error('Failed to load web integration module');
-            }
-        } catch (err) {
-            console.error('Error loading web integration module:', err);
+        // Unpack the prebuilt bundle if there is one, otherwise fetch each file
+        const bundleResponse = await bundleRequest;
+        if (bundleResponse && bundleResponse.ok) {
+            pyodide.unpackArchive(await bundleResponse.arrayBuffer(), 'zip');
+            console.log('Loaded game bundle');
+        } else if (!await loadGameFiles(pyodide)) {
             showError('Failed to load game files. Please try again later.');
             return;
         }
+        markStartup('game files loaded');
         
         // Update loading message
         loadingText.textContent = 'Initializing game...';
@@ -104,11 +58,13 @@ async function initGame() {
             import web_integration
             web_integration.init_web()
         `);
+        markStartup('game started');
         
         // Hide loading overlay
         loadingOverlay.style.display = 'none';
         
         console.log('Game initialized successfully');
+        console.log('Page startup times:\n' + startupTimes.join('\n'));
         
     } catch (error) {
         console.error('Error initializing game:', error);
@@ -116,6 +72,103 @@ async function initGame() {
     }
 }
 
+// Fetch the game's source files one by one into the Pyodide file system
+// (used when no bundle has been built); returns false if the game can't run
+async function loadGameFiles(pyodide) {
+    // Define the Python game files to load
+    const gameFiles = [
+        'config.py',
+        'utils/asset_cache.py',
+        'utils/asset_pack.py',
+        'utils/helpers.py',
+        'utils/profiler.py',
+        'components/game_object.py',
+        'components/paddle.py',
+        'components/ball.py', 
+        'components/brick.py',
+        'components/brick_store.py',
+        'components/item.py',
+        'components/level.py',
+        'managers/collision.py',
+        'managers/spatial_grid.py',
+        'managers/batch_collision.py',
+        'managers/object_pool.py',
+        'managers/scheduler.py',
+        'managers/sprite_manager.py',
+        'managers/texture_atlas.py',
+        'ui/brick_layer.py',
+        'ui/text.py',
+        'simulation.py',
+        'replay.py',
+        'snapshot.py',
+        'game.py',
+        'main.py',
+        '__init__.py'
+    ];
+    
+    // Create necessary directories in the Pyodide file system
+    pyodide.runPython(`
+        import os
+        os.makedirs('src/components', exist_ok=True)
+        os.makedirs('src/managers', exist_ok=True)
+        os.makedirs('src/ui', exist_ok=True)
+        os.makedirs('src/utils', exist_ok=True)
+        os.makedirs('assets/images', exist_ok=True)
+    `);
+    
+    // Fetch and load all game files
+    for (const file of gameFiles) {
+        try {
+            const response = await fetch(`src/${file}`);
+            if (!response.ok) {
+                console.warn(`Failed to load ${file}: ${response.status} ${response.statusText}`);
+                continue;
+            }
+            const content = await response.text();
+            
+            // Create necessary directories for this file
+            const dir = `src/${file.substring(0, file.lastIndexOf('/'))}`; 
+            if (file.includes('/')) {
+                pyodide.runPython(`os.makedirs('${dir}', exist_ok=True)`);
+            }
+            
+            // Write the file content to the Pyodide filesystem
+            pyodide.FS.writeFile(`src/${file}`, content);
+            console.log(`Loaded: ${file}`);
+        } catch (err) {
+            console.error(`Error loading ${file}:`, err);
+            // Continue with other files
+        }
+    }
+    
+    // Load the web integration file
+    try {
+        const response = await fetch('web_integration.py');
+        if (response.ok) {
+            const content = await response.text();
+            pyodide.FS.writeFile('web_integration.py', content);
+            console.log('Loaded web integration module');
+        } else {
+            throw new Error('Failed to load web integration module');
+        }
+    } catch (err) {
+        console.error('Error loading web integration module:', err);
+        return false;
+    }
+    
+    // Load the asset pack, if one has been built (the game falls back to shapes without it)
+    try {
+        const response = await fetch('assets.pack');
+        if (response.ok) {
+            pyodide.FS.writeFile('assets.pack', new Uint8Array(await response.arrayBuffer()));
+            console.log('Loaded asset pack');
+        }
+    } catch (err) {
+        console.warn('No asset pack loaded:', err);
+    }
+    return true;
+}
+
 // Show error message
 function showError(message) {
     const loadingOverlay = document.getElementById('loading-overlay');
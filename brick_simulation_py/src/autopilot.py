@@ -0,0 +1,53 @@
+"""
+Autopilot - a simple automated paddle policy for headless games
+"""
+import random
+from .simulation import INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
+
+class Autopilot:
+    """
+    Autopilot plays a Simulation by following the ball that will reach the paddle first.
+    Each time a ball starts falling it picks a new random spot on the paddle to
+    catch it with, which varies the bounce angle so games don't loop forever.
+    It has its own RNG so the simulation's randomness is unaffected.
+    """
+    def __init__(self, seed=None, aim_spread=0.4):
+        self.rng = random.Random(seed)
+        self.aim_spread = aim_spread  # Catch offset range, as a fraction of paddle width
+        self._aim_offset = 0.0
+        self._target = None
+    
+    def get_inputs(self, simulation):
+        """Return the INPUT_* flags for the next step"""
+        if simulation.state == "start":
+            return INPUT_LAUNCH
+        if simulation.state != "playing":
+            return 0
+        
+        paddle = simulation.paddle
+        target = None
+        for ball in simulation.balls:
+            if not ball.is_launched:
+                return INPUT_LAUNCH
+            # Falling balls closest to the paddle come first
+            if ball.speed_y > 0 and (target is None or ball.y > target.y):
+                target = ball
+        if target is None:
+            if not simulation.balls:
+                return 0
+            target = simulation.balls[0]
+        
+        # Pick a new catch spot each time a ball starts falling towards the paddle
+        if target.speed_y <= 0:
+            self._target = None
+        elif target is not self._target:
+            self._target = target
+            self._aim_offset = self.rng.uniform(-self.aim_spread, self.aim_spread)
+        
+        aim_x = target.x - self._aim_offset * paddle.width
+        center_x = paddle.x + paddle.width / 2
+        if aim_x < center_x - paddle.speed / 2:
+            return INPUT_LEFT
+        if aim_x > center_x + paddle.speed / 2:
+            return INPUT_RIGHT
+        return 0
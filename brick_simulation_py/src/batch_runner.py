@@ -0,0 +1,216 @@
+"""
+Batch runner - plays many headless games across a process pool and
+collects difficulty statistics for each level pattern
+
+Usage: python -m src.batch_runner --runs 1000 --levels 1 2 3 4 5 --output summary.json
+"""
+import argparse
+import copy
+import json
+import multiprocessing
+import random
+import sys
+import time
+import types
+
+from . import config as default_config
+from .autopilot import Autopilot
+from .simulation import Simulation
+
+_worker_config = None  # Config used by the games in this worker process
+
+def make_config(item_probabilities=None):
+    """
+    Copy the game config, optionally overriding item drop probabilities
+    item_probabilities is {item name: probability}; unknown names are added
+    """
+    settings = {name: copy.deepcopy(value) for name, value in vars(default_config).items()
+                if name.isupper()}
+    for name, probability in (item_probabilities or {}).items():
+        for item_config in settings["ITEM_TYPES"]:
+            if item_config["name"] == name:
+                item_config["probability"] = probability
+                break
+        else:
+            settings["ITEM_TYPES"].append(
+                {"name": name, "color": settings["COLOR_WHITE"], "probability": probability})
+    return types.SimpleNamespace(**settings)
+
+def _init_worker(item_probabilities):
+    """Build the config once per worker process"""
+    global _worker_config
+    _worker_config = make_config(item_probabilities)
+
+def play_level(config, level_number, seed, max_seconds):
+    """
+    Play one level with the autopilot until it is cleared, the game is over
+    or max_seconds of game time have passed
+    Returns a dict with the result of the run
+    """
+    simulation = Simulation(config, seed=seed, start_level=level_number)
+    autopilot = Autopilot(seed)
+    max_steps = int(max_seconds * config.SIMULATION_HZ)
+    breakable_at_start = simulation.level.get_breakable_brick_count()
+    
+    lives = simulation.lives
+    ball_losses = 0
+    steps = 0
+    while steps < max_steps:
+        simulation.step_input(autopilot.get_inputs(simulation))
+        steps += 1
+        
+        if simulation.lives < lives:
+            ball_losses += lives - simulation.lives
+        lives = simulation.lives
+        
+        if simulation.state in ("level_cleared", "game_over"):
+            break
+    
+    seconds = steps / config.SIMULATION_HZ
+    bricks_destroyed = breakable_at_start - simulation.level.get_breakable_brick_count()
+    return {
+        "level": level_number,
+        "pattern": simulation.level.pattern_name,
+        "seed": seed,
+        "outcome": simulation.state if simulation.state in ("level_cleared", "game_over") else "timeout",
+        "seconds": seconds,
+        "ball_losses": ball_losses,
+        "bricks_destroyed": bricks_destroyed,
+        "bricks_per_minute": bricks_destroyed * 60.0 / seconds if seconds else 0.0,
+        "score": simulation.score,
+    }
+
+def _run_job(job):
+    """Pool task: play one (level, seed, max seconds) job with the worker's config"""
+    level_number, seed, max_seconds = job
+    return play_level(_worker_config, level_number, seed, max_seconds)
+
+def run_batch(levels, runs, processes=None, base_seed=0, max_seconds=300, item_probabilities=None):
+    """
+    Play runs games on each level, spread over a pool of processes
+    Every level is played with the same list of seeds so levels are compared fairly.
+    Returns the list of per-run results, ordered by level and seed
+    """
+    seed_rng = random.Random(base_seed)
+    seeds = [seed_rng.getrandbits(63) for _ in range(runs)]
+    jobs = [(level_number, seed, max_seconds) for level_number in levels for seed in seeds]
+    processes = processes or multiprocessing.cpu_count()
+    
+    if processes == 1:
+        _init_worker(item_probabilities)
+        results = [_run_job(job) for job in jobs]
+    else:
+        # Games vary a lot in length, so hand out small chunks to keep every worker busy
+        chunksize = max(1, len(jobs) // (processes * 16))
+        with multiprocessing.Pool(processes, _init_worker, (item_probabilities,)) as pool:
+            results = list(pool.imap_unordered(_run_job, jobs, chunksize))
+    
+    seed_order = {seed: index for index, seed in enumerate(seeds)}
+    results.sort(key=lambda result: (result["level"], seed_order[result["seed"]]))
+    return results
+
+def _distribution(values):
+    """Summary statistics for a list of numbers"""
+    if not values:
+        return None
+    values = sorted(values)
+    
+    def percentile(fraction):
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+    
+    return {
+        "mean": sum(values) / len(values),
+        "min": values[0],
+        "p10": percentile(0.1),
+        "p50": percentile(0.5),
+        "p90": percentile(0.9),
+        "max": values[-1],
+    }
+
+def _summarize_runs(results):
+    """Statistics for a group of runs"""
+    runs = len(results)
+    outcomes = [result["outcome"] for result in results]
+    return {
+        "runs": runs,
+        "clear_rate": outcomes.count("level_cleared") / runs,
+        "game_over_rate": outcomes.count("game_over") / runs,
+        "timeout_rate": outcomes.count("timeout") / runs,
+        "clear_seconds": _distribution(
+            [result["seconds"] for result in results if result["outcome"] == "level_cleared"]),
+        "ball_losses": _distribution([result["ball_losses"] for result in results]),
+        "bricks_per_minute": _distribution([result["bricks_per_minute"] for result in results]),
+        "score": _distribution([result["score"] for result in results]),
+    }
+
+def summarize(results):
+    """Group results by level and by pattern and compute statistics for each"""
+    by_level = {}
+    by_pattern = {}
+    for result in results:
+        by_level.setdefault(result["level"], []).append(result)
+        by_pattern.setdefault(result["pattern"], []).append(result)
+    
+    levels = {}
+    for level_number, level_results in sorted(by_level.items()):
+        levels[str(level_number)] = dict(pattern=level_results[0]["pattern"],
+                                         **_summarize_runs(level_results))
+    patterns = {pattern: _summarize_runs(pattern_results)
+                for pattern, pattern_results in by_pattern.items()}
+    return {"levels": levels, "patterns": patterns}
+
+def _parse_item_probability(text):
+    """Parse NAME=PROBABILITY"""
+    name, _, probability = text.partition("=")
+    try:
+        return name, float(probability)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=PROBABILITY, got {text!r}")
+
+def main(argv=None):
+    """Run a batch from the command line and write the summary file"""
+    parser = argparse.ArgumentParser(description="Play headless games and collect level statistics")
+    parser.add_argument("--runs", type=int, default=200, help="games per level")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3, 4, 5],
+                        help="level numbers to play (patterns repeat every 5 levels)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the per-run seeds")
+    parser.add_argument("--max-seconds", type=float, default=300,
+                        help="game time after which a run counts as a timeout")
+    parser.add_argument("--item-probability", type=_parse_item_probability, action="append",
+                        default=[], metavar="NAME=P", help="override an item drop probability")
+    parser.add_argument("--output", default="level_stats.json", help="summary file to write")
+    args = parser.parse_args(argv)
+    
+    item_probabilities = dict(args.item_probability)
+    start = time.perf_counter()
+    results = run_batch(args.levels, args.runs, args.processes, args.seed,
+                        args.max_seconds, item_probabilities)
+    elapsed = time.perf_counter() - start
+    
+    summary = {
+        "settings": {
+            "runs": args.runs,
+            "levels": args.levels,
+            "seed": args.seed,
+            "max_seconds": args.max_seconds,
+            "item_probabilities": item_probabilities,
+        },
+        **summarize(results),
+    }
+    with open(args.output, "w") as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    
+    print(f"Played {len(results)} games in {elapsed:.1f}s ({len(results) / elapsed:.1f} games/s)")
+    for level_number, stats in summary["levels"].items():
+        clear_seconds = f"{stats['clear_seconds']['p50']:6.1f}s" if stats["clear_seconds"] else "      -"
+        print(f"Level {level_number:>3} {stats['pattern']:<13} clear {stats['clear_rate']:6.1%}  "
+              f"median clear {clear_seconds}  "
+              f"ball losses {stats['ball_losses']['mean']:4.2f}  "
+              f"score {stats['score']['mean']:7.1f}")
+    print(f"Summary written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
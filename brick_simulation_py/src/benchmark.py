@@ -0,0 +1,371 @@
+"""
+Benchmark suite - measures collision, level building, rendering and full-frame throughput
+on the headless SDL dummy video driver
+
+Usage:
+    python -m src.benchmark --save results.json
+    python -m src.benchmark --baseline results.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Benchmarks never open a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from . import config
+from .autopilot import Autopilot
+from .components.ball import Ball
+from .components.brick import Brick
+from .components.item import Item
+from .components.level import Level
+from .game import Game
+from .managers.collision import CollisionManager
+from .managers.scheduler import Scheduler
+from .simulation import Simulation
+from .snapshot import SnapshotManager
+from .ui.text import TextRenderer
+
+BENCHMARKS = []  # [(name, kind, setup function), ...]
+
+def benchmark(name, kind="micro"):
+    """
+    Register a benchmark
+    The decorated function does the setup and returns the callable to time:
+    one call is one operation (micro) or one frame (scenario)
+    """
+    def register(setup):
+        BENCHMARKS.append((name, kind, setup))
+        return setup
+    return register
+
+def _measure(operation, min_seconds, repeats):
+    """Time operation repeatedly, returns the best operations per second of the repeats"""
+    # Find a batch size that takes a measurable amount of time
+    batch = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(batch):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds / 10 or batch >= 1 << 20:
+            break
+        batch *= 2
+    
+    best = 0.0
+    for _ in range(repeats):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            for _ in range(batch):
+                operation()
+            count += batch
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+        best = max(best, count / elapsed)
+    return best
+
+def _make_screen():
+    """Display surface on the dummy driver"""
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+def _solid_sprite(width, height, color):
+    """Stand-in sprite surface so sprite rendering paths can be measured without assets"""
+    sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    sprite.fill(color)
+    return sprite
+
+def _launched_ball(x, y, speed_x=4, speed_y=-5):
+    """Ball already in flight"""
+    ball = Ball(x, y, config.BALL_RADIUS, config.BALL_COLOR,
+                speed_x, speed_y, config.BALL_MAX_SPEED)
+    ball.is_launched = True
+    return ball
+
+def _add_pooled_ball(simulation, x, y, speed_x, speed_y):
+    """Put a ball from the simulation's pool in flight, the way multi-ball does"""
+    ball = simulation.create_ball(x, y)
+    ball.speed_x = speed_x
+    ball.speed_y = speed_y
+    ball.is_launched = True
+    simulation.balls.append(ball)
+
+# Micro benchmarks
+
+@benchmark("collision.move_ball")
+def bench_move_ball():
+    """One ball stepping through a full level of unbreakable bricks"""
+    def unbreakable_brick(x, y, width, height, color, brick_type, points):
+        return Brick(x, y, width, height, color, "unbreakable", 0)
+    
+    simulation = Simulation(config, seed=1)
+    level = Level(config, 1)
+    bricks = level.create_bricks(unbreakable_brick)
+    manager = CollisionManager(config)
+    ball = _launched_ball(config.SCREEN_WIDTH / 2, config.SCREEN_HEIGHT / 2)
+    paddle = simulation.paddle
+    
+    def operation():
+        _, _, _, lost = manager.move_ball(ball, paddle, bricks, config.SCREEN_WIDTH,
+                                          config.SCREEN_HEIGHT, level.brick_grid)
+        if lost:
+            ball.x, ball.y = config.SCREEN_WIDTH / 2, config.SCREEN_HEIGHT / 2
+            ball.speed_y = -abs(ball.speed_y)
+    return operation
+
+@benchmark("collision.grid_query")
+def bench_grid_query():
+    """Brick grid lookup around a ball inside the brick area"""
+    level = Level(config, 5)
+    level.create_bricks(Brick)
+    grid = level.brick_grid
+    y = config.BRICK_TOP_MARGIN + 2 * config.BRICK_HEIGHT
+    
+    def operation():
+        grid.query_circle(300.0, y, config.BALL_RADIUS)
+    return operation
+
+@benchmark("level.create_bricks")
+def bench_create_bricks():
+    """Build each of the five level patterns in turn"""
+    levels = [Level(config, level_number) for level_number in range(1, 6)]
+    index = [0]
+    
+    def operation():
+        levels[index[0] % 5].create_bricks(Brick)
+        index[0] += 1
+    return operation
+
+@benchmark("scheduler.schedule_advance")
+def bench_scheduler():
+    """Schedule a timer and advance game time by one tick"""
+    scheduler = Scheduler()
+    for delay in range(100):
+        scheduler.schedule(delay + 1, int)
+    
+    def operation():
+        scheduler.schedule(100, int)
+        scheduler.advance()
+    return operation
+
+@benchmark("snapshot.save")
+def bench_snapshot_save():
+    """Serialize a level 1 simulation"""
+    simulation = Simulation(config, seed=1)
+    manager = SnapshotManager()
+    
+    def operation():
+        manager.save(simulation)
+    return operation
+
+@benchmark("text.draw_score")
+def bench_draw_score():
+    """TextRenderer score line (the score changes every call, so it is re-rendered)"""
+    screen = _make_screen()
+    text_renderer = TextRenderer(config)
+    score = [0]
+    
+    def operation():
+        score[0] += 10
+        text_renderer.draw_score(screen, score[0])
+    return operation
+
+@benchmark("render.brick_shape")
+def bench_brick_shape():
+    """Brick drawn as a shape"""
+    screen = _make_screen()
+    brick = Brick(100, 100, config.BRICK_WIDTH, config.BRICK_HEIGHT,
+                  config.BRICK_COLORS["normal"], "normal", 10)
+    brick.sprite = None
+    return lambda: brick.render(screen)
+
+@benchmark("render.brick_sprite")
+def bench_brick_sprite():
+    """Brick drawn from a sprite (scaled once, then served from the cache)"""
+    screen = _make_screen()
+    brick = Brick(100, 100, config.BRICK_WIDTH, config.BRICK_HEIGHT,
+                  config.BRICK_COLORS["normal"], "normal", 10)
+    brick.sprite = _solid_sprite(64, 32, (200, 50, 50, 255))
+    return lambda: brick.render(screen)
+
+@benchmark("render.ball_sprite")
+def bench_ball_sprite():
+    """Ball drawn from a sprite"""
+    screen = _make_screen()
+    ball = _launched_ball(200, 200)
+    ball.sprite = _solid_sprite(32, 32, (255, 255, 255, 255))
+    return lambda: ball.render(screen)
+
+@benchmark("render.item_shape")
+def bench_item_shape():
+    """Item drawn as a shape with its symbol"""
+    screen = _make_screen()
+    item = Item(200, 200, config.ITEM_SIZE, "multi", config.COLOR_YELLOW, config.ITEM_SPEED)
+    item.sprite = None
+    return lambda: item.render(screen)
+
+# Scenario benchmarks (full frames: one simulation step plus rendering)
+
+def _frame_runner(simulation, autopilot, keep_up=None):
+    """Return a callable that plays and renders one frame"""
+    # Rendering goes through Game so the scenarios draw exactly what players see
+    game = Game(config)
+    game.simulation = simulation
+    game.profiler = None
+    
+    def frame():
+        if keep_up is not None:
+            keep_up()
+        simulation.step_input(autopilot.get_inputs(simulation))
+        if simulation.state == "game_over":
+            simulation.lives = config.STARTING_LIVES
+            simulation.state = "playing"
+            simulation._create_initial_ball()
+        game._render(1.0)
+    return frame
+
+def _playing_simulation(level_number=1):
+    """Simulation that is already playing with a launched ball"""
+    simulation = Simulation(config, seed=1, start_level=level_number)
+    simulation.launch()
+    simulation.launch()
+    return simulation
+
+@benchmark("scenario.fortress_level", "scenario")
+def bench_fortress_level():
+    """Full 8-row fortress level with one ball"""
+    simulation = _playing_simulation(Level.first_level_with_pattern("fortress"))
+    return _frame_runner(simulation, Autopilot(1))
+
+@benchmark("scenario.multi_ball_5", "scenario")
+def bench_multi_ball():
+    """Five balls in play on the first level"""
+    simulation = _playing_simulation()
+    
+    def keep_up():
+        while len(simulation.balls) < 5:
+            _add_pooled_ball(simulation, simulation.paddle.get_center_x(), simulation.paddle.y - 50,
+                             3 + len(simulation.balls), -5)
+    return _frame_runner(simulation, Autopilot(1), keep_up)
+
+@benchmark("scenario.falling_items_50", "scenario")
+def bench_falling_items():
+    """Fifty items falling at once"""
+    simulation = _playing_simulation()
+    item_types = [item_config["name"] for item_config in config.ITEM_TYPES]
+    
+    def keep_up():
+        count = len(simulation.items)
+        while count < 50:
+            # Drop items on the half of the screen away from the paddle so few are caught
+            half_width = config.SCREEN_WIDTH // 2
+            x = (count * 37) % (half_width - config.ITEM_SIZE)
+            if simulation.paddle.get_center_x() < half_width:
+                x += half_width
+            simulation.create_item(x, (count * 31) % 200, item_types[count % len(item_types)])
+            count += 1
+    return _frame_runner(simulation, Autopilot(1), keep_up)
+
+def bench_stress(ball_count):
+    """Stress scenario with ball_count balls in play"""
+    def setup():
+        simulation = _playing_simulation()
+        
+        def keep_up():
+            balls = simulation.balls
+            while len(balls) < ball_count:
+                index = len(balls)
+                _add_pooled_ball(simulation,
+                                 50 + (index * 37) % (config.SCREEN_WIDTH - 100),
+                                 config.SCREEN_HEIGHT - 150 - (index * 13) % 150,
+                                 2 + index % 5, -3 - index % 4)
+        return _frame_runner(simulation, Autopilot(1), keep_up)
+    return setup
+
+def run_benchmarks(name_filter=None, min_seconds=1.0, repeats=3, stress_balls=500):
+    """
+    Run the registered benchmarks whose name contains name_filter
+    Returns {name: {"kind": ..., "unit": ..., "per_second": ...}}
+    """
+    benchmarks = BENCHMARKS + [(f"scenario.stress_{stress_balls}_balls", "scenario",
+                                bench_stress(stress_balls))]
+    results = {}
+    for name, kind, setup in benchmarks:
+        if name_filter and name_filter not in name:
+            continue
+        operation = setup()
+        per_second = _measure(operation, min_seconds, repeats)
+        unit = "frames/s" if kind == "scenario" else "ops/s"
+        results[name] = {"kind": kind, "unit": unit, "per_second": per_second}
+        print(f"{name:<32} {per_second:>14,.1f} {unit}")
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Print each benchmark next to its baseline
+    Returns the names of benchmarks that got slower by more than threshold (a fraction)
+    """
+    regressions = []
+    print(f"\n{'benchmark':<32} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<32} {'-':>14} {result['per_second']:>14,.1f}      new")
+            continue
+        before = baseline[name]["per_second"]
+        change = result["per_second"] / before - 1.0 if before else 0.0
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  SLOWER"
+        elif change > threshold:
+            flag = "  faster"
+        print(f"{name:<32} {before:>14,.1f} {result['per_second']:>14,.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+def main(argv=None):
+    """Run the benchmarks from the command line"""
+    parser = argparse.ArgumentParser(description="Bric Game benchmarks")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=1.0,
+                        help="seconds to run each timing repeat")
+    parser.add_argument("--repeats", type=int, default=3, help="timing repeats (best is kept)")
+    parser.add_argument("--stress-balls", type=int, default=500,
+                        help="number of balls in the stress scenario")
+    parser.add_argument("--save", metavar="FILE", default=None, help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", default=None,
+                        help="compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="slowdown (fraction) reported as a regression")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(args.filter, args.min_time, args.repeats, args.stress_balls)
+    
+    if args.save:
+        with open(args.save, "w") as results_file:
+            json.dump({
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "machine": platform.machine(),
+                "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "results": results,
+            }, results_file, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,22 +25,35 @@ class Ball(GameObject):
         # Try to load ball sprite (falls back to shape if not found)
         self.sprite = load_image("ball/ball.png")
         
-    def update(self):
-        # Only move if the ball is launched
-        if self.is_launched:
-            # Update position based on speed
-            self.x += self.speed_x
-            self.y += self.speed_y
-    
-    def render(self, screen):
+    def reinitialize(self, x, y, speed_x, speed_y):
+        """Set the ball up again as if newly created (used by the object pool)"""
+        self.x = x
+        self.y = y
+        self.previous_x = x
+        self.previous_y = y
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+        self.initial_x = x
+        self.initial_y = y
+        self.initial_speed_x = speed_x
+        self.initial_speed_y = speed_y
+        self.is_launched = False
+        self.activate()
+        
+    def render(self, screen, alpha=1.0):
         """Render the ball using sprite or shape"""
+        x, y = self.get_render_position(alpha)
         if self.sprite:
-            # If we have a sprite, scale it to match ball dimensions and draw it
-            scaled_sprite = pygame.transform.scale(self.sprite, (self.radius * 2, self.radius * 2))
-            screen.blit(scaled_sprite, (self.x - self.radius, self.y - self.radius))
+            # If we have a sprite, draw it scaled to the ball dimensions
+            return screen.blit(self.get_scaled_sprite(), (x - self.radius, y - self.radius))
         else:
             # Otherwise, draw a colored circle
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+            return pygame.draw.circle(screen, self.color, (int(x), int(y)), self.radius)
+    
+    def get_sprite_position(self, alpha=1.0):
+        """Top-left corner of the sprite (the ball's position is its center)"""
+        x, y = self.get_render_position(alpha)
+        return x - self.radius, y - self.radius
     
     def reset(self, paddle_x=None, paddle_width=None):
         """Reset ball to initial state"""
@@ -60,10 +73,10 @@ class Ball(GameObject):
         if not self.is_launched:
             self.is_launched = True
     
-    def get_rect(self):
-        """Override get_rect to properly handle circle collision area"""
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, 
-                          self.radius * 2, self.radius * 2)
+    def _update_rect(self, rect):
+        """Override _update_rect to properly handle circle collision area"""
+        rect.update(self.x - self.radius, self.y - self.radius,
+                    self.radius * 2, self.radius * 2)
     
     def bounce_horizontal(self):
         """Bounce horizontally (reverse x speed)"""
@@ -16,6 +16,9 @@ class Brick(GameObject):
         self.points = points
         self.hits_required = self._get_hits_required()
         self.current_hits = 0
+        self.base_color = color  # Color before any damage
+        self.on_destroyed = None  # Called with the brick when a hit destroys it (see Level)
+        self.on_damaged = None  # Called with the brick when a hit damages it without destroying it
         # Try to load brick sprite based on type (falls back to shape if not found)
         self.sprite = load_image(f"bricks/{brick_type}.png")
         
@@ -46,6 +49,8 @@ class Brick(GameObject):
         # Check if brick is destroyed
         if self.current_hits >= self.hits_required:
             self.deactivate()
+            if self.on_destroyed is not None:
+                self.on_destroyed(self)
             return True, self.points
             
         # Update appearance for damaged brick
@@ -55,19 +60,39 @@ class Brick(GameObject):
             damaged_sprite = load_image(f"bricks/{self.brick_type}_damaged.png")
             if damaged_sprite:
                 self.sprite = damaged_sprite
+            if self.on_damaged is not None:
+                self.on_damaged(self)
         
         # Not destroyed yet, return no points
         return False, 0
         
-    def render(self, screen):
+    def restore_hits(self, current_hits, active):
+        """
+        Put the brick back into the state it had after current_hits hits
+        (used when restoring a snapshot)
+        """
+        was_damaged = self.current_hits > 0
+        self.current_hits = current_hits
+        self.active = active
+        
+        if self.brick_type == "strong" and (current_hits > 0) != was_damaged:
+            if current_hits > 0:
+                self.color = tuple(channel * 0.7 for channel in self.base_color)
+                damaged_sprite = load_image(f"bricks/{self.brick_type}_damaged.png")
+                if damaged_sprite:
+                    self.sprite = damaged_sprite
+            else:
+                self.color = self.base_color
+                self.sprite = load_image(f"bricks/{self.brick_type}.png")
+        
+    def render(self, screen, alpha=1.0):
         """Render the brick using sprite or shape"""
         if self.sprite:
-            # If we have a sprite, scale it to match brick dimensions and draw it
-            scaled_sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-            screen.blit(scaled_sprite, (self.x, self.y))
+            # If we have a sprite, draw it scaled to the brick dimensions
+            return screen.blit(self.get_scaled_sprite(), (self.x, self.y))
         else:
             # Otherwise, draw a colored rectangle
-            self.draw_shape(screen)
+            rect = self.draw_shape(screen)
             
             # For strong bricks, draw a visual indicator of remaining hits
             if self.brick_type == "strong" and self.current_hits > 0:
@@ -79,12 +104,14 @@ class Brick(GameObject):
                 pygame.draw.line(screen, crack_color, 
                                 (self.x + self.width - 10, self.y + 10), 
                                 (self.x + 10, self.y + self.height - 10), 2)
+            return rect
     
-    def should_drop_item(self, item_probability=0.2):
+    def should_drop_item(self, item_probability=0.2, rng=random):
         """
         Determine if this brick should drop an item when destroyed.
         Only normal and strong bricks have a chance to drop items.
+        rng is the random number source (the game session's seeded RNG)
         """
         if self.brick_type == "unbreakable":
             return False
-        return random.random() < item_probability
+        return rng.random() < item_probability
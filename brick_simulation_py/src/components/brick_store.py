@@ -0,0 +1,269 @@
+"""
+Brick store - array-backed storage for a level's bricks
+"""
+import random
+from array import array
+import pygame
+from ..utils.helpers import load_image, scale_sprite
+
+BRICK_TYPES = ("normal", "strong", "unbreakable")
+HITS_REQUIRED = (1, 2, 0)  # Per type code; 0 means the brick can't be broken
+STRONG = 1
+UNBREAKABLE = 2
+
+class BrickStore:
+    """
+    BrickStore keeps every brick of a level in parallel typed arrays
+    (position, size, type code, hits taken, points, active flag, color index)
+    instead of one Brick object per brick. Colors are kept once in a palette
+    and sprites once per brick type.
+    Code that works with Brick objects gets a BrickView per brick, a tiny
+    object that reads and writes the arrays, so the rest of the game works
+    the same with either storage (see BRICK_STORAGE in config).
+    """
+    def __init__(self):
+        self.x = array("d")
+        self.y = array("d")
+        self.width = array("d")
+        self.height = array("d")
+        self.type_code = array("B")
+        self.current_hits = array("H")
+        self.points = array("H")
+        self.active = array("B")
+        self.color_index = array("H")
+        self.palette = []  # [color, ...]
+        self._palette_index = {}  # {color: index in palette}
+        self.views = []  # One BrickView per brick
+        self.on_destroyed = None  # Called with the view when a hit destroys a brick
+        self.on_damaged = None  # Called with the view when a hit damages a brick without destroying it
+        self._sprites = {}  # {sprite name: Surface or None}
+    
+    def add(self, x, y, width, height, color, brick_type="normal", points=10):
+        """Add a brick; same arguments as Brick, so it can be passed as a brick class"""
+        color_index = self._palette_index.get(color)
+        if color_index is None:
+            color_index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = color_index
+        
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+        self.type_code.append(BRICK_TYPES.index(brick_type))
+        self.current_hits.append(0)
+        self.points.append(points)
+        self.active.append(1)
+        self.color_index.append(color_index)
+        
+        view = BrickView(self, len(self.views))
+        self.views.append(view)
+        return view
+    
+    def clear(self):
+        """Remove all bricks"""
+        for column in (self.x, self.y, self.width, self.height, self.type_code,
+                       self.current_hits, self.points, self.active, self.color_index):
+            del column[:]
+        self.views = []
+    
+    def get_sprite(self, name):
+        """Sprite for a brick type (loaded once per store), or None"""
+        if name not in self._sprites:
+            self._sprites[name] = load_image(f"bricks/{name}.png")
+        return self._sprites[name]
+    
+    def bounds(self):
+        """
+        (left, top, right, bottom) of every brick as a NumPy array of shape (N, 4)
+        Only available when NumPy is installed
+        """
+        import numpy as np
+        x = np.frombuffer(self.x, dtype=np.float64)
+        y = np.frombuffer(self.y, dtype=np.float64)
+        return np.stack([x, y,
+                         x + np.frombuffer(self.width, dtype=np.float64),
+                         y + np.frombuffer(self.height, dtype=np.float64)], axis=1)
+    
+    def __len__(self):
+        return len(self.views)
+
+class BrickView:
+    """
+    BrickView behaves like a Brick but keeps its state in a BrickStore.
+    It only holds the store and its index, so it costs a fraction of a Brick.
+    """
+    __slots__ = ("store", "index")
+    
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+    
+    @property
+    def x(self):
+        return self.store.x[self.index]
+    
+    @property
+    def y(self):
+        return self.store.y[self.index]
+    
+    @property
+    def width(self):
+        return self.store.width[self.index]
+    
+    @property
+    def height(self):
+        return self.store.height[self.index]
+    
+    @property
+    def brick_type(self):
+        return BRICK_TYPES[self.store.type_code[self.index]]
+    
+    @property
+    def points(self):
+        return self.store.points[self.index]
+    
+    @property
+    def current_hits(self):
+        return self.store.current_hits[self.index]
+    
+    @property
+    def hits_required(self):
+        hits_required = HITS_REQUIRED[self.store.type_code[self.index]]
+        return hits_required if hits_required else float('inf')
+    
+    @property
+    def active(self):
+        return bool(self.store.active[self.index])
+    
+    @active.setter
+    def active(self, value):
+        self.store.active[self.index] = 1 if value else 0
+    
+    @property
+    def base_color(self):
+        return self.store.palette[self.store.color_index[self.index]]
+    
+    @property
+    def color(self):
+        """Current color: strong bricks darken once they are damaged"""
+        color = self.base_color
+        if self.store.type_code[self.index] == STRONG and self.store.current_hits[self.index] > 0:
+            return (color[0] * 0.7, color[1] * 0.7, color[2] * 0.7)
+        return color
+    
+    @property
+    def sprite(self):
+        brick_type = self.brick_type
+        if brick_type == "strong" and self.current_hits > 0:
+            damaged_sprite = self.store.get_sprite("strong_damaged")
+            if damaged_sprite:
+                return damaged_sprite
+        return self.store.get_sprite(brick_type)
+    
+    @property
+    def on_destroyed(self):
+        return self.store.on_destroyed
+    
+    @on_destroyed.setter
+    def on_destroyed(self, callback):
+        # Bricks of a level share one listener
+        self.store.on_destroyed = callback
+    
+    @property
+    def on_damaged(self):
+        return self.store.on_damaged
+    
+    @on_damaged.setter
+    def on_damaged(self, callback):
+        self.store.on_damaged = callback
+    
+    def is_active(self):
+        """Check if this brick is still on the board"""
+        return self.store.active[self.index] == 1
+    
+    def activate(self):
+        self.store.active[self.index] = 1
+    
+    def deactivate(self):
+        self.store.active[self.index] = 0
+    
+    def get_rect(self):
+        """Return a pygame Rect for this brick"""
+        store = self.store
+        index = self.index
+        return pygame.Rect(store.x[index], store.y[index], store.width[index], store.height[index])
+    
+    def collides_with(self, other):
+        """Check if this brick collides with another object"""
+        return self.get_rect().colliderect(other.get_rect())
+    
+    def hit(self):
+        """
+        Process a hit on this brick
+        Returns (destroyed, points earned), like Brick.hit
+        """
+        store = self.store
+        index = self.index
+        hits_required = HITS_REQUIRED[store.type_code[index]]
+        if not hits_required:
+            return False, 0
+        
+        store.current_hits[index] += 1
+        if store.current_hits[index] >= hits_required:
+            store.active[index] = 0
+            if store.on_destroyed is not None:
+                store.on_destroyed(self)
+            return True, store.points[index]
+        if store.type_code[index] == STRONG and store.current_hits[index] == 1 and store.on_damaged is not None:
+            store.on_damaged(self)
+        return False, 0
+    
+    def restore_hits(self, current_hits, active):
+        """Put the brick back into the state it had after current_hits hits"""
+        self.store.current_hits[self.index] = current_hits
+        self.active = active
+    
+    def should_drop_item(self, item_probability=0.2, rng=random):
+        """Determine if this brick should drop an item when destroyed"""
+        if self.store.type_code[self.index] == UNBREAKABLE:
+            return False
+        return rng.random() < item_probability
+    
+    def draw_shape(self, screen, x=None, y=None):
+        """Draw the brick as a rectangle in its color; returns its Rect"""
+        if x is None:
+            x, y = self.x, self.y
+        return pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
+    
+    def get_blit(self, atlas=None, alpha=1.0):
+        """(source, position, area) for Surface.blits, like GameObject.get_blit"""
+        sprite = self.sprite
+        if not sprite:
+            return None
+        store = self.store
+        index = self.index
+        width, height = store.width[index], store.height[index]
+        position = (store.x[index], store.y[index])
+        area = atlas.find(sprite, width, height) if atlas is not None else None
+        if area is not None:
+            return (atlas.surface, position, area)
+        return (scale_sprite(sprite, width, height), position, None)
+    
+    def render(self, screen, alpha=1.0):
+        """Render the brick using sprite or shape"""
+        x, y, width, height = self.x, self.y, self.width, self.height
+        sprite = self.sprite
+        if sprite:
+            return screen.blit(scale_sprite(sprite, width, height), (x, y))
+        else:
+            rect = self.draw_shape(screen, x, y)
+            
+            # Cracks on damaged strong bricks, as drawn by Brick.render
+            if self.store.type_code[self.index] == STRONG and self.current_hits > 0:
+                crack_color = (255, 255, 255)
+                pygame.draw.line(screen, crack_color, (x + 10, y + 10),
+                                 (x + width - 10, y + height - 10), 2)
+                pygame.draw.line(screen, crack_color, (x + width - 10, y + 10),
+                                 (x + 10, y + height - 10), 2)
+            return rect
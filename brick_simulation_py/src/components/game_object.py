@@ -3,6 +3,7 @@ Base GameObject class that all game entities will inherit from
 """
 import pygame
 from abc import ABC, abstractmethod
+from ..utils.helpers import scale_sprite
 
 class GameObject(ABC):
     """
@@ -12,8 +13,16 @@ class GameObject(ABC):
     """
     def __init__(self, x, y, width, height, color):
         """Initialize the game object with position, size and color"""
+        # Bounding rect is kept and refreshed in place when position or size change
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self._rect_dirty = True
+        # Sprite scaled to the current size, dropped when the sprite or size changes
+        self._scaled_sprite = None
+        self._atlas_blit = None  # (atlas, area) the sprite is drawn from, see get_blit
         self.x = x
         self.y = y
+        self.previous_x = x  # Position at the previous simulation step
+        self.previous_y = y
         self.width = width
         self.height = height
         self.color = color
@@ -21,21 +30,114 @@ class GameObject(ABC):
         self.sprite_id = None
         self.active = True
         
+    @property
+    def x(self):
+        return self._x
+    
+    @x.setter
+    def x(self, value):
+        self._x = value
+        self._rect_dirty = True
+    
+    @property
+    def y(self):
+        return self._y
+    
+    @y.setter
+    def y(self, value):
+        self._y = value
+        self._rect_dirty = True
+    
+    @property
+    def width(self):
+        return self._width
+    
+    @width.setter
+    def width(self, value):
+        self._width = value
+        self._rect_dirty = True
+        self._scaled_sprite = None
+        self._atlas_blit = None
+    
+    @property
+    def sprite(self):
+        return self._sprite
+    
+    @sprite.setter
+    def sprite(self, value):
+        self._sprite = value
+        self._scaled_sprite = None
+        self._atlas_blit = None
+    
+    @property
+    def height(self):
+        return self._height
+    
+    @height.setter
+    def height(self, value):
+        self._height = value
+        self._rect_dirty = True
+        self._scaled_sprite = None
+        self._atlas_blit = None
+        
     def update(self):
         """Update method to be overridden by subclasses"""
         pass
         
     @abstractmethod
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         """
         All game objects must implement a render method
         This allows for easy replacement of rendering with sprites later
+        alpha is the interpolation factor between the previous and current step
+        Returns the Rect of the screen area that was drawn
         """
         pass
         
-    def draw_shape(self, screen):
-        """Default implementation draws a rectangle with the object's color"""
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    def draw_shape(self, screen, x=None, y=None):
+        """Default implementation draws a rectangle with the object's color; returns its Rect"""
+        if x is None:
+            x, y = self.x, self.y
+        return pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
+    
+    def get_scaled_sprite(self):
+        """The sprite scaled to the object's size (scaled once, then reused)"""
+        if self._scaled_sprite is None:
+            self._scaled_sprite = scale_sprite(self._sprite, self._width, self._height)
+        return self._scaled_sprite
+    
+    def get_sprite_position(self, alpha=1.0):
+        """Top-left corner the sprite is drawn at"""
+        return self.get_render_position(alpha)
+    
+    def get_blit(self, atlas=None, alpha=1.0):
+        """
+        (source, position, area) that draws this object's sprite, for batching
+        with Surface.blits; None if the object is drawn as a shape.
+        The sprite comes from the atlas when it has it at the object's size
+        """
+        if not self._sprite:
+            return None
+        position = self.get_sprite_position(alpha)
+        if atlas is not None:
+            cached = self._atlas_blit
+            if cached is None or cached[0] is not atlas:
+                cached = self._atlas_blit = (atlas, atlas.find(self._sprite, self._width, self._height))
+            if cached[1] is not None:
+                return (atlas.surface, position, cached[1])
+        return (self.get_scaled_sprite(), position, None)
+    
+    def save_position(self):
+        """Remember the current position before a simulation step"""
+        self.previous_x = self._x
+        self.previous_y = self._y
+    
+    def get_render_position(self, alpha=1.0):
+        """Get the position interpolated between the previous and current step"""
+        if alpha >= 1.0:
+            return self._x, self._y
+        return (self.previous_x + (self._x - self.previous_x) * alpha,
+                self.previous_y + (self._y - self.previous_y) * alpha)
     
     def set_sprite(self, sprite_id, sprite):
         """Set a sprite for this game object"""
@@ -43,8 +145,18 @@ class GameObject(ABC):
         self.sprite = sprite
     
     def get_rect(self):
-        """Return a pygame Rect representing this object"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """
+        Return a pygame Rect representing this object.
+        The rect is cached and shared, so callers must not modify it.
+        """
+        if self._rect_dirty:
+            self._update_rect(self._rect)
+            self._rect_dirty = False
+        return self._rect
+    
+    def _update_rect(self, rect):
+        """Refresh the cached rect in place from the current position and size"""
+        rect.update(self._x, self._y, self._width, self._height)
     
     def collides_with(self, other):
         """Check if this object collides with another object"""
@@ -1,9 +1,8 @@
 """
 Item component - power-ups that can be collected by the player
 """
-import pygame
 from .game_object import GameObject
-from ..utils.helpers import load_image
+from ..utils.helpers import load_image, render_text
 
 class Item(GameObject):
     """
@@ -19,6 +18,14 @@ class Item(GameObject):
         # Set symbol for fallback rendering
         self.symbol = self._get_symbol_for_type()
         
+    def reinitialize(self, x, y):
+        """Put the item back at the top of its fall (used by the object pool)"""
+        self.x = x
+        self.y = y
+        self.previous_x = x
+        self.previous_y = y
+        self.activate()
+        
     def _get_symbol_for_type(self):
         """Get a symbol to display inside the item based on its type"""
         symbols = {
@@ -36,34 +43,34 @@ class Item(GameObject):
         """Update item position (falling down)"""
         self.y += self.speed
         
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         """Render the item using sprite or shape"""
+        x, y = self.get_render_position(alpha)
         if self.sprite:
-            # If we have a sprite, scale it to match item dimensions and draw it
-            scaled_sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-            screen.blit(scaled_sprite, (self.x, self.y))
+            # If we have a sprite, draw it scaled to the item dimensions
+            return screen.blit(self.get_scaled_sprite(), (x, y))
         else:
             # Otherwise, draw a colored square with a symbol
-            self.draw_shape(screen)
+            rect = self.draw_shape(screen, x, y)
             
             # Add symbol text in the center
-            font = pygame.font.SysFont(None, int(self.width * 0.8))
-            text = font.render(self.symbol, True, (255, 255, 255))
-            text_rect = text.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+            text = render_text(self.symbol, int(self.width * 0.8))
+            text_rect = text.get_rect(center=(x + self.width // 2, y + self.height // 2))
             screen.blit(text, text_rect)
+            return rect
     
     def apply_effect(self, game):
         """Apply the item's effect to the game"""
         if self.item_type == "extend":
-            # Extend paddle
+            # Extend paddle, reset 10 sec after the last extend
             game.paddle.extend()
-            game.schedule_event(10000, game.paddle.reset_size)  # Reset after 10 sec
+            game.start_timed_effect("extend", 10000)
             
         elif self.item_type == "slow":
-            # Slow down ball(s)
-            for ball in game.balls:
-                ball.decrease_speed(0.7)
-            game.schedule_event(15000, lambda: [ball.increase_speed(1/0.7) for ball in game.balls])
+            # Slow down ball(s) for 15 sec; another pickup only extends the time
+            if game.start_timed_effect("slow", 15000):
+                for ball in game.balls:
+                    ball.decrease_speed(0.7)
             
         elif self.item_type == "multi":
             # Add 2 extra balls
@@ -84,10 +91,10 @@ class Item(GameObject):
             game.enable_laser_mode(10000)  # 10 seconds
             
         elif self.item_type == "fast":
-            # Speed up game pace
-            for ball in game.balls:
-                ball.increase_speed(1.3)
-            game.schedule_event(15000, lambda: [ball.decrease_speed(1/1.3) for ball in game.balls])
+            # Speed up game pace for 15 sec; another pickup only extends the time
+            if game.start_timed_effect("fast", 15000):
+                for ball in game.balls:
+                    ball.increase_speed(1.3)
             
         elif self.item_type == "warp":
             # Skip to next level
@@ -95,3 +102,17 @@ class Item(GameObject):
         
         # Deactivate the item after applying its effect
         self.deactivate()
+    
+    @staticmethod
+    def end_effect(game, item_type):
+        """Undo a timed item effect when it runs out"""
+        if item_type == "extend":
+            game.paddle.reset_size()
+            
+        elif item_type == "slow":
+            for ball in game.balls:
+                ball.increase_speed(1/0.7)
+                
+        elif item_type == "fast":
+            for ball in game.balls:
+                ball.decrease_speed(1/1.3)
@@ -3,35 +3,52 @@ Level component - manages brick layouts for different stages
 """
 import random
 from ..utils.helpers import calculate_brick_position
+from ..managers.spatial_grid import BrickGrid
+from .brick_store import BrickStore
 
 class Level:
     """
     Level class manages the brick layout and difficulty for each game stage
     """
-    def __init__(self, config, level_number=1):
+    # Brick patterns, used in turn as the level number goes up
+    PATTERNS = ("standard", "pyramid", "checkerboard", "mixed", "fortress")
+    
+    def __init__(self, config, level_number=1, rng=None):
         self.config = config
         self.level_number = level_number
+        self.rng = rng if rng is not None else random.Random()  # Source of layout randomness
         self.bricks = []
+        self.brick_grid = BrickGrid(config)
+        # With array storage the bricks live in a BrickStore and are BrickViews
+        self.brick_store = BrickStore() if config.BRICK_STORAGE == "arrays" else None
+        self.live_bricks = []  # Bricks still on the board, in no particular order
+        self.breakable_count = 0  # Live bricks that can still be destroyed
+        self._live_index = {}  # {brick: position in live_bricks}
+        # Bricks whose look changed since a renderer last checked; None while nobody listens
+        self.changed_bricks = None
+    
+    @property
+    def pattern_name(self):
+        """Name of the brick pattern this level uses"""
+        return self.PATTERNS[(self.level_number - 1) % len(self.PATTERNS)]
+    
+    @classmethod
+    def first_level_with_pattern(cls, pattern_name):
+        """Lowest level number that uses the given pattern"""
+        return cls.PATTERNS.index(pattern_name) + 1
     
     def create_bricks(self, brick_class):
         """
         Create bricks based on the level number
-        Returns a list of Brick objects
+        Returns a list of Brick objects (BrickViews with array storage)
         """
         self.bricks = []
+        brick_class = self.make_brick_class(brick_class)
         
-        # Choose a pattern based on level number
-        if self.level_number % 5 == 1:
-            self._create_standard_pattern(brick_class)
-        elif self.level_number % 5 == 2:
-            self._create_pyramid_pattern(brick_class)
-        elif self.level_number % 5 == 3:
-            self._create_checkerboard_pattern(brick_class)
-        elif self.level_number % 5 == 4:
-            self._create_mixed_pattern(brick_class)
-        else:  # level % 5 == 0
-            self._create_fortress_pattern(brick_class)
-            
+        # Build the pattern for this level number
+        getattr(self, f"_create_{self.pattern_name}_pattern")(brick_class)
+        
+        self._index_bricks()
         return self.bricks
     
     def _create_standard_pattern(self, brick_class):
@@ -104,7 +121,7 @@ class Level:
                 x, y = calculate_brick_position(row, col, self.config)
                 
                 # Add some strong bricks in higher levels
-                if self.level_number > 5 and random.random() < 0.2:
+                if self.level_number > 5 and self.rng.random() < 0.2:
                     brick_type = "strong"
                     color = self.config.BRICK_COLORS["strong"]
                     points = 20
@@ -146,7 +163,7 @@ class Level:
                     brick_type = "unbreakable"
                     color = self.config.BRICK_COLORS["unbreakable"]
                     points = 0
-                elif cell == "S" or (self.level_number > 8 and random.random() < 0.3):
+                elif cell == "S" or (self.level_number > 8 and self.rng.random() < 0.3):
                     brick_type = "strong"
                     color = self.config.BRICK_COLORS["strong"]
                     points = 20
@@ -187,7 +204,7 @@ class Level:
                     color = self.config.BRICK_COLORS["unbreakable"]
                     points = 0
                 # Random strong bricks inside
-                elif random.random() < 0.3:
+                elif self.rng.random() < 0.3:
                     brick_type = "strong"
                     color = self.config.BRICK_COLORS["strong"]
                     points = 20
@@ -201,10 +218,86 @@ class Level:
                                   color, brick_type, points)
                 self.bricks.append(brick)
     
+    def make_brick_class(self, brick_class):
+        """Return what creates this level's bricks: brick_class, or the brick store"""
+        if self.brick_store is None:
+            return brick_class
+        self.brick_store.clear()
+        return self.brick_store.add
+    
+    def set_bricks(self, bricks):
+        """
+        Use an existing list of bricks for this level (e.g. restored from a snapshot)
+        Returns the list of bricks
+        """
+        self.bricks = bricks
+        self._index_bricks()
+        return self.bricks
+    
+    def _index_bricks(self):
+        """
+        Rebuild the grid, the live brick list and the counters from self.bricks
+        and listen for bricks being destroyed or damaged so they stay up to date
+        """
+        self.brick_grid.clear()
+        self.live_bricks = []
+        self._live_index = {}
+        self.breakable_count = 0
+        
+        for brick in self.bricks:
+            brick.on_destroyed = self._on_brick_destroyed
+            brick.on_damaged = self._on_brick_damaged
+            if brick.is_active():
+                self._add_live_brick(brick)
+    
+    def _add_live_brick(self, brick):
+        """Put a brick on the board"""
+        self._live_index[brick] = len(self.live_bricks)
+        self.live_bricks.append(brick)
+        self.brick_grid.insert(brick)
+        if brick.brick_type != "unbreakable":
+            self.breakable_count += 1
+    
+    def _remove_live_brick(self, brick):
+        """Take a brick off the board (swap with the last live brick and pop)"""
+        index = self._live_index.pop(brick)
+        last = self.live_bricks.pop()
+        if last is not brick:
+            self.live_bricks[index] = last
+            self._live_index[last] = index
+        self.brick_grid.remove(brick)
+        if brick.brick_type != "unbreakable":
+            self.breakable_count -= 1
+    
+    def _on_brick_destroyed(self, brick):
+        """Called by Brick.hit when one of this level's bricks is destroyed"""
+        if brick in self._live_index:
+            self._remove_live_brick(brick)
+        if self.changed_bricks is not None:
+            self.changed_bricks.append(brick)
+    
+    def _on_brick_damaged(self, brick):
+        """Called by Brick.hit when one of this level's bricks is damaged but not destroyed"""
+        if self.changed_bricks is not None:
+            self.changed_bricks.append(brick)
+    
+    def set_brick_state(self, brick, current_hits, active):
+        """Restore a brick's hit count and active flag, keeping the counters in step"""
+        if brick.is_active() and not active:
+            self._remove_live_brick(brick)
+        elif active and not brick.is_active():
+            self._add_live_brick(brick)
+        brick.restore_hits(current_hits, active)
+        if self.changed_bricks is not None:
+            self.changed_bricks.append(brick)
+    
     def get_breakable_brick_count(self):
         """Count how many breakable bricks are in the level"""
-        return sum(1 for brick in self.bricks 
-                  if brick.brick_type != "unbreakable" and brick.is_active())
+        return self.breakable_count
+    
+    def get_live_brick_count(self):
+        """Count how many bricks (breakable or not) are still on the board"""
+        return len(self.live_bricks)
     
     def increase_difficulty(self):
         """Increase level difficulty by incrementing level number"""
@@ -1,7 +1,6 @@
 """
 Paddle component - controlled by the player to bounce the ball
 """
-import pygame
 from .game_object import GameObject
 from ..utils.helpers import clamp, load_image
 
@@ -17,28 +16,24 @@ class Paddle(GameObject):
         # Try to load paddle sprite (falls back to shape if not found)
         self.sprite = load_image("paddle/paddle.png")
         
-    def update(self):
-        # Get keyboard state
-        keys = pygame.key.get_pressed()
-        
+    def update(self, direction=0):
+        """Move the paddle; direction is -1 (left), 0 (still) or 1 (right)"""
         # Move paddle left/right
-        if keys[pygame.K_LEFT]:
-            self.x -= self.speed
-        if keys[pygame.K_RIGHT]:
-            self.x += self.speed
+        if direction:
+            self.x += direction * self.speed
             
         # Keep the paddle within screen bounds
         self.x = clamp(self.x, 0, self.screen_width - self.width)
     
-    def render(self, screen):
+    def render(self, screen, alpha=1.0):
         """Render the paddle using sprite or shape"""
+        x, y = self.get_render_position(alpha)
         if self.sprite:
-            # If we have a sprite, scale it to match paddle dimensions and draw it
-            scaled_sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
-            screen.blit(scaled_sprite, (self.x, self.y))
+            # If we have a sprite, draw it scaled to the paddle dimensions
+            return screen.blit(self.get_scaled_sprite(), (x, y))
         else:
             # Otherwise, draw a colored rectangle
-            self.draw_shape(screen)
+            return self.draw_shape(screen, x, y)
     
     def extend(self):
         """Extend paddle width (power-up effect)"""
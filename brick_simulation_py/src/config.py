@@ -7,7 +7,14 @@ Contains all game constants and settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Bric Game"
-FPS = 60
+FPS = 60  # Render frame rate cap
+SIMULATION_HZ = 60  # Fixed simulation steps per second
+MAX_SIMULATION_STEPS_PER_FRAME = 5  # Catch-up limit when rendering lags
+REWIND_SECONDS = 10  # Seconds of snapshots kept for rewinding with BACKSPACE (0 disables)
+PROFILER_FRAMES = 600  # Frames of per-phase timings kept by the profiler (0 disables)
+PROFILER_HITCH_MS = 25  # Frames slower than this count as hitches
+RENDER_MODE = "dirty"  # "dirty": bricks pre-rendered, only changed regions updated; "flip": full redraw
+ASSET_CACHE_MB = 64  # Memory limit of each shared image cache (decoded and scaled)
 
 # Colors (RGB)
 COLOR_BLACK = (0, 0, 0)
@@ -37,6 +44,9 @@ BALL_COLOR = COLOR_WHITE
 BALL_SPEED_X = 5
 BALL_SPEED_Y = -5
 BALL_MAX_SPEED = 12
+BALL_MAX_BOUNCES_PER_FRAME = 4  # Bounces resolved within a single frame
+BALL_POOL_SIZE = 6  # Balls allocated up front (multi-ball tops out at 6)
+BATCH_COLLISION_MIN_BALLS = 256  # Use the NumPy batch collision path from this many balls
 
 # Brick settings
 BRICK_WIDTH = 75
@@ -45,6 +55,7 @@ BRICK_MARGIN = 5  # Space between bricks
 BRICK_ROWS = 5
 BRICK_COLS = 10
 BRICK_TOP_MARGIN = 100  # Distance from top of screen
+BRICK_STORAGE = "objects"  # "objects" (a Brick per brick) or "arrays" (BrickStore columns)
 
 # Brick colors by type
 BRICK_COLORS = {
@@ -60,6 +71,7 @@ LEVEL_COUNT = 5
 # Item settings
 ITEM_SIZE = 20
 ITEM_SPEED = 3
+ITEM_POOL_SIZE = 3  # Items of each type allocated up front
 ITEM_TYPES = [
     {"name": "extend", "color": COLOR_GREEN, "probability": 0.1},
     {"name": "slow", "color": COLOR_BLUE, "probability": 0.1},
@@ -73,8 +85,9 @@ FONT_SIZE_MEDIUM = 30
 FONT_SIZE_LARGE = 50
 TEXT_COLOR = COLOR_WHITE
 
-# Asset paths (for future use)
+# Asset paths
 ASSET_DIR = "assets/"
+ASSET_PACK = "assets.pack"  # Built by src/utils/asset_pack.py; loose files in ASSET_DIR are used without it
 IMAGE_DIR = ASSET_DIR + "images/"
 SOUND_DIR = ASSET_DIR + "sounds/"
 FONT_DIR = ASSET_DIR + "fonts/"
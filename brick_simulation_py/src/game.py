@@ -1,24 +1,32 @@
 """
-Main game class for Bric Game - handles game loop and core logic
+Main game class for Bric Game - pygame front end that handles the window, input and rendering
 """
 import pygame
-import time
-import random
-from .components.paddle import Paddle
-from .components.ball import Ball
-from .components.brick import Brick
-from .components.item import Item
-from .components.level import Level
-from .managers.collision import CollisionManager
+from .simulation import (Simulation, INPUT_LEFT, INPUT_RIGHT,
+                         INPUT_LAUNCH, INPUT_PAUSE, INPUT_RESTART)
+from .utils.profiler import FrameProfiler
+from .utils.helpers import draw_text
+from .utils.asset_cache import asset_cache, scaled_cache
+from .utils.asset_pack import open_pack
 from .managers.sprite_manager import SpriteManager
 from .ui.text import TextRenderer
+from .ui.brick_layer import BrickLayer
 
 class Game:
     """
-    Main game class that orchestrates all game components
+    Main game class that connects the simulation to pygame:
+    it owns the window and clock, turns keyboard input into simulation input,
+    steps the simulation at its fixed rate and renders the result
     """
-    def __init__(self, config):
-        """Initialize game with configuration"""
+    def __init__(self, config, seed=None, record_path=None, profile_path=None, defer_startup=False):
+        """
+        Initialize game with configuration
+        seed fixes the game's randomness; if record_path is given, the seed and
+        every step's input are saved there on exit so the game can be replayed.
+        If profile_path is given, frame timings are exported there on exit.
+        With defer_startup, work the first frame doesn't need (sprite scan and
+        atlas, rewind buffer, object pools) waits until that frame is shown
+        """
         self.config = config
         pygame.init()
         
@@ -29,128 +37,189 @@ class Game:
         # Create game clock
         self.clock = pygame.time.Clock()
         
+        # Size the shared image cache before anything loads sprites
+        asset_cache.resize(config.ASSET_CACHE_MB * 1024 * 1024)
+        scaled_cache.resize(config.ASSET_CACHE_MB * 1024 * 1024)
+        # Only the pack's index is read here; assets are decoded when loaded
+        open_pack(config.ASSET_PACK)
+        
         # Initialize managers
         self.sprite_manager = SpriteManager()
-        self.collision_manager = CollisionManager(config)
         self.text_renderer = TextRenderer(config)
         
-        # Game state
-        self.state = "start"  # start, playing, paused, level_cleared, game_over
-        self.score = 0
-        self.lives = config.STARTING_LIVES
-        self.level_number = 1
-        self.scheduled_events = []  # [(time_to_execute, callback), ...]
-        
-        # Game objects
-        self.paddle = None
-        self.balls = []
-        self.bricks = []
-        self.items = []
-        self.level = None
-        
-        # Initialize game objects
-        self._init_game_objects()
+        # Game state lives in the simulation
+        self.simulation = Simulation(config, seed, reserve_pools=not defer_startup)
+        self.simulation.message_handler = self.text_renderer.add_timed_message
+        self.time_accumulator = 0.0  # Real time (ms) not yet simulated
+        self.pending_input = 0  # Key actions waiting for the next simulation step
+        
+        # Optional input recording for replays
+        self.record_path = record_path
+        self.recorder = None
+        if record_path:
+            from .replay import InputRecorder
+            self.recorder = InputRecorder(self.simulation.seed, config.SIMULATION_HZ)
+        
+        # Rewind buffer, created by finish_startup
+        self.rewind_buffer = None
+        
+        # Frame profiler (F3 shows the overlay)
+        self.profiler = None
+        self.profile_path = profile_path
+        self.show_profiler = False
+        self.profiler_lines = []
+        if config.PROFILER_FRAMES > 0:
+            self.profiler = FrameProfiler(config.PROFILER_FRAMES, config.PROFILER_HITCH_MS)
+            self.simulation.profiler = self.profiler
+        
+        # Sprite atlas, built by finish_startup (None when drawing shapes)
+        self.atlas = None
+        
+        # Dirty-rectangle rendering: bricks live on a pre-rendered layer and
+        # only the regions that changed are pushed to the display
+        self.brick_layer = BrickLayer(config, config.COLOR_BLACK) if config.RENDER_MODE == "dirty" else None
+        self.drawn_rects = []  # Screen areas covered by moving objects and the HUD last frame
+        self.dirty_rects = None  # Screen areas updated by the last frame; None means the whole screen
+        
+        self.startup_finished = False
+        if not defer_startup:
+            self.finish_startup()
+    
+    def finish_startup(self):
+        """
+        Do the startup work the first frame doesn't need: scan and load sprites,
+        pack the atlas, create the rewind buffer and fill the object pools.
+        Runs from __init__, or after the first frame when startup is deferred
+        """
+        if self.startup_finished:
+            return
+        self.startup_finished = True
+        config = self.config
         
         # Try to load sprites
         self.sprite_manager.load_sprites()
-    
-    def _init_game_objects(self):
-        """Initialize all game objects"""
-        # Create paddle
-        paddle_x = self.config.SCREEN_WIDTH // 2 - self.config.PADDLE_WIDTH // 2
-        paddle_y = self.config.SCREEN_HEIGHT - self.config.PADDLE_BOTTOM_MARGIN - self.config.PADDLE_HEIGHT
-        self.paddle = Paddle(
-            paddle_x, paddle_y, 
-            self.config.PADDLE_WIDTH, self.config.PADDLE_HEIGHT,
-            self.config.PADDLE_COLOR,
-            self.config.PADDLE_SPEED,
-            self.config.SCREEN_WIDTH
-        )
-        
-        # Create ball
-        self._create_initial_ball()
-        
-        # Create level and bricks
-        self.level = Level(self.config, self.level_number)
-        self.bricks = self.level.create_bricks(Brick)
-    
-    def _create_initial_ball(self):
-        """Create initial ball positioned on the paddle"""
-        # Clear any existing balls
-        self.balls.clear()
-        
-        # Create a new ball
-        ball_x = self.paddle.x + self.paddle.width // 2
-        ball_y = self.paddle.y - self.config.BALL_RADIUS
-        ball = Ball(
-            ball_x, ball_y,
-            self.config.BALL_RADIUS,
-            self.config.BALL_COLOR,
-            self.config.BALL_SPEED_X,
-            self.config.BALL_SPEED_Y,
-            self.config.BALL_MAX_SPEED
-        )
-        self.balls.append(ball)
-    
-    def create_ball(self, x, y):
-        """Create a new ball at the specified position (for multi-ball power-up)"""
-        ball = Ball(
-            x, y,
-            self.config.BALL_RADIUS,
-            self.config.BALL_COLOR,
-            self.config.BALL_SPEED_X,
-            self.config.BALL_SPEED_Y,
-            self.config.BALL_MAX_SPEED
-        )
-        return ball
-    
-    def create_item(self, x, y, item_type):
-        """Create a random item that falls from a destroyed brick"""
-        # Choose item color based on type
-        item_colors = {
-            "extend": self.config.COLOR_GREEN,
-            "slow": self.config.COLOR_BLUE,
-            "multi": self.config.COLOR_YELLOW,
-            "life": self.config.COLOR_RED,
-            "laser": self.config.COLOR_PURPLE,
-            "fast": self.config.COLOR_ORANGE,
-            "warp": self.config.COLOR_CYAN
-        }
-        color = item_colors.get(item_type, self.config.COLOR_WHITE)
-        
-        item = Item(x, y, self.config.ITEM_SIZE, item_type, color, self.config.ITEM_SPEED)
-        self.items.append(item)
+        self.atlas = self.sprite_manager.build_atlas(config)
+        if self.brick_layer is not None and self.atlas is not None:
+            self.brick_layer.atlas = self.atlas
+            self.brick_layer.level = None  # Redraw the bricks from the atlas
+        
+        # Rewind buffer (a recording must play straight through, so not while recording)
+        if config.REWIND_SECONDS > 0 and self.recorder is None:
+            from .snapshot import RewindBuffer
+            self.rewind_buffer = RewindBuffer(config.REWIND_SECONDS * config.SIMULATION_HZ)
+        
+        self.simulation.reserve_pools()
     
     def run(self):
         """Main game loop"""
         running = True
         
         while running:
-            # Process events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                
-                # Key press events
-                if event.type == pygame.KEYDOWN:
-                    self._handle_key_press(event.key)
-            
-            # Update game state
-            if self.state == "playing":
-                self._update()
-                
-            # Process scheduled events
-            self._process_scheduled_events()
-                
-            # Render game
-            self._render()
-            
-            # Cap the frame rate
-            self.clock.tick(self.config.FPS)
+            # Cap the frame rate and measure the time since the last frame
+            frame_ms = self.clock.tick(self.config.FPS)
+            running = self.run_frame(frame_ms, pygame.event.get())
+        
+        # Save the recording
+        if self.recorder is not None:
+            self.recorder.save(self.record_path, self.simulation.score)
+        
+        # Export frame timings
+        if self.profiler is not None and self.profile_path:
+            self.profiler.export(self.profile_path)
         
         # Clean up
         pygame.quit()
     
+    def run_frame(self, frame_ms, events, present=None):
+        """
+        Run one frame: handle events, advance the simulation by frame_ms and render.
+        Shared by the desktop loop and the web loop; present() is called after
+        rendering to show the frame somewhere else (the web build's canvas).
+        Returns False once a QUIT event was received
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame(frame_ms)
+        
+        # Process events
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            
+            # Key press events
+            if event.type == pygame.KEYDOWN:
+                self._handle_key_press(event.key)
+        if profiler is not None:
+            profiler.mark("events")
+        
+        # Run the simulation at its fixed rate
+        alpha = self.advance(frame_ms)
+        
+        # Render game, interpolating between the last two simulation steps
+        self._render(alpha)
+        
+        if present is not None:
+            present()
+            if profiler is not None:
+                profiler.mark("present")
+        if profiler is not None:
+            profiler.end_frame()
+        
+        # Deferred startup work runs once the first frame is on screen
+        if not self.startup_finished:
+            self.finish_startup()
+        return running
+    
+    def advance(self, frame_ms):
+        """
+        Advance the simulation by the real time that passed since the last frame.
+        The simulation steps at SIMULATION_HZ regardless of the frame rate; leftover
+        time carries over to the next frame. If rendering falls too far behind,
+        at most MAX_SIMULATION_STEPS_PER_FRAME steps run and the backlog is dropped.
+        Returns the interpolation factor (0.0 - 1.0) between the last two steps
+        """
+        step_ms = self.simulation.step_ms
+        self.time_accumulator += frame_ms
+        paddle_input = self._get_paddle_input()
+        
+        steps = 0
+        while self.time_accumulator >= step_ms:
+            if steps >= self.config.MAX_SIMULATION_STEPS_PER_FRAME:
+                # Too far behind: slow the game down instead of spiralling
+                self.time_accumulator = 0.0
+                break
+            
+            # Key actions are applied on the first step after they were pressed
+            inputs = paddle_input | self.pending_input
+            self.pending_input = 0
+            
+            if self.recorder is not None:
+                self.recorder.record(inputs)
+            self.simulation.step_input(inputs)
+            if self.rewind_buffer is not None and self.simulation.state == "playing":
+                self.rewind_buffer.record(self.simulation)
+            
+            self.time_accumulator -= step_ms
+            steps += 1
+        
+        # Update UI
+        self.text_renderer.update_timed_messages()
+        if self.profiler is not None:
+            self.profiler.skip()
+        
+        return self.time_accumulator / step_ms
+    
+    def _get_paddle_input(self):
+        """Read the arrow keys as paddle input flags"""
+        keys = pygame.key.get_pressed()
+        inputs = 0
+        if keys[pygame.K_LEFT]:
+            inputs |= INPUT_LEFT
+        if keys[pygame.K_RIGHT]:
+            inputs |= INPUT_RIGHT
+        return inputs
+    
     def _handle_key_press(self, key):
         """Handle key press events"""
         if key == pygame.K_ESCAPE:
@@ -158,283 +227,180 @@ class Game:
             pygame.event.post(pygame.event.Event(pygame.QUIT))
             
         elif key == pygame.K_SPACE:
-            if self.state == "start":
-                # Start game
-                self.state = "playing"
-            elif self.state == "playing":
-                # Launch ball if not launched
-                for ball in self.balls:
-                    if not ball.is_launched:
-                        ball.launch()
+            # Start game / launch ball
+            self.pending_input |= INPUT_LAUNCH
                         
         elif key == pygame.K_p:
             # Toggle pause
-            if self.state == "playing":
-                self.state = "paused"
-            elif self.state == "paused":
-                self.state = "playing"
+            self.pending_input ^= INPUT_PAUSE
                 
         elif key == pygame.K_RETURN:
-            if self.state == "game_over":
-                # Restart game
-                self._reset_game()
-                self.state = "start"
-    
-    def _update(self):
-        """Update game state for a single frame"""
-        # Update paddle
-        self.paddle.update()
-        
-        # Update balls and check for collisions
-        self._update_balls()
-        
-        # Update items
-        self._update_items()
-        
-        # Check if level is cleared
-        if self._is_level_cleared():
-            self.state = "level_cleared"
-            # Schedule level transition
-            self.schedule_event(3000, self._start_next_level)
-            
-        # Update UI
-        self.text_renderer.update_timed_messages()
-    
-    def _update_balls(self):
-        """Update all balls and handle ball-related logic"""
-        # Update all balls
-        balls_to_remove = []
-        
-        for ball in self.balls:
-            # If ball is not launched yet, position it on the paddle
-            if not ball.is_launched:
-                ball.x = self.paddle.x + self.paddle.width // 2
-                ball.y = self.paddle.y - ball.radius
-                continue
-                
-            # Update ball position
-            ball.update()
-            
-            # Check for wall collisions
-            wall_collision = self.collision_manager.check_ball_wall_collision(
-                ball, self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
-                
-            if wall_collision == "lost":
-                # Ball was lost
-                balls_to_remove.append(ball)
-                continue
-                
-            # Check for paddle collision
-            paddle_collision = self.collision_manager.check_ball_paddle_collision(
-                ball, self.paddle)
-                
-            # Check for brick collisions
-            hits, points, destroyed_brick = self.collision_manager.check_ball_brick_collision(
-                ball, self.bricks)
-                
-            # Add score from brick hits
-            self.score += points
-            
-            # If a brick was destroyed, potentially spawn an item
-            if destroyed_brick and destroyed_brick.should_drop_item():
-                # Choose a random item type based on probabilities
-                item_candidates = []
-                for item_config in self.config.ITEM_TYPES:
-                    if random.random() < item_config["probability"]:
-                        item_candidates.append(item_config["name"])
-                
-                if item_candidates:
-                    item_type = random.choice(item_candidates)
-                    item_x = destroyed_brick.x + destroyed_brick.width // 2 - self.config.ITEM_SIZE // 2
-                    item_y = destroyed_brick.y
-                    self.create_item(item_x, item_y, item_type)
-        
-        # Remove lost balls
-        for ball in balls_to_remove:
-            self.balls.remove(ball)
+            # Restart game after game over
+            self.pending_input |= INPUT_RESTART
             
-        # If all balls are lost, lose a life
-        if not self.balls and self.state == "playing":
-            self.lives -= 1
+        elif key == pygame.K_BACKSPACE and self.rewind_buffer is not None:
+            # Rewind one second of game time
+            self.rewind_buffer.rewind(self.simulation, self.config.SIMULATION_HZ)
             
-            if self.lives <= 0:
-                # Game over
-                self.state = "game_over"
-            else:
-                # Reset with a new ball
-                self._create_initial_ball()
-                # Show message
-                self.text_renderer.add_timed_message(
-                    "Ball lost! Press SPACE to launch", 
-                    self.config.FONT_SIZE_MEDIUM, 2000)
+        elif key == pygame.K_F3 and self.profiler is not None:
+            # Toggle the frame profiler overlay
+            self.show_profiler = not self.show_profiler
     
-    def _update_items(self):
-        """Update all items and handle item-related logic"""
-        # Update all items
-        items_to_remove = []
-        
-        for item in self.items:
-            item.update()
-            
-            # Check if item is off the bottom of the screen
-            if item.y > self.config.SCREEN_HEIGHT:
-                items_to_remove.append(item)
-                continue
-                
-            # Check for collision with paddle
-            if self.collision_manager.check_item_paddle_collision([item], self.paddle):
-                # Apply item effect
-                item.apply_effect(self)
-                items_to_remove.append(item)
-                
-                # Show message about item effect
-                message = f"Power-up: {item.item_type.upper()}"
-                self.text_renderer.add_timed_message(
-                    message, self.config.FONT_SIZE_SMALL, 2000, 
-                    y=50, color=item.color)
-        
-        # Remove used or lost items
-        for item in items_to_remove:
-            if item in self.items:  # Defensive check
-                self.items.remove(item)
-    
-    def _is_level_cleared(self):
-        """Check if all breakable bricks are destroyed"""
-        return self.level.get_breakable_brick_count() == 0
-    
-    def _start_next_level(self):
-        """Start the next level"""
-        self.level_number += 1
-        
-        # Create a new level
-        self.level = Level(self.config, self.level_number)
-        self.bricks = self.level.create_bricks(Brick)
-        
-        # Reset paddle and create a new ball
-        self.paddle.reset_size()
-        self._create_initial_ball()
-        
-        # Clear items
-        self.items.clear()
-        
-        # Update game state
-        self.state = "playing"
-        
-        # Display level message
-        self.text_renderer.add_timed_message(
-            f"Level {self.level_number}", 
-            self.config.FONT_SIZE_LARGE, 2000)
-    
-    def _render(self):
-        """Render game to the screen"""
-        # Clear the screen
-        self.screen.fill(self.config.COLOR_BLACK)
+    def _render(self, alpha=1.0):
+        """
+        Render game to the screen
+        alpha is how far (0.0 - 1.0) we are between the last two simulation steps
+        """
+        brick_layer = self.brick_layer
+        if brick_layer is not None and self.simulation.state == "playing" and not self.show_profiler:
+            self._render_dirty(alpha)
+            return
+        
+        # Clear the screen (with the bricks already on it when there is a brick layer)
+        if brick_layer is not None:
+            brick_layer.sync(self.simulation.level)
+            self.screen.blit(brick_layer.surface, (0, 0))
+        else:
+            self.screen.fill(self.config.COLOR_BLACK)
+        
+        profiler = self.profiler
         
         # Draw game objects
-        self._draw_game_objects()
+        self._draw_game_objects(alpha, draw_bricks=brick_layer is None)
+        if profiler is not None:
+            profiler.mark("draw_objects")
         
         # Draw UI based on game state
         self._draw_ui()
+        if profiler is not None:
+            profiler.mark("draw_ui")
+            if self.show_profiler:
+                self._draw_profiler()
+                profiler.skip()
         
         # Update display
         pygame.display.flip()
+        self.drawn_rects = []
+        self.dirty_rects = None
+        if profiler is not None:
+            profiler.mark("flip")
     
-    def _draw_game_objects(self):
-        """Draw all game objects"""
-        # Draw paddle
-        self.paddle.render(self.screen)
-        
-        # Draw balls
-        for ball in self.balls:
-            ball.render(self.screen)
-        
-        # Draw bricks
-        for brick in self.bricks:
-            if brick.is_active():
-                brick.render(self.screen)
-        
-        # Draw items
-        for item in self.items:
-            item.render(self.screen)
+    def _render_dirty(self, alpha=1.0):
+        """
+        Render a playing frame by updating only what changed: the areas drawn
+        last frame are erased from the brick layer, bricks that changed are
+        copied from it, and moving objects and the HUD are drawn on top
+        """
+        screen = self.screen
+        layer = self.brick_layer.surface
+        profiler = self.profiler
+        
+        # After a full-screen frame the whole screen is stale
+        changed = self.brick_layer.sync(self.simulation.level)
+        if self.dirty_rects is None:
+            changed = [screen.get_rect()]
+        
+        erased = self.drawn_rects + changed
+        for rect in erased:
+            screen.blit(layer, rect, rect)
+        
+        drawn = self._draw_game_objects(alpha, draw_bricks=False)
+        if profiler is not None:
+            profiler.mark("draw_objects")
+        
+        drawn.extend(self._draw_hud())
+        if profiler is not None:
+            profiler.mark("draw_ui")
+        
+        erased.extend(drawn)
+        pygame.display.update(erased)
+        self.drawn_rects = drawn
+        self.dirty_rects = erased
+        if profiler is not None:
+            profiler.mark("flip")
+    
+    def _draw_game_objects(self, alpha=1.0, draw_bricks=True):
+        """
+        Draw all game objects; returns the Rects drawn for the moving ones
+        Objects with sprites are collected and drawn in one Surface.blits batch
+        (bricks first, so moving objects stay on top); shapes are drawn directly
+        """
+        simulation = self.simulation
+        screen = self.screen
+        atlas = self.atlas
+        rects = []
+        blits = []
+        
+        # Bricks still on the board (unless they are on the brick layer)
+        if draw_bricks:
+            for brick in simulation.level.live_bricks:
+                blit = brick.get_blit(atlas)
+                if blit is None:
+                    brick.render(screen)
+                else:
+                    blits.append(blit)
+        brick_blits = len(blits)
+        
+        # Paddle, balls and items
+        self._collect_blits(simulation.paddle, atlas, alpha, blits, rects)
+        for ball in simulation.balls:
+            self._collect_blits(ball, atlas, alpha, blits, rects)
+        for item in simulation.items:
+            self._collect_blits(item, atlas, alpha, blits, rects)
+        
+        if blits:
+            rects.extend(screen.blits(blits)[brick_blits:])
+        return rects
+    
+    def _collect_blits(self, game_object, atlas, alpha, blits, rects):
+        """Queue a sprite object's blit, or draw a shape object right away"""
+        blit = game_object.get_blit(atlas, alpha)
+        if blit is None:
+            rects.append(game_object.render(self.screen, alpha))
+        else:
+            blits.append(blit)
+    
+    def _draw_hud(self):
+        """Draw score, lives, level and timed messages; returns the Rects drawn"""
+        simulation = self.simulation
+        text_renderer = self.text_renderer
+        rects = [text_renderer.draw_score(self.screen, simulation.score),
+                 text_renderer.draw_lives(self.screen, simulation.lives),
+                 text_renderer.draw_level(self.screen, simulation.level_number)]
+        rects.extend(text_renderer.draw_timed_messages(self.screen))
+        return rects
     
     def _draw_ui(self):
         """Draw UI elements based on game state"""
-        if self.state == "start":
+        simulation = self.simulation
+        
+        if simulation.state == "start":
             # Draw start screen
             self.text_renderer.draw_start_screen(self.screen)
             
-        elif self.state == "playing" or self.state == "paused":
-            # Draw score, lives, level
-            self.text_renderer.draw_score(self.screen, self.score)
-            self.text_renderer.draw_lives(self.screen, self.lives)
-            self.text_renderer.draw_level(self.screen, self.level_number)
-            
-            # Draw any timed messages
-            self.text_renderer.draw_timed_messages(self.screen)
+        elif simulation.state == "playing" or simulation.state == "paused":
+            # Draw score, lives, level and any timed messages
+            self._draw_hud()
             
             # Draw pause overlay if paused
-            if self.state == "paused":
+            if simulation.state == "paused":
                 self.text_renderer.draw_pause_screen(self.screen)
                 
-        elif self.state == "level_cleared":
+        elif simulation.state == "level_cleared":
             # Draw level cleared screen
             self.text_renderer.draw_level_cleared(
-                self.screen, self.level_number, self.score)
+                self.screen, simulation.level_number, simulation.score)
                 
-        elif self.state == "game_over":
+        elif simulation.state == "game_over":
             # Draw game over screen
-            self.text_renderer.draw_game_over(self.screen, self.score)
-    
-    def _reset_game(self):
-        """Reset game to initial state"""
-        self.score = 0
-        self.lives = self.config.STARTING_LIVES
-        self.level_number = 1
-        
-        # Reset game objects
-        self._init_game_objects()
-        
-        # Clear items
-        self.items.clear()
-        
-        # Clear scheduled events
-        self.scheduled_events.clear()
-    
-    def schedule_event(self, delay_ms, callback):
-        """Schedule an event to occur after the specified delay"""
-        execution_time = pygame.time.get_ticks() + delay_ms
-        self.scheduled_events.append((execution_time, callback))
-    
-    def _process_scheduled_events(self):
-        """Process any scheduled events that are due"""
-        current_time = pygame.time.get_ticks()
-        events_to_execute = []
-        events_to_keep = []
-        
-        # Split events into those ready to execute and those to keep
-        for event_time, callback in self.scheduled_events:
-            if current_time >= event_time:
-                events_to_execute.append(callback)
-            else:
-                events_to_keep.append((event_time, callback))
-        
-        # Update scheduled events
-        self.scheduled_events = events_to_keep
-        
-        # Execute ready events
-        for callback in events_to_execute:
-            callback()
-    
-    def next_level(self):
-        """Advance to the next level (called from item effect)"""
-        self.state = "level_cleared"
-        self.schedule_event(1000, self._start_next_level)
+            self.text_renderer.draw_game_over(self.screen, simulation.score)
     
-    def enable_laser_mode(self, duration_ms):
-        """Enable laser mode for the paddle (called from item effect)"""
-        # This is a placeholder for a potential feature
-        # Implementation would involve adding laser functionality to the paddle
-        self.text_renderer.add_timed_message(
-            "Laser mode activated!", 
-            self.config.FONT_SIZE_SMALL, 2000, 
-            y=80, color=self.config.COLOR_PURPLE)
+    def _draw_profiler(self):
+        """Draw the frame profiler overlay"""
+        # Percentiles only need refreshing a couple of times per second
+        if not self.profiler_lines or self.profiler.frame_count % 30 == 0:
+            self.profiler_lines = self.profiler.overlay_lines()
+        
+        for i, line in enumerate(self.profiler_lines):
+            draw_text(self.screen, line, 18, 10, 50 + i * 16,
+                      self.config.COLOR_YELLOW, align="left")
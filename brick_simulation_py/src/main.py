@@ -1,6 +1,7 @@
 """
 Main entry point for the Bric Game
 """
+import argparse
 import pygame
 import sys
 import os
@@ -9,11 +10,20 @@ from .game import Game
 
 def main():
     """Main function to run the game"""
+    parser = argparse.ArgumentParser(description="Bric Game")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the game's randomness")
+    parser.add_argument("--record", metavar="FILE", default=None,
+                        help="record inputs to FILE for replay (python -m src.replay FILE)")
+    parser.add_argument("--profile", metavar="FILE", default=None,
+                        help="export per-phase frame timings to FILE on exit")
+    args = parser.parse_args()
+    
     # Set up pygame
     pygame.init()
     
     # Initialize and run the game
-    game = Game(config)
+    game = Game(config, seed=args.seed, record_path=args.record, profile_path=args.profile)
     game.run()
     
     # Clean up
@@ -0,0 +1,332 @@
+"""
+Batch collision manager - vectorized ball movement and collision for many balls
+"""
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False  # Batch mode is disabled, per-ball collision is used
+
+
+class BatchCollisionManager:
+    """
+    BatchCollisionManager moves all launched balls at once using NumPy.
+    Ball positions/velocities and brick bounds are kept in arrays and all balls
+    are swept against the live bricks, the paddle and the walls in one pass.
+    Bricks laid out on the brick grid are looked up through a dense cell table,
+    so each ball is only tested against the bricks in the cells it sweeps over.
+    Each ball still gets up to BALL_MAX_BOUNCES_PER_FRAME bounces per frame.
+    Brick hits are reported through Brick.hit so scoring works as usual.
+    """
+    # Upper bound on ball x brick pairs tested at once (keeps memory bounded)
+    MAX_PAIRS_PER_CHUNK = 1 << 18
+    
+    def __init__(self, config):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for batch collision")
+        self.config = config
+        self.bricks = None
+        self.brick_bounds = np.empty((0, 4))  # left, top, right, bottom
+        self.brick_active = np.empty(0, dtype=bool)
+        self.cell_table = None  # [row, col] -> brick index, or -1 for an empty cell
+        self.cell_width = config.BRICK_WIDTH + config.BRICK_MARGIN
+        self.cell_height = config.BRICK_HEIGHT + config.BRICK_MARGIN
+        self.origin_x = config.BRICK_MARGIN
+        self.origin_y = config.BRICK_TOP_MARGIN
+        self.needs_sync = True
+    
+    def set_bricks(self, bricks):
+        """Build the brick arrays for a new brick list"""
+        self.bricks = bricks
+        store = getattr(bricks[0], "store", None) if bricks else None
+        if store is not None and store.views == bricks:
+            # Array storage: read the brick columns directly
+            self.brick_bounds = store.bounds()
+            self.brick_active = np.frombuffer(store.active, dtype=np.uint8).astype(bool)
+        else:
+            self.brick_bounds = np.array(
+                [(brick.x, brick.y, brick.x + brick.width, brick.y + brick.height)
+                 for brick in bricks], dtype=np.float64).reshape(-1, 4)
+            self.brick_active = np.fromiter(
+                (brick.is_active() for brick in bricks), dtype=bool, count=len(bricks))
+        self.cell_table = self._build_cell_table()
+        self.needs_sync = False
+    
+    def _build_cell_table(self):
+        """
+        Map grid cells to brick indices.
+        Returns None if the bricks don't sit one per cell on the brick grid,
+        in which case every ball is tested against every live brick.
+        """
+        if not len(self.brick_bounds):
+            return None
+        
+        cols = (self.brick_bounds[:, 0] - self.origin_x) // self.cell_width
+        rows = (self.brick_bounds[:, 1] - self.origin_y) // self.cell_height
+        last_cols = (self.brick_bounds[:, 2] - 1 - self.origin_x) // self.cell_width
+        last_rows = (self.brick_bounds[:, 3] - 1 - self.origin_y) // self.cell_height
+        if (cols.min() < 0 or rows.min() < 0 or
+                (last_cols != cols).any() or (last_rows != rows).any()):
+            return None
+        
+        cols = cols.astype(np.intp)
+        rows = rows.astype(np.intp)
+        table = np.full((rows.max() + 1, cols.max() + 1), -1, dtype=np.intp)
+        table[rows, cols] = np.arange(len(cols))
+        if (table >= 0).sum() != len(cols):
+            return None  # Several bricks share a cell
+        return table
+    
+    def invalidate(self):
+        """Mark the brick arrays as stale (bricks changed outside of this manager)"""
+        self.needs_sync = True
+    
+    def move_balls(self, balls, paddle, bricks, screen_width, screen_height):
+        """
+        Move all given (launched) balls for one frame, resolving collisions.
+        Returns tuple (hits, points, destroyed_bricks, lost_balls)
+        """
+        if bricks is not self.bricks or self.needs_sync:
+            self.set_bricks(bricks)
+        
+        count = len(balls)
+        state = np.array([(ball.x, ball.y, ball.speed_x, ball.speed_y, ball.radius)
+                          for ball in balls], dtype=np.float64).reshape(-1, 5)
+        position = state[:, 0:2]
+        velocity = state[:, 2:4]
+        radius = state[:, 4]
+        
+        remaining = np.ones(count)
+        lost = np.zeros(count, dtype=bool)
+        hits = 0
+        points = 0
+        destroyed_bricks = []
+        
+        paddle_bounds = np.array([[paddle.x, paddle.y,
+                                   paddle.x + paddle.width, paddle.y + paddle.height]])
+        
+        for _ in range(self.config.BALL_MAX_BOUNCES_PER_FRAME):
+            moving = np.flatnonzero((remaining > 0) & ~lost)
+            if moving.size == 0:
+                break
+            
+            pos = position[moving]
+            move = velocity[moving] * remaining[moving, None]
+            rad = radius[moving]
+            
+            # Walls: 0 = none, 1 = wall, 2 = lost (bottom)
+            impact_time, normal, target = self._sweep_walls(
+                pos, move, rad, screen_width, screen_height)
+            
+            # Paddle
+            paddle_time, paddle_normal = self._sweep_rects(pos, move, rad, paddle_bounds[None])
+            paddle_time = paddle_time[:, 0]
+            closer = paddle_time < impact_time
+            impact_time = np.where(closer, paddle_time, impact_time)
+            normal[closer] = paddle_normal[closer, 0]
+            target[closer] = 3
+            
+            # Bricks: earliest live brick per ball
+            brick_index = np.full(moving.size, -1)
+            for rows, candidates in self._brick_candidates(pos, move, rad):
+                if candidates.shape[1] == 0:
+                    continue
+                bounds = self.brick_bounds[candidates]
+                times, normals = self._sweep_rects(pos[rows], move[rows], rad[rows], bounds)
+                times[(candidates < 0) | ~self.brick_active[candidates]] = np.inf
+                first = times.argmin(axis=1)
+                first_time = times[np.arange(first.size), first]
+                closer = first_time < impact_time[rows]
+                
+                chunk_rows = np.arange(moving.size)[rows][closer]
+                impact_time[chunk_rows] = first_time[closer]
+                normal[chunk_rows] = normals[closer, first[closer]]
+                target[chunk_rows] = 4
+                brick_index[chunk_rows] = candidates[closer, first[closer]]
+            
+            # Report brick hits in ball order (only a handful per frame, so plain
+            # Python is fine). A brick is taken out of the arrays as soon as it is
+            # destroyed, so later balls pass through it as they do in move_ball;
+            # they keep their remaining movement without bouncing (target 5)
+            for row in np.flatnonzero(target == 4).tolist():
+                brick_idx = brick_index[row]
+                if not self.brick_active[brick_idx]:
+                    target[row] = 5
+                    continue
+                brick = self.bricks[brick_idx]
+                destroyed, brick_points = brick.hit()
+                hits += 1
+                points += brick_points
+                if destroyed:
+                    self.brick_active[brick_idx] = False
+                    destroyed_bricks.append(brick)
+            
+            # Advance balls to their impact point (or the end of their movement)
+            impact_time = np.minimum(impact_time, 1.0)
+            position[moving] = pos + move * impact_time[:, None]
+            
+            hit_something = target != 0
+            remaining[moving] = np.where(hit_something, remaining[moving] * (1.0 - impact_time), 0.0)
+            lost[moving[target == 2]] = True
+            
+            # Reflect velocity about the surface normal for walls and bricks
+            reflect = (target == 1) | (target == 4)
+            if reflect.any():
+                rows = moving[reflect]
+                n = normal[reflect]
+                dot = np.einsum("ij,ij->i", velocity[rows], n)
+                dot = np.minimum(dot, 0.0)
+                velocity[rows] -= 2 * dot[:, None] * n
+            
+            # Paddle bounces steer the ball based on where it landed
+            on_paddle = target == 3
+            if on_paddle.any():
+                self._bounce_off_paddle(paddle, position, velocity, moving[on_paddle],
+                                        normal[on_paddle])
+        
+        # Write the results back to the ball objects
+        for ball, (x, y, speed_x, speed_y, _) in zip(balls, state.tolist()):
+            ball.x = x
+            ball.y = y
+            ball.speed_x = speed_x
+            ball.speed_y = speed_y
+        
+        lost_balls = [balls[i] for i in np.flatnonzero(lost).tolist()]
+        return hits, points, destroyed_bricks, lost_balls
+    
+    def _brick_candidates(self, pos, move, rad):
+        """
+        Yield (ball rows, brick indices) pairs of candidate bricks per ball.
+        With a cell table only the bricks in the cells covered by each ball's
+        swept bounds are returned (-1 for empty cells); otherwise all live bricks
+        are returned, split into chunks of balls to keep memory bounded.
+        """
+        if self.cell_table is None:
+            live = np.flatnonzero(self.brick_active)
+            chunk = max(1, self.MAX_PAIRS_PER_CHUNK // max(1, live.size))
+            for start in range(0, pos.shape[0], chunk):
+                rows = slice(start, start + chunk)
+                count = min(chunk, pos.shape[0] - start)
+                yield rows, np.broadcast_to(live, (count, live.size))
+            return
+        
+        # Cell range covered by each ball's swept bounds
+        low = pos - rad[:, None] + np.minimum(move, 0.0)
+        high = pos + rad[:, None] + np.maximum(move, 0.0)
+        first_col = ((low[:, 0] - self.origin_x) // self.cell_width).astype(np.intp)
+        last_col = ((high[:, 0] - self.origin_x) // self.cell_width).astype(np.intp)
+        first_row = ((low[:, 1] - self.origin_y) // self.cell_height).astype(np.intp)
+        last_row = ((high[:, 1] - self.origin_y) // self.cell_height).astype(np.intp)
+        
+        # Every ball looks at the same number of cells (the widest sweep)
+        span_cols = int((last_col - first_col).max()) + 1
+        span_rows = int((last_row - first_row).max()) + 1
+        cols = first_col[:, None, None] + np.arange(span_cols)[None, None, :]
+        rows = first_row[:, None, None] + np.arange(span_rows)[None, :, None]
+        cols, rows = np.broadcast_arrays(cols, rows)
+        
+        table_rows, table_cols = self.cell_table.shape
+        inside = ((cols >= 0) & (cols < table_cols) & (rows >= 0) & (rows < table_rows) &
+                  (cols <= last_col[:, None, None]) & (rows <= last_row[:, None, None]))
+        candidates = np.full(cols.shape, -1, dtype=np.intp)
+        candidates[inside] = self.cell_table[rows[inside], cols[inside]]
+        yield slice(None), candidates.reshape(pos.shape[0], -1)
+    
+    def _sweep_walls(self, pos, move, rad, screen_width, screen_height):
+        """
+        Find the earliest wall impact for each ball.
+        Returns arrays (time, normal, target) where target is 0 (none), 1 (wall) or 2 (lost)
+        """
+        count = pos.shape[0]
+        time = np.full(count, np.inf)
+        normal = np.zeros((count, 2))
+        target = np.zeros(count, dtype=np.int8)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            left = np.where(move[:, 0] < 0, (rad - pos[:, 0]) / move[:, 0], np.inf)
+            right = np.where(move[:, 0] > 0, (screen_width - rad - pos[:, 0]) / move[:, 0], np.inf)
+            top = np.where(move[:, 1] < 0, (rad - pos[:, 1]) / move[:, 1], np.inf)
+            bottom = np.where(move[:, 1] > 0, (screen_height - rad - pos[:, 1]) / move[:, 1], np.inf)
+        
+        for wall_time, normal_x, normal_y, kind in ((left, 1.0, 0.0, 1), (right, -1.0, 0.0, 1),
+                                                    (top, 0.0, 1.0, 1), (bottom, 0.0, -1.0, 2)):
+            wall_time = np.maximum(wall_time, 0.0)
+            closer = (wall_time <= 1.0) & (wall_time <= time)
+            time[closer] = wall_time[closer]
+            normal[closer] = (normal_x, normal_y)
+            target[closer] = kind
+        
+        return time, normal, target
+    
+    def _sweep_rects(self, pos, move, rad, bounds):
+        """
+        Sweep each ball against rects (expanded by the ball radius).
+        bounds has shape (balls or 1, rects, 4) with left, top, right, bottom.
+        Returns arrays (time, normal) of shape (balls, rects) and (balls, rects, 2);
+        time is inf where the ball does not hit the rect this frame.
+        Corners are treated as square, which is close enough at batch scale.
+        """
+        x = pos[:, 0:1]
+        y = pos[:, 1:2]
+        move_x = move[:, 0:1]
+        move_y = move[:, 1:2]
+        r = rad[:, None]
+        
+        left = bounds[..., 0] - r
+        top = bounds[..., 1] - r
+        right = bounds[..., 2] + r
+        bottom = bounds[..., 3] + r
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            near_x = np.where(move_x > 0, left - x, right - x) / move_x
+            far_x = np.where(move_x > 0, right - x, left - x) / move_x
+            near_y = np.where(move_y > 0, top - y, bottom - y) / move_y
+            far_y = np.where(move_y > 0, bottom - y, top - y) / move_y
+        
+        # No movement on an axis: inside the slab for all time, or never
+        inside_x = (x >= left) & (x <= right)
+        inside_y = (y >= top) & (y <= bottom)
+        still_x = np.broadcast_to(move_x == 0, near_x.shape)
+        still_y = np.broadcast_to(move_y == 0, near_y.shape)
+        near_x = np.where(still_x, np.where(inside_x, -np.inf, np.inf), near_x)
+        far_x = np.where(still_x, np.where(inside_x, np.inf, -np.inf), far_x)
+        near_y = np.where(still_y, np.where(inside_y, -np.inf, np.inf), near_y)
+        far_y = np.where(still_y, np.where(inside_y, np.inf, -np.inf), far_y)
+        
+        entry = np.maximum(near_x, near_y)
+        exit_ = np.minimum(far_x, far_y)
+        hit = (entry <= exit_) & (entry <= 1.0) & (exit_ > 0.0)
+        
+        # Entered through the x faces if the x slab was entered last
+        x_face = near_x > near_y
+        normal = np.zeros(entry.shape + (2,))
+        normal[..., 0] = np.where(x_face, -np.sign(move_x), 0.0)
+        normal[..., 1] = np.where(x_face, 0.0, -np.sign(move_y))
+        
+        # Only count impacts where the ball moves into the rect
+        approaching = normal[..., 0] * move_x + normal[..., 1] * move_y < 0
+        hit &= approaching
+        
+        time = np.where(hit, np.maximum(entry, 0.0), np.inf)
+        return time, normal
+    
+    def _bounce_off_paddle(self, paddle, position, velocity, rows, normals):
+        """Bounce balls off the paddle, steering those that land on top"""
+        on_top = (normals[:, 1] < 0) & (velocity[rows, 1] > 0)
+        
+        top_rows = rows[on_top]
+        if top_rows.size:
+            center = paddle.x + paddle.width / 2
+            relative_intersect = np.clip((position[top_rows, 0] - center) / (paddle.width / 2),
+                                         -1.0, 1.0)
+            angle = np.radians(relative_intersect * 60)
+            speed = np.hypot(velocity[top_rows, 0], velocity[top_rows, 1])
+            velocity[top_rows, 0] = speed * np.sin(angle)
+            velocity[top_rows, 1] = -speed * np.cos(angle)
+        
+        side_rows = rows[~on_top]
+        if side_rows.size:
+            n = normals[~on_top]
+            dot = np.minimum(np.einsum("ij,ij->i", velocity[side_rows], n), 0.0)
+            velocity[side_rows] -= 2 * dot[:, None] * n
@@ -1,9 +1,7 @@
 """
 Collision manager - handles all collision detection and resolution
 """
-import pygame
 import math
-import random
 
 class CollisionManager:
     """
@@ -13,155 +11,244 @@ class CollisionManager:
     def __init__(self, config):
         self.config = config
     
-    def check_ball_wall_collision(self, ball, screen_width, screen_height):
-        """Check and handle ball collision with screen walls"""
-        # Left and right walls
-        if ball.x - ball.radius <= 0 or ball.x + ball.radius >= screen_width:
-            ball.bounce_horizontal()
-            # Adjust position to prevent getting stuck in wall
-            if ball.x - ball.radius <= 0:
-                ball.x = ball.radius
-            else:
-                ball.x = screen_width - ball.radius
-            return True
-        
-        # Top wall
-        if ball.y - ball.radius <= 0:
-            ball.bounce_vertical()
-            ball.y = ball.radius  # Adjust position
-            return True
-            
-        # Bottom (ball lost)
-        if ball.y + ball.radius >= screen_height:
-            return "lost"
-            
-        return False
-    
-    def check_ball_paddle_collision(self, ball, paddle):
-        """Check and handle ball collision with paddle"""
-        # Quick check for possible collision (optimization)
-        if (ball.y + ball.radius >= paddle.y and
-            ball.x >= paddle.x and 
-            ball.x <= paddle.x + paddle.width):
-                
-            # Precise collision check using Rect
-            paddle_rect = paddle.get_rect()
-            ball_rect = ball.get_rect()
-            
-            if paddle_rect.colliderect(ball_rect):
-                # Ball hit the paddle
-                
-                # Calculate relative position of ball hit on paddle (from -1.0 to 1.0)
-                # Where -1.0 is far left, 0.0 is center, 1.0 is far right
-                relative_intersect = (ball.x - (paddle.x + paddle.width / 2)) / (paddle.width / 2)
-                
-                # Bounce angle based on where the ball hit the paddle
-                # Range is from -60 to 60 degrees
-                bounce_angle = relative_intersect * 60
-                
-                # Set the new direction based on the bounce angle
-                ball.set_direction(bounce_angle)
-                
-                # Ensure the ball is moving upward
-                if ball.speed_y > 0:
-                    ball.speed_y = -ball.speed_y
-                
-                # Position the ball on top of the paddle to prevent sticking
-                ball.y = paddle.y - ball.radius
+    def check_item_paddle_collision(self, items, paddle):
+        """
+        Check for collision between falling items and paddle
+        Returns the colliding item or None
+        """
+        for item in items:
+            if not item.is_active():
+                continue
                 
-                return True
+            if item.collides_with(paddle):
+                return item
                 
-        return False
+        return None
     
-    def check_ball_brick_collision(self, ball, bricks):
+    def move_ball(self, ball, paddle, bricks, screen_width, screen_height, brick_grid=None):
         """
-        Check and handle ball collision with bricks
-        Returns tuple (hits, points, destroyed_brick)
+        Move a launched ball by its velocity for one frame using swept collision.
+        The ball is advanced to the earliest time of impact against the walls,
+        the paddle or a brick, bounced, and then continues with the rest of its
+        movement, up to BALL_MAX_BOUNCES_PER_FRAME bounces per frame.
+        This keeps fast balls from tunnelling through thin bricks or the paddle.
+        Returns tuple (hits, points, destroyed_bricks, lost)
         """
         hits = 0
         points = 0
-        destroyed_brick = None
+        destroyed_bricks = []
+        remaining = 1.0
+        radius = ball.radius
+        paddle_rect = paddle.get_rect()
         
-        # Check each active brick
-        for brick in bricks:
-            if not brick.is_active():
-                continue
-                
-            # Check for collision
-            if self._check_circle_rect_collision(ball, brick.get_rect()):
-                # Handle hit and get results
-                destroyed, brick_points = brick.hit()
+        for _ in range(self.config.BALL_MAX_BOUNCES_PER_FRAME):
+            move_x = ball.speed_x * remaining
+            move_y = ball.speed_y * remaining
+            if move_x == 0 and move_y == 0:
+                break
+            
+            # Find the earliest impact along this movement
+            impact_time, normal_x, normal_y, target = self._sweep_walls(
+                ball, move_x, move_y, screen_width, screen_height)
+            
+            paddle_impact = self._sweep_circle_rect(
+                ball.x, ball.y, move_x, move_y, radius,
+                paddle_rect.left, paddle_rect.top, paddle_rect.right, paddle_rect.bottom)
+            if paddle_impact is not None and paddle_impact[0] < impact_time:
+                impact_time, normal_x, normal_y = paddle_impact
+                target = paddle
+            
+            # Only bricks around the swept path can be hit
+            if brick_grid is not None:
+                candidates = brick_grid.query(
+                    min(ball.x, ball.x + move_x) - radius,
+                    min(ball.y, ball.y + move_y) - radius,
+                    max(ball.x, ball.x + move_x) + radius,
+                    max(ball.y, ball.y + move_y) + radius)
+            else:
+                candidates = bricks
+            
+            for brick in candidates:
+                if not brick.is_active():
+                    continue
+                brick_rect = brick.get_rect()
+                brick_impact = self._sweep_circle_rect(
+                    ball.x, ball.y, move_x, move_y, radius,
+                    brick_rect.left, brick_rect.top, brick_rect.right, brick_rect.bottom)
+                if brick_impact is not None and brick_impact[0] < impact_time:
+                    impact_time, normal_x, normal_y = brick_impact
+                    target = brick
+            
+            # Advance the ball to the point of impact (or the end of its movement)
+            ball.x += move_x * impact_time
+            ball.y += move_y * impact_time
+            
+            if target is None:
+                break
+            
+            remaining *= 1.0 - impact_time
+            
+            if target == "lost":
+                return hits, points, destroyed_bricks, True
+            
+            if target is paddle:
+                self._bounce_off_paddle(ball, paddle, normal_x, normal_y)
+            elif target == "wall":
+                self._reflect(ball, normal_x, normal_y)
+            else:
+                destroyed, brick_points = target.hit()
                 hits += 1
                 points += brick_points
+                self._reflect(ball, normal_x, normal_y)
                 
-                # Determine bounce direction based on which side was hit
-                collision_side = self._get_collision_side(ball, brick.get_rect())
-                
-                if collision_side in ('top', 'bottom'):
-                    ball.bounce_vertical()
-                else:  # 'left' or 'right'
-                    ball.bounce_horizontal()
-                
-                # Remember the destroyed brick for item spawning
                 if destroyed:
-                    destroyed_brick = brick
-                
-                # Only handle one brick collision at a time
-                break
-                
-        return hits, points, destroyed_brick
+                    destroyed_bricks.append(target)
+        
+        return hits, points, destroyed_bricks, False
     
-    def check_item_paddle_collision(self, items, paddle):
+    def _sweep_walls(self, ball, move_x, move_y, screen_width, screen_height):
         """
-        Check for collision between falling items and paddle
-        Returns the colliding item or None
+        Find the earliest impact of a moving ball against the screen walls.
+        Returns tuple (time, normal_x, normal_y, target) where target is
+        "wall", "lost" (bottom of the screen) or None if nothing is hit.
         """
-        for item in items:
-            if not item.is_active():
+        radius = ball.radius
+        impact = (1.0, 0.0, 0.0, None)
+        
+        if move_x < 0:
+            time = max(0.0, (radius - ball.x) / move_x)
+            if time <= impact[0]:
+                impact = (time, 1.0, 0.0, "wall")
+        elif move_x > 0:
+            time = max(0.0, (screen_width - radius - ball.x) / move_x)
+            if time <= impact[0]:
+                impact = (time, -1.0, 0.0, "wall")
+        
+        if move_y < 0:
+            time = max(0.0, (radius - ball.y) / move_y)
+            if time <= impact[0]:
+                impact = (time, 0.0, 1.0, "wall")
+        elif move_y > 0:
+            time = max(0.0, (screen_height - radius - ball.y) / move_y)
+            if time <= impact[0]:
+                impact = (time, 0.0, -1.0, "lost")
+        
+        return impact
+    
+    def _sweep_circle_rect(self, x, y, move_x, move_y, radius, left, top, right, bottom):
+        """
+        Find when a circle moving from (x, y) by (move_x, move_y) first touches a rect.
+        The rect is expanded by the radius (with rounded corners) and a ray is cast
+        against it. Only impacts where the circle moves into the rect count.
+        Returns tuple (time, normal_x, normal_y) with time in [0, 1], or None
+        """
+        # Already overlapping: resolve immediately if moving further in
+        closest_x = max(left, min(x, right))
+        closest_y = max(top, min(y, bottom))
+        if (x - closest_x) ** 2 + (y - closest_y) ** 2 < radius * radius:
+            normal_x, normal_y = self._get_penetration_normal(x, y, left, top, right, bottom)
+            if move_x * normal_x + move_y * normal_y < 0:
+                return 0.0, normal_x, normal_y
+            return None
+        
+        # Ray against the rect expanded by the radius (slab test)
+        entry_time = 0.0
+        exit_time = 1.0
+        normal_x = normal_y = 0.0
+        
+        for position, movement, low, high, axis in ((x, move_x, left - radius, right + radius, 0),
+                                                     (y, move_y, top - radius, bottom + radius, 1)):
+            if movement == 0:
+                if position < low or position > high:
+                    return None
                 continue
-                
-            if item.collides_with(paddle):
-                return item
-                
-        return None
+            
+            time_low = (low - position) / movement
+            time_high = (high - position) / movement
+            if time_low > time_high:
+                time_low, time_high = time_high, time_low
+            
+            if time_low > entry_time:
+                entry_time = time_low
+                side = -1.0 if movement > 0 else 1.0
+                normal_x, normal_y = (side, 0.0) if axis == 0 else (0.0, side)
+            exit_time = min(exit_time, time_high)
+            if entry_time > exit_time:
+                return None
+        
+        # Hits in the corner regions must touch the rounded corner itself
+        hit_x = x + move_x * entry_time
+        hit_y = y + move_y * entry_time
+        corner_x = left if hit_x < left else right if hit_x > right else None
+        corner_y = top if hit_y < top else bottom if hit_y > bottom else None
+        
+        if corner_x is not None and corner_y is not None:
+            return self._sweep_circle_point(x, y, move_x, move_y, radius, corner_x, corner_y)
+        
+        if normal_x == 0 and normal_y == 0:
+            return None
+        
+        return entry_time, normal_x, normal_y
     
-    def _check_circle_rect_collision(self, ball, rect):
+    def _sweep_circle_point(self, x, y, move_x, move_y, radius, point_x, point_y):
         """
-        Check collision between a circle (ball) and rectangle (brick/paddle)
-        This is more accurate than rect-rect collision for a circle
+        Find when a circle moving from (x, y) first touches a point (rect corner).
+        Returns tuple (time, normal_x, normal_y) or None
         """
-        # Find the closest point on the rectangle to the circle center
-        closest_x = max(rect.left, min(ball.x, rect.right))
-        closest_y = max(rect.top, min(ball.y, rect.bottom))
+        offset_x = x - point_x
+        offset_y = y - point_y
+        a = move_x * move_x + move_y * move_y
+        b = 2 * (offset_x * move_x + offset_y * move_y)
+        c = offset_x * offset_x + offset_y * offset_y - radius * radius
+        
+        discriminant = b * b - 4 * a * c
+        if a == 0 or discriminant < 0:
+            return None
         
-        # Calculate the distance between the closest point and circle center
-        distance_x = ball.x - closest_x
-        distance_y = ball.y - closest_y
+        time = (-b - math.sqrt(discriminant)) / (2 * a)
+        if time < 0 or time > 1:
+            return None
         
-        # If the distance is less than the circle's radius, there is a collision
-        return (distance_x**2 + distance_y**2) < (ball.radius**2)
+        normal_x = (offset_x + move_x * time) / radius
+        normal_y = (offset_y + move_y * time) / radius
+        return time, normal_x, normal_y
     
-    def _get_collision_side(self, ball, rect):
-        """Determine which side of the rect the ball collided with"""
-        # Calculate the center of the ball
-        ball_center_x = ball.x
-        ball_center_y = ball.y
-        
-        # Calculate distances from ball center to rect edges
-        dist_left = abs(ball_center_x - rect.left)
-        dist_right = abs(ball_center_x - rect.right)
-        dist_top = abs(ball_center_y - rect.top)
-        dist_bottom = abs(ball_center_y - rect.bottom)
-        
-        # Find the minimum distance
-        min_dist = min(dist_left, dist_right, dist_top, dist_bottom)
-        
-        # Return the corresponding side
-        if min_dist == dist_left:
-            return 'left'
-        elif min_dist == dist_right:
-            return 'right'
-        elif min_dist == dist_top:
-            return 'top'
+    def _get_penetration_normal(self, x, y, left, top, right, bottom):
+        """Get the normal pointing out of a rect towards a point that overlaps it"""
+        closest_x = max(left, min(x, right))
+        closest_y = max(top, min(y, bottom))
+        distance_x = x - closest_x
+        distance_y = y - closest_y
+        distance = math.sqrt(distance_x**2 + distance_y**2)
+        
+        if distance > 0:
+            return distance_x / distance, distance_y / distance
+        
+        # Center is inside the rect: push out through the nearest face
+        exits = ((x - left, -1.0, 0.0), (right - x, 1.0, 0.0),
+                 (y - top, 0.0, -1.0), (bottom - y, 0.0, 1.0))
+        _, normal_x, normal_y = min(exits)
+        return normal_x, normal_y
+    
+    def _reflect(self, ball, normal_x, normal_y):
+        """Reflect the ball's velocity about a surface normal"""
+        dot = ball.speed_x * normal_x + ball.speed_y * normal_y
+        if dot < 0:
+            ball.speed_x -= 2 * dot * normal_x
+            ball.speed_y -= 2 * dot * normal_y
+    
+    def _bounce_off_paddle(self, ball, paddle, normal_x, normal_y):
+        """Bounce the ball off the paddle, steering it when it lands on top"""
+        if normal_y < 0 and ball.speed_y > 0:
+            # Calculate relative position of ball hit on paddle (from -1.0 to 1.0)
+            relative_intersect = (ball.x - (paddle.x + paddle.width / 2)) / (paddle.width / 2)
+            relative_intersect = max(-1.0, min(1.0, relative_intersect))
+            
+            # Bounce angle based on where the ball hit the paddle (-60 to 60 degrees)
+            ball.set_direction(relative_intersect * 60)
+            
+            # Ensure the ball is moving upward
+            if ball.speed_y > 0:
+                ball.speed_y = -ball.speed_y
         else:
-            return 'bottom'
+            self._reflect(ball, normal_x, normal_y)
@@ -0,0 +1,52 @@
+"""
+Object pool - recycles game objects instead of allocating new ones mid-game
+"""
+
+class ObjectPool:
+    """
+    ObjectPool keeps released objects on a free list and hands them out again.
+    Recycled objects are set up again with their reinitialize(*args) method,
+    which takes the same arguments as the factory, so reusing an object does
+    no allocation and no sprite loading.
+    """
+    def __init__(self, factory):
+        self.factory = factory  # Called with acquire's arguments when the free list is empty
+        self.free = []
+    
+    def acquire(self, *args):
+        """Return a recycled object reinitialized with args, or a new one"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reinitialize(*args)
+            return obj
+        return self.factory(*args)
+    
+    def release(self, obj):
+        """Give an object back to the pool"""
+        obj.deactivate()
+        self.free.append(obj)
+    
+    def reserve(self, count, *args):
+        """Allocate objects up front until count are free"""
+        while len(self.free) < count:
+            self.release(self.factory(*args))
+    
+    def __len__(self):
+        return len(self.free)
+
+def remove_swap(objects, removed):
+    """
+    Remove the given objects from a list in one pass by moving the last
+    element into each freed slot (the order of the list is not kept)
+    """
+    if not removed:
+        return
+    removed = set(removed)
+    i = 0
+    while i < len(objects):
+        if objects[i] in removed:
+            last = objects.pop()
+            if i < len(objects):
+                objects[i] = last
+        else:
+            i += 1
@@ -0,0 +1,94 @@
+"""
+Scheduler - runs callbacks after a delay measured in game-time ticks
+"""
+import heapq
+import itertools
+
+class ScheduledEvent:
+    """
+    Handle for a scheduled callback, returned by Scheduler.schedule.
+    Call cancel() to stop the callback from running.
+    """
+    __slots__ = ("scheduler", "due_tick", "callback", "args", "cancelled", "done")
+    
+    def __init__(self, scheduler, due_tick, callback, args):
+        self.scheduler = scheduler
+        self.due_tick = due_tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.done = False
+    
+    def cancel(self):
+        """Cancel the event if it hasn't run yet"""
+        if self.is_pending():
+            self.cancelled = True
+            self.scheduler._event_cancelled()
+    
+    def is_pending(self):
+        """Check if the event is still waiting to run"""
+        return not (self.cancelled or self.done)
+
+
+class Scheduler:
+    """
+    Scheduler keeps timers in a priority queue ordered by the game tick they are due.
+    The game advances it once per simulation step (and not while paused), so
+    processing only touches timers that are due, not every pending timer.
+    Cancelled timers are dropped lazily when they reach the front of the queue.
+    """
+    def __init__(self):
+        self.tick = 0
+        self._queue = []  # [(due_tick, sequence, event), ...]
+        self._sequence = itertools.count()  # Keeps same-tick events in scheduling order
+        self._cancelled = 0
+    
+    def schedule(self, delay_ticks, callback, *args):
+        """
+        Schedule callback(*args) to run after delay_ticks ticks
+        Returns a ScheduledEvent handle that can be cancelled
+        """
+        event = ScheduledEvent(self, self.tick + max(1, delay_ticks), callback, args)
+        heapq.heappush(self._queue, (event.due_tick, next(self._sequence), event))
+        return event
+    
+    def cancel(self, event):
+        """Cancel a scheduled event"""
+        event.cancel()
+    
+    def _event_cancelled(self):
+        """Keep count of cancelled events still in the queue"""
+        self._cancelled += 1
+        
+        # Rebuild the queue once it is mostly cancelled timers
+        if self._cancelled > 32 and self._cancelled * 2 > len(self._queue):
+            self._queue = [entry for entry in self._queue if entry[2].is_pending()]
+            heapq.heapify(self._queue)
+            self._cancelled = 0
+    
+    def advance(self, ticks=1):
+        """Move game time forward and run every event that is now due"""
+        self.tick += ticks
+        
+        # Callbacks may schedule or cancel events, so always use the live queue
+        while self._queue and self._queue[0][0] <= self.tick:
+            _, _, event = heapq.heappop(self._queue)
+            if event.cancelled:
+                self._cancelled -= 1
+                continue
+            event.done = True
+            event.callback(*event.args)
+    
+    def pending_events(self):
+        """Return the pending events in the order they will run"""
+        return [entry[2] for entry in sorted(self._queue) if entry[2].is_pending()]
+    
+    def clear(self):
+        """Drop all pending events"""
+        for _, _, event in self._queue:
+            event.cancelled = True
+        self._queue.clear()
+        self._cancelled = 0
+    
+    def __len__(self):
+        return len(self._queue) - self._cancelled
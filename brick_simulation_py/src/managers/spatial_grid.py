@@ -0,0 +1,101 @@
+"""
+Spatial grid - uniform grid index used to find bricks near a point or area
+"""
+
+class BrickGrid:
+    """
+    BrickGrid buckets bricks into fixed-size cells so collision checks only
+    look at the few cells an object overlaps instead of every brick in the level.
+    The cell size matches the brick layout from calculate_brick_position,
+    so a brick normally lives in exactly one cell.
+    """
+    def __init__(self, config):
+        self.cell_width = config.BRICK_WIDTH + config.BRICK_MARGIN
+        self.cell_height = config.BRICK_HEIGHT + config.BRICK_MARGIN
+        self.origin_x = config.BRICK_MARGIN
+        self.origin_y = config.BRICK_TOP_MARGIN
+        self.cells = {}  # {(col, row): [brick, ...]}
+        self.count = 0
+        self.spanning = 0  # Bricks that overlap more than one cell
+    
+    def _cell_range(self, left, top, right, bottom):
+        """Return the (col, row) bounds of all cells touched by an area"""
+        first_col = int((left - self.origin_x) // self.cell_width)
+        last_col = int((right - self.origin_x) // self.cell_width)
+        first_row = int((top - self.origin_y) // self.cell_height)
+        last_row = int((bottom - self.origin_y) // self.cell_height)
+        return first_col, last_col, first_row, last_row
+    
+    def insert(self, brick):
+        """Add a brick to every cell its rectangle overlaps"""
+        first_col, last_col, first_row, last_row = self._cell_range(
+            brick.x, brick.y, brick.x + brick.width - 1, brick.y + brick.height - 1)
+        
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                self.cells.setdefault((col, row), []).append(brick)
+        self.count += 1
+        if first_row != last_row or first_col != last_col:
+            self.spanning += 1
+    
+    def remove(self, brick):
+        """Remove a brick from the grid (e.g. after it is destroyed)"""
+        first_col, last_col, first_row, last_row = self._cell_range(
+            brick.x, brick.y, brick.x + brick.width - 1, brick.y + brick.height - 1)
+        
+        removed = False
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = self.cells.get((col, row))
+                if cell and brick in cell:
+                    cell.remove(brick)
+                    removed = True
+                    if not cell:
+                        del self.cells[(col, row)]
+        if removed:
+            self.count -= 1
+            if first_row != last_row or first_col != last_col:
+                self.spanning -= 1
+    
+    def query(self, left, top, right, bottom):
+        """
+        Return the bricks whose cells overlap the given area.
+        Bricks are returned once each, in row-major cell order.
+        """
+        first_col, last_col, first_row, last_row = self._cell_range(left, top, right, bottom)
+        cells = self.cells
+        
+        if not self.spanning:
+            # Every brick is in one cell, so no brick can be found twice
+            found = []
+            for row in range(first_row, last_row + 1):
+                for col in range(first_col, last_col + 1):
+                    cell = cells.get((col, row))
+                    if cell:
+                        found.extend(cell)
+            return found
+        
+        found = []
+        seen = set()  # ids of the bricks in found, for constant-time duplicate checks
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = cells.get((col, row))
+                if cell:
+                    for brick in cell:
+                        if id(brick) not in seen:
+                            seen.add(id(brick))
+                            found.append(brick)
+        return found
+    
+    def query_circle(self, x, y, radius):
+        """Return the bricks near a circle (e.g. the ball)"""
+        return self.query(x - radius, y - radius, x + radius, y + radius)
+    
+    def clear(self):
+        """Remove all bricks from the grid"""
+        self.cells.clear()
+        self.count = 0
+        self.spanning = 0
+    
+    def __len__(self):
+        return self.count
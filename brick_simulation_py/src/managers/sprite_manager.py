@@ -1,9 +1,9 @@
 """
 Sprite manager - handles loading and managing game graphics
 """
-import os
 import pygame
-from ..utils.helpers import load_image
+from ..utils.helpers import has_assets, load_image, scale_sprite
+from .texture_atlas import TextureAtlas
 
 class SpriteManager:
     """
@@ -19,8 +19,8 @@ class SpriteManager:
         Attempt to load all game sprites.
         If sprites are not found, the game will fall back to shape rendering.
         """
-        # Check if any sprites exist
-        if os.path.exists("assets/images") and os.listdir("assets/images"):
+        # Check if any sprites exist, in the asset pack or as loose files
+        if has_assets("images"):
             self.use_shapes = False
             
             # Try to load all common sprite types
@@ -50,6 +50,32 @@ class SpriteManager:
         else:
             print(f"Failed to load sprite: {path}")
     
+    def build_atlas(self, config):
+        """
+        Pack the loaded sprites, scaled to the sizes the game draws them at,
+        into a TextureAtlas. Returns None when no sprites are loaded.
+        """
+        if self.use_shapes or not self.sprites:
+            return None
+        
+        # Paddle widths: normal, then each extend (1.5x, capped at half the screen)
+        paddle_widths = [config.PADDLE_WIDTH]
+        while paddle_widths[-1] < config.SCREEN_WIDTH / 2:
+            paddle_widths.append(min(paddle_widths[-1] * 1.5, config.SCREEN_WIDTH / 2))
+        
+        atlas = TextureAtlas()
+        for sprite_id, sprite in self.sprites.items():
+            if sprite_id == "paddle":
+                for width in paddle_widths:
+                    atlas.add(f"paddle_{int(width)}", sprite, width, config.PADDLE_HEIGHT)
+            elif sprite_id == "ball":
+                atlas.add(sprite_id, sprite, config.BALL_RADIUS * 2, config.BALL_RADIUS * 2)
+            elif sprite_id.startswith("brick_"):
+                atlas.add(sprite_id, sprite, config.BRICK_WIDTH, config.BRICK_HEIGHT)
+            elif sprite_id.startswith("item_"):
+                atlas.add(sprite_id, sprite, config.ITEM_SIZE, config.ITEM_SIZE)
+        return atlas.build()
+    
     def get_sprite(self, sprite_id):
         """Get a sprite by ID, returns None if not found"""
         return self.sprites.get(sprite_id)
@@ -69,8 +95,7 @@ class SpriteManager:
         if not self.use_shapes and sprite_id in self.sprites:
             # Use sprite rendering
             sprite = self.sprites[sprite_id]
-            scaled_sprite = pygame.transform.scale(sprite, (width, height))
-            screen.blit(scaled_sprite, (x, y))
+            screen.blit(scale_sprite(sprite, width, height), (x, y))
             return True
         else:
             # Fall back to shape rendering
@@ -86,8 +111,7 @@ class SpriteManager:
             # Use sprite rendering
             sprite = self.sprites[sprite_id]
             diameter = radius * 2
-            scaled_sprite = pygame.transform.scale(sprite, (diameter, diameter))
-            screen.blit(scaled_sprite, (x - radius, y - radius))
+            screen.blit(scale_sprite(sprite, diameter, diameter), (x - radius, y - radius))
             return True
         else:
             # Fall back to shape rendering
@@ -0,0 +1,79 @@
+"""
+Texture atlas - packs game sprites into one surface so they can be drawn in batches
+"""
+import pygame
+
+class TextureAtlas:
+    """
+    TextureAtlas packs sprites, already scaled to the size they are drawn at,
+    into a single surface and keeps an index of where each one is.
+    Regions are keyed by (sprite, width, height), the same key as the scaled
+    sprite cache, so any object whose sprite and size match can be drawn from
+    the atlas with one entry in a Surface.blits batch.
+    """
+    def __init__(self, max_width=1024, padding=1):
+        self.max_width = max_width
+        self.padding = padding  # Empty pixels between regions
+        self.surface = None
+        self.regions = {}  # {(sprite, width, height): Rect in the atlas}
+        self.names = {}  # {name: (sprite, width, height)}, for looking regions up by name
+        self._pending = []  # Keys added since the last build
+    
+    def add(self, name, sprite, width, height):
+        """Queue a sprite to be packed at width x height (call build() afterwards)"""
+        key = (sprite, int(width), int(height))
+        if key not in self.regions and key not in self._pending:
+            self._pending.append(key)
+        self.names[name] = key
+    
+    def build(self):
+        """Pack every queued sprite (and those packed before) into a new atlas surface"""
+        keys = list(self.regions) + self._pending
+        self._pending = []
+        # Shelf packing: tallest first, rows left to right
+        keys.sort(key=lambda key: (key[2], key[1]), reverse=True)
+        
+        padding = self.padding
+        width = max([self.max_width] + [key[1] + padding for key in keys])
+        regions = {}
+        x = y = shelf_height = 0
+        for key in keys:
+            _, sprite_width, sprite_height = key
+            if x + sprite_width > width:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            regions[key] = pygame.Rect(x, y, sprite_width, sprite_height)
+            x += sprite_width + padding
+            shelf_height = max(shelf_height, sprite_height)
+        
+        surface = pygame.Surface((width, max(1, y + shelf_height)), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        for key, rect in regions.items():
+            sprite, sprite_width, sprite_height = key
+            scaled = pygame.transform.scale(sprite, (sprite_width, sprite_height))
+            # Copy the pixels as they are instead of blending them onto the empty atlas
+            surface.blit(scaled, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        
+        self.surface = surface
+        self.regions = regions
+        return self
+    
+    def find(self, sprite, width, height):
+        """Region of the atlas holding sprite at width x height, or None"""
+        return self.regions.get((sprite, int(width), int(height)))
+    
+    def get_region(self, name):
+        """Region of the atlas for a sprite added under name, or None"""
+        key = self.names.get(name)
+        return self.regions.get(key) if key is not None else None
+    
+    def index(self):
+        """{name: (x, y, width, height)} of every packed sprite"""
+        return {name: tuple(self.regions[key]) for name, key in self.names.items()
+                if key in self.regions}
+    
+    def __len__(self):
+        return len(self.regions)
@@ -0,0 +1,156 @@
+"""
+Input recording and replay - reproduce a game session from its seed and per-step inputs
+
+File layout (little-endian):
+    header:  magic "BRRP", version (u8), reserved (u8), seed (u64), simulation hz (u16)
+    body:    runs of (input flags (u8), run length (varint)) - one flag byte per step
+    footer:  0xFF, step count (u64), final score (u64)
+"""
+import struct
+import sys
+
+from .simulation import Simulation
+
+REPLAY_MAGIC = b"BRRP"
+REPLAY_VERSION = 1
+END_OF_INPUTS = 0xFF
+
+_HEADER = struct.Struct("<4sBBQH")
+_FOOTER = struct.Struct("<QQ")
+
+def _write_varint(buffer, value):
+    """Append an unsigned integer using 7 bits per byte"""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def _read_varint(data, offset):
+    """Read an unsigned varint, returns (value, new offset)"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+class InputRecorder:
+    """
+    InputRecorder collects the input flags of every simulation step.
+    Runs of identical inputs are stored once with a count, so a long session
+    where the paddle mostly stands still or holds one direction stays tiny.
+    """
+    def __init__(self, seed, simulation_hz):
+        self.seed = seed
+        self.simulation_hz = simulation_hz
+        self.body = bytearray()
+        self.step_count = 0
+        self._current = None
+        self._run_length = 0
+    
+    def record(self, inputs):
+        """Record the input flags for one step"""
+        if inputs == self._current:
+            self._run_length += 1
+        else:
+            self._flush_run()
+            self._current = inputs
+            self._run_length = 1
+        self.step_count += 1
+    
+    def _flush_run(self):
+        """Write out the current run of identical inputs"""
+        if self._run_length:
+            self.body.append(self._current)
+            _write_varint(self.body, self._run_length)
+            self._run_length = 0
+    
+    def to_bytes(self, final_score):
+        """Return the complete replay file contents"""
+        self._flush_run()
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, 0, self.seed, self.simulation_hz)
+        footer = bytes([END_OF_INPUTS]) + _FOOTER.pack(self.step_count, final_score)
+        return header + bytes(self.body) + footer
+    
+    def save(self, path, final_score):
+        """Write the replay to a file"""
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes(final_score))
+
+class Replay:
+    """A loaded replay: seed, simulation rate, per-step inputs and the recorded result"""
+    def __init__(self, data):
+        magic, version, _, seed, simulation_hz = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+        
+        self.seed = seed
+        self.simulation_hz = simulation_hz
+        self.runs = []  # [(inputs, run length), ...]
+        
+        offset = _HEADER.size
+        while data[offset] != END_OF_INPUTS:
+            inputs = data[offset]
+            run_length, offset = _read_varint(data, offset + 1)
+            self.runs.append((inputs, run_length))
+        
+        self.step_count, self.final_score = _FOOTER.unpack_from(data, offset + 1)
+    
+    @classmethod
+    def load(cls, path):
+        """Load a replay from a file"""
+        with open(path, "rb") as replay_file:
+            return cls(replay_file.read())
+    
+    def inputs(self):
+        """Yield the input flags for each step in order"""
+        for inputs, run_length in self.runs:
+            for _ in range(run_length):
+                yield inputs
+    
+    def play(self, config):
+        """
+        Re-simulate the recorded session headlessly, as fast as possible
+        Returns the Simulation in its final state
+        """
+        if self.simulation_hz != config.SIMULATION_HZ:
+            raise ValueError(f"Replay was recorded at {self.simulation_hz} Hz, "
+                             f"config runs at {config.SIMULATION_HZ} Hz")
+        
+        simulation = Simulation(config, seed=self.seed)
+        step_input = simulation.step_input
+        for inputs, run_length in self.runs:
+            for _ in range(run_length):
+                step_input(inputs)
+        return simulation
+
+def main(argv=None):
+    """Replay a recorded session and check that it reproduces the recorded score"""
+    import time
+    from . import config
+    
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m src.replay <replay file>")
+        return 2
+    
+    replay = Replay.load(argv[0])
+    start = time.perf_counter()
+    simulation = replay.play(config)
+    elapsed = time.perf_counter() - start
+    
+    print(f"Replayed {replay.step_count} steps in {elapsed:.2f}s "
+          f"({replay.step_count / max(elapsed, 1e-9):.0f} steps/s)")
+    print(f"Recorded score: {replay.final_score}, replayed score: {simulation.score}")
+    if simulation.score != replay.final_score:
+        print("Replay diverged from the recording!")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
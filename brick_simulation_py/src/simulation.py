@@ -0,0 +1,484 @@
+"""
+Simulation core for Bric Game - game state and rules without any display or input
+"""
+import random
+from .components.paddle import Paddle
+from .components.ball import Ball
+from .components.brick import Brick
+from .components.item import Item
+from .components.level import Level
+from .managers.collision import CollisionManager
+from .managers.batch_collision import BatchCollisionManager, NUMPY_AVAILABLE
+from .managers.scheduler import Scheduler
+from .managers.object_pool import ObjectPool, remove_swap
+
+# Per-step input flags (see Simulation.step_input)
+INPUT_LEFT = 1      # Paddle moving left
+INPUT_RIGHT = 2     # Paddle moving right
+INPUT_LAUNCH = 4    # Space: start game / launch ball
+INPUT_PAUSE = 8     # P: toggle pause
+INPUT_RESTART = 16  # Enter: restart after game over
+
+class Simulation:
+    """
+    Simulation holds the whole game state and advances it one fixed step at a time.
+    It never touches the display, the keyboard or the system clock: paddle input
+    is passed to step() and time only moves forward with each step. This lets it
+    run headless as fast as the CPU allows, with many instances per process
+    (bots, replays, batch experiments). Game is a pygame front end on top of it.
+    """
+    def __init__(self, config, seed=None, start_level=1, reserve_pools=True):
+        """
+        Initialize the simulation with configuration
+        All randomness comes from one RNG seeded with seed, so the same seed and
+        the same inputs always play out the same game
+        start_level lets experiments begin directly on a later level
+        With reserve_pools=False the object pools start empty; call
+        reserve_pools() later (e.g. once the first frame is on screen)
+        """
+        self.config = config
+        self.step_ms = 1000.0 / config.SIMULATION_HZ
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
+        
+        # Initialize managers
+        self.collision_manager = CollisionManager(config)
+        self.batch_collision_manager = BatchCollisionManager(config) if NUMPY_AVAILABLE else None
+        
+        # Game state
+        self.state = "start"  # start, playing, paused, level_cleared, game_over
+        self.score = 0
+        self.lives = config.STARTING_LIVES
+        self.level_number = start_level
+        self.scheduler = Scheduler()  # Game-time timers, stopped while paused
+        self.active_effects = {}  # {effect name: ScheduledEvent that ends it}
+        
+        # Called with (text, size, duration, y=None, color=None) to show a message
+        self.message_handler = None
+        
+        # Optional FrameProfiler; steps mark the paddle, balls, items and scheduler phases
+        self.profiler = None
+        
+        # Game objects
+        self.paddle = None
+        self.balls = []
+        self.bricks = []
+        self.items = []
+        self.level = None
+        
+        # Balls and items are recycled through pools (one item pool per item type)
+        self.ball_pool = ObjectPool(self._new_ball)
+        self.item_pools = {}
+        if reserve_pools:
+            self.reserve_pools()
+        
+        # Initialize game objects
+        self._init_game_objects()
+    
+    def reserve_pools(self):
+        """
+        Allocate pooled balls and items up front, so power-up heavy play
+        doesn't allocate or load sprites
+        """
+        config = self.config
+        self.ball_pool.reserve(config.BALL_POOL_SIZE, 0, 0, config.BALL_SPEED_X, config.BALL_SPEED_Y)
+        for item_config in config.ITEM_TYPES:
+            self._get_item_pool(item_config["name"]).reserve(config.ITEM_POOL_SIZE, 0, 0)
+    
+    def _init_game_objects(self):
+        """Initialize all game objects"""
+        # Create paddle
+        paddle_x = self.config.SCREEN_WIDTH // 2 - self.config.PADDLE_WIDTH // 2
+        paddle_y = self.config.SCREEN_HEIGHT - self.config.PADDLE_BOTTOM_MARGIN - self.config.PADDLE_HEIGHT
+        self.paddle = Paddle(
+            paddle_x, paddle_y,
+            self.config.PADDLE_WIDTH, self.config.PADDLE_HEIGHT,
+            self.config.PADDLE_COLOR,
+            self.config.PADDLE_SPEED,
+            self.config.SCREEN_WIDTH
+        )
+        
+        # Create ball
+        self._create_initial_ball()
+        
+        # Create level and bricks
+        self.level = Level(self.config, self.level_number, self.rng)
+        self.bricks = self.level.create_bricks(Brick)
+    
+    def _create_initial_ball(self):
+        """Create initial ball positioned on the paddle"""
+        # Clear any existing balls
+        self.release_balls()
+        
+        # Create a new ball
+        ball_x = self.paddle.x + self.paddle.width // 2
+        ball_y = self.paddle.y - self.config.BALL_RADIUS
+        self.balls.append(self.create_ball(ball_x, ball_y))
+    
+    def _new_ball(self, x, y, speed_x, speed_y):
+        """Allocate a new ball (when the ball pool is empty)"""
+        return Ball(
+            x, y,
+            self.config.BALL_RADIUS,
+            self.config.BALL_COLOR,
+            speed_x,
+            speed_y,
+            self.config.BALL_MAX_SPEED
+        )
+    
+    def create_ball(self, x, y):
+        """Create a new ball at the specified position (for multi-ball power-up)"""
+        return self.ball_pool.acquire(x, y, self.config.BALL_SPEED_X, self.config.BALL_SPEED_Y)
+    
+    def release_balls(self, balls=None):
+        """Return balls to the pool and remove them from play (all balls if none are given)"""
+        if balls is None:
+            balls = list(self.balls)
+            self.balls.clear()
+        else:
+            remove_swap(self.balls, balls)
+        for ball in balls:
+            self.ball_pool.release(ball)
+    
+    def _get_item_pool(self, item_type):
+        """Pool of items of one type"""
+        pool = self.item_pools.get(item_type)
+        if pool is None:
+            pool = ObjectPool(lambda x, y: self._new_item(x, y, item_type))
+            self.item_pools[item_type] = pool
+        return pool
+    
+    def _new_item(self, x, y, item_type):
+        """Allocate a new item (when the pool for its type is empty)"""
+        # Choose item color based on type
+        item_colors = {
+            "extend": self.config.COLOR_GREEN,
+            "slow": self.config.COLOR_BLUE,
+            "multi": self.config.COLOR_YELLOW,
+            "life": self.config.COLOR_RED,
+            "laser": self.config.COLOR_PURPLE,
+            "fast": self.config.COLOR_ORANGE,
+            "warp": self.config.COLOR_CYAN
+        }
+        color = item_colors.get(item_type, self.config.COLOR_WHITE)
+        
+        return Item(x, y, self.config.ITEM_SIZE, item_type, color, self.config.ITEM_SPEED)
+    
+    def create_item(self, x, y, item_type):
+        """Create a random item that falls from a destroyed brick"""
+        self.items.append(self._get_item_pool(item_type).acquire(x, y))
+    
+    def release_items(self, items=None):
+        """Return items to their pools and remove them from play (all items if none are given)"""
+        if items is None:
+            items = list(self.items)
+            self.items.clear()
+        else:
+            remove_swap(self.items, items)
+        for item in items:
+            self.item_pools[item.item_type].release(item)
+    
+    def show_message(self, text, size, duration, y=None, color=None):
+        """Ask the front end (if any) to display a timed message"""
+        if self.message_handler is not None:
+            self.message_handler(text, size, duration, y=y, color=color)
+    
+    def step(self, paddle_direction=0):
+        """
+        Run a single fixed simulation step
+        paddle_direction is -1 (left), 0 (still) or 1 (right)
+        """
+        # Remember where moving objects were for render interpolation
+        self.paddle.save_position()
+        for ball in self.balls:
+            ball.save_position()
+        for item in self.items:
+            item.save_position()
+        
+        # Update game state
+        if self.state == "playing":
+            self._update(paddle_direction)
+        
+        # Advance game time and run due timers (game time stands still while paused)
+        if self.state != "paused":
+            self.scheduler.advance()
+            if self.profiler is not None:
+                self.profiler.mark("scheduler")
+    
+    def step_input(self, inputs):
+        """
+        Run a single step from a set of INPUT_* flags.
+        Actions are applied before the step, in the same order the keys are handled.
+        """
+        if inputs & INPUT_LAUNCH:
+            self.launch()
+        if inputs & INPUT_PAUSE:
+            self.toggle_pause()
+        if inputs & INPUT_RESTART:
+            self.restart()
+        
+        paddle_direction = 0
+        if inputs & INPUT_LEFT:
+            paddle_direction -= 1
+        if inputs & INPUT_RIGHT:
+            paddle_direction += 1
+        
+        self.step(paddle_direction)
+    
+    def launch(self):
+        """Start the game from the start screen, or launch any ball resting on the paddle"""
+        if self.state == "start":
+            # Start game
+            self.state = "playing"
+        elif self.state == "playing":
+            # Launch ball if not launched
+            for ball in self.balls:
+                if not ball.is_launched:
+                    ball.launch()
+    
+    def toggle_pause(self):
+        """Pause or resume the game"""
+        if self.state == "playing":
+            self.state = "paused"
+        elif self.state == "paused":
+            self.state = "playing"
+    
+    def restart(self):
+        """Restart after game over"""
+        if self.state == "game_over":
+            self._reset_game()
+            self.state = "start"
+    
+    def _update(self, paddle_direction=0):
+        """Update game state for a single step"""
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.skip()
+        
+        # Update paddle
+        self.paddle.update(paddle_direction)
+        if profiler is not None:
+            profiler.mark("paddle")
+        
+        # Update balls and check for collisions
+        self._update_balls()
+        if profiler is not None:
+            profiler.mark("balls")
+        
+        # Update items
+        self._update_items()
+        if profiler is not None:
+            profiler.mark("items")
+        
+        # Check if level is cleared
+        if self._is_level_cleared():
+            self.state = "level_cleared"
+            # Schedule level transition
+            self.schedule_event(3000, self._start_next_level)
+    
+    def _update_balls(self):
+        """Update all balls and handle ball-related logic"""
+        # Update all balls
+        balls_to_remove = []
+        launched_balls = []
+        
+        for ball in self.balls:
+            # If ball is not launched yet, position it on the paddle
+            if not ball.is_launched:
+                ball.x = self.paddle.x + self.paddle.width // 2
+                ball.y = self.paddle.y - ball.radius
+                continue
+            launched_balls.append(ball)
+        
+        if (self.batch_collision_manager is not None and
+                len(launched_balls) >= self.config.BATCH_COLLISION_MIN_BALLS):
+            # Many balls: move and collide them all in one vectorized pass
+            _, points, destroyed_bricks, balls_to_remove = self.batch_collision_manager.move_balls(
+                launched_balls, self.paddle, self.bricks,
+                self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
+            self.score += points
+            
+            # Destroyed bricks may spawn an item
+            for destroyed_brick in destroyed_bricks:
+                self._spawn_item(destroyed_brick)
+        else:
+            for ball in launched_balls:
+                # Move the ball, resolving wall, paddle and brick collisions
+                _, points, destroyed_bricks, lost = self.collision_manager.move_ball(
+                    ball, self.paddle, self.level.live_bricks,
+                    self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT,
+                    self.level.brick_grid)
+                
+                if lost:
+                    # Ball was lost
+                    balls_to_remove.append(ball)
+                
+                # Add score from brick hits
+                self.score += points
+                
+                # Destroyed bricks may spawn an item
+                for destroyed_brick in destroyed_bricks:
+                    self._spawn_item(destroyed_brick)
+                
+                # Keep the batch brick arrays in step with the bricks
+                if destroyed_bricks and self.batch_collision_manager is not None:
+                    self.batch_collision_manager.invalidate()
+        
+        # Remove lost balls
+        self.release_balls(balls_to_remove)
+        
+        # If all balls are lost, lose a life
+        if not self.balls and self.state == "playing":
+            self.lives -= 1
+            
+            if self.lives <= 0:
+                # Game over
+                self.state = "game_over"
+            else:
+                # Reset with a new ball
+                self._create_initial_ball()
+                # Show message
+                self.show_message(
+                    "Ball lost! Press SPACE to launch",
+                    self.config.FONT_SIZE_MEDIUM, 2000)
+    
+    def _spawn_item(self, destroyed_brick):
+        """Potentially spawn an item where a brick was destroyed"""
+        if not destroyed_brick.should_drop_item(rng=self.rng):
+            return
+        
+        # Choose a random item type based on probabilities
+        item_candidates = []
+        for item_config in self.config.ITEM_TYPES:
+            if self.rng.random() < item_config["probability"]:
+                item_candidates.append(item_config["name"])
+        
+        if item_candidates:
+            item_type = self.rng.choice(item_candidates)
+            item_x = destroyed_brick.x + destroyed_brick.width // 2 - self.config.ITEM_SIZE // 2
+            item_y = destroyed_brick.y
+            self.create_item(item_x, item_y, item_type)
+    
+    def _update_items(self):
+        """Update all items and handle item-related logic"""
+        # Update all items
+        items_to_remove = []
+        
+        for item in self.items:
+            item.update()
+            
+            # Check if item is off the bottom of the screen
+            if item.y > self.config.SCREEN_HEIGHT:
+                items_to_remove.append(item)
+                continue
+            
+            # Check for collision with paddle
+            if self.collision_manager.check_item_paddle_collision([item], self.paddle):
+                # Apply item effect
+                item.apply_effect(self)
+                items_to_remove.append(item)
+                
+                # Show message about item effect
+                message = f"Power-up: {item.item_type.upper()}"
+                self.show_message(
+                    message, self.config.FONT_SIZE_SMALL, 2000,
+                    y=50, color=item.color)
+        
+        # Remove used or lost items
+        self.release_items(items_to_remove)
+    
+    def _is_level_cleared(self):
+        """Check if all breakable bricks are destroyed"""
+        return self.level.get_breakable_brick_count() == 0
+    
+    def _start_next_level(self):
+        """Start the next level"""
+        self.level_number += 1
+        
+        # Create a new level
+        self.level = Level(self.config, self.level_number, self.rng)
+        self.bricks = self.level.create_bricks(Brick)
+        
+        # Reset paddle and create a new ball
+        self._cancel_timed_effects()
+        self.paddle.reset_size()
+        self._create_initial_ball()
+        
+        # Clear items
+        self.release_items()
+        
+        # Update game state
+        self.state = "playing"
+        
+        # Display level message
+        self.show_message(
+            f"Level {self.level_number}",
+            self.config.FONT_SIZE_LARGE, 2000)
+    
+    def _reset_game(self):
+        """Reset game to initial state"""
+        self.score = 0
+        self.lives = self.config.STARTING_LIVES
+        self.level_number = 1
+        
+        # Reset game objects
+        self._init_game_objects()
+        
+        # Clear items
+        self.release_items()
+        
+        # Clear scheduled events
+        self.scheduler.clear()
+        self.active_effects.clear()
+    
+    def schedule_event(self, delay_ms, callback, *args):
+        """
+        Schedule callback(*args) to run after the specified delay in game time
+        Returns a handle whose cancel() method stops the event
+        """
+        delay_ticks = round(delay_ms / self.step_ms)
+        return self.scheduler.schedule(delay_ticks, callback, *args)
+    
+    def start_timed_effect(self, name, duration_ms):
+        """
+        Start a timed power-up effect, or extend it if it is already running.
+        When the time is up, Item.end_effect undoes it.
+        Returns True if the effect was newly started, False if it was extended
+        """
+        end_event = self.active_effects.get(name)
+        already_active = end_event is not None and end_event.is_pending()
+        if already_active:
+            end_event.cancel()
+        
+        self.active_effects[name] = self.schedule_event(duration_ms, self._end_timed_effect, name)
+        return not already_active
+    
+    def is_effect_active(self, name):
+        """Check if a timed power-up effect is currently running"""
+        end_event = self.active_effects.get(name)
+        return end_event is not None and end_event.is_pending()
+    
+    def _end_timed_effect(self, name):
+        """Undo a timed power-up effect once its time is up"""
+        self.active_effects.pop(name, None)
+        Item.end_effect(self, name)
+    
+    def _cancel_timed_effects(self):
+        """Drop running timed effects without undoing them (e.g. on a new level)"""
+        for end_event in self.active_effects.values():
+            end_event.cancel()
+        self.active_effects.clear()
+    
+    def next_level(self):
+        """Advance to the next level (called from item effect)"""
+        self.state = "level_cleared"
+        self.schedule_event(1000, self._start_next_level)
+    
+    def enable_laser_mode(self, duration_ms):
+        """Enable laser mode for the paddle (called from item effect)"""
+        # This is a placeholder for a potential feature
+        # Implementation would involve adding laser functionality to the paddle
+        self.show_message(
+            "Laser mode activated!",
+            self.config.FONT_SIZE_SMALL, 2000,
+            y=80, color=self.config.COLOR_PURPLE)
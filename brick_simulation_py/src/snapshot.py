@@ -0,0 +1,298 @@
+"""
+Snapshots - save and restore the complete simulation state as a compact binary buffer
+"""
+import struct
+from array import array
+from collections import deque
+
+from .components.brick import Brick
+from .components.level import Level
+
+SNAPSHOT_MAGIC = b"BRSN"
+SNAPSHOT_VERSION = 1
+
+STATES = ("start", "playing", "paused", "level_cleared", "game_over")
+BRICK_TYPES = ("normal", "strong", "unbreakable")
+ITEM_TYPES = ("extend", "slow", "multi", "life", "laser", "fast", "warp")
+
+# magic, version, state, lives, level, score, seed, tick, gauss flag, gauss value
+_HEADER = struct.Struct("<4sBBhHqQQ?d")
+_PADDLE = struct.Struct("<5d")  # x, y, width, previous x, previous y
+_BALL = struct.Struct("<6d?")  # x, y, speed x, speed y, previous x, previous y, launched
+_ITEM = struct.Struct("<4dB")  # x, y, previous x, previous y, type
+_COUNT = struct.Struct("<I")
+_TIMER = struct.Struct("<QBB")  # due tick, callback name length, argument count
+
+def _pack_brick_layout(bricks):
+    """Pack the parts of the bricks that don't change during a level"""
+    count = len(bricks)
+    positions = array("d", [0.0]) * (count * 4)
+    colors = bytearray(count * 3)
+    types = bytearray(count)
+    points = array("H", [0]) * count
+    
+    for i, brick in enumerate(bricks):
+        positions[i * 4:i * 4 + 4] = array("d", (brick.x, brick.y, brick.width, brick.height))
+        colors[i * 3:i * 3 + 3] = bytes(int(channel) for channel in brick.base_color)
+        types[i] = BRICK_TYPES.index(brick.brick_type)
+        points[i] = brick.points
+    
+    return positions.tobytes() + bytes(colors) + bytes(types) + points.tobytes()
+
+def _unpack_brick_layout(data, count, brick_class=Brick):
+    """Create bricks from a packed layout"""
+    positions = array("d")
+    positions.frombytes(data[:count * 32])
+    offset = count * 32
+    colors = data[offset:offset + count * 3]
+    offset += count * 3
+    types = data[offset:offset + count]
+    offset += count
+    points = array("H")
+    points.frombytes(data[offset:offset + count * 2])
+    
+    bricks = []
+    for i in range(count):
+        x, y, width, height = positions[i * 4:i * 4 + 4]
+        color = tuple(colors[i * 3:i * 3 + 3])
+        bricks.append(brick_class(x, y, width, height, color, BRICK_TYPES[types[i]], points[i]))
+    return bricks
+
+class SnapshotManager:
+    """
+    SnapshotManager turns a Simulation into bytes and back.
+    Bricks are stored as packed arrays; the layout part (position, size, type,
+    color, points) only changes between levels, so it is packed once per level
+    and reused. save() copies it into the snapshot so the buffer stands on its
+    own; save_split() leaves it out and returns the shared layout alongside, so
+    many snapshots of a level can refer to one copy of it.
+    Restoring onto the same level updates the existing bricks in place.
+    """
+    def __init__(self):
+        self._layout_bricks = None  # Brick list the cached layout was packed from
+        self._layout = b""
+    
+    def _get_layout(self, bricks):
+        """Packed layout for a brick list, cached per list"""
+        if bricks is not self._layout_bricks:
+            self._layout = _pack_brick_layout(bricks)
+            self._layout_bricks = bricks
+        return self._layout
+    
+    def save(self, simulation, include_layout=True):
+        """
+        Serialize the simulation state into a bytes buffer
+        With include_layout=False the brick layout is left out, and restore()
+        must be given it (see save_split)
+        """
+        rng_version, rng_internal, gauss_next = simulation.rng.getstate()
+        parts = [_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, STATES.index(simulation.state),
+            simulation.lives, simulation.level_number, simulation.score,
+            simulation.seed, simulation.scheduler.tick,
+            gauss_next is not None, gauss_next or 0.0)]
+        
+        # Random number generator
+        parts.append(array("I", rng_internal).tobytes())
+        
+        # Paddle
+        paddle = simulation.paddle
+        parts.append(_PADDLE.pack(paddle.x, paddle.y, paddle.width,
+                                  paddle.previous_x, paddle.previous_y))
+        
+        # Balls
+        parts.append(_COUNT.pack(len(simulation.balls)))
+        for ball in simulation.balls:
+            parts.append(_BALL.pack(ball.x, ball.y, ball.speed_x, ball.speed_y,
+                                    ball.previous_x, ball.previous_y, ball.is_launched))
+        
+        # Items
+        parts.append(_COUNT.pack(len(simulation.items)))
+        for item in simulation.items:
+            parts.append(_ITEM.pack(item.x, item.y, item.previous_x, item.previous_y,
+                                    ITEM_TYPES.index(item.item_type)))
+        
+        # Bricks: cached layout + per-brick hits and active flags
+        bricks = simulation.bricks
+        layout = self._get_layout(bricks) if include_layout else b""
+        parts.append(_COUNT.pack(len(bricks)))
+        parts.append(_COUNT.pack(len(layout)))
+        parts.append(layout)
+        parts.append(array("H", [min(brick.current_hits, 0xFFFF) for brick in bricks]).tobytes())
+        parts.append(bytes([brick.active for brick in bricks]))
+        
+        # Pending timers, stored by the name of the Simulation method they call
+        timers = simulation.scheduler.pending_events()
+        parts.append(_COUNT.pack(len(timers)))
+        for event in timers:
+            if getattr(event.callback, "__self__", None) is not simulation:
+                raise ValueError(f"Cannot snapshot timer callback {event.callback!r}")
+            name = event.callback.__name__.encode()
+            parts.append(_TIMER.pack(event.due_tick, len(name), len(event.args)))
+            parts.append(name)
+            for arg in event.args:
+                arg = str(arg).encode()
+                parts.append(bytes([len(arg)]) + arg)
+        
+        return b"".join(parts)
+    
+    def save_split(self, simulation):
+        """
+        Snapshot without the brick layout, plus the layout itself
+        Returns (layout, data); the layout is the same bytes object for every
+        snapshot of a level, so keeping both stores the layout only once
+        """
+        data = self.save(simulation, include_layout=False)
+        return self._get_layout(simulation.bricks), data
+    
+    def restore(self, simulation, data, layout=None):
+        """
+        Put the simulation back into the state stored in data
+        layout is the brick layout for snapshots saved without one (see save_split)
+        """
+        data = memoryview(data)
+        (magic, version, state, lives, level_number, score, seed, tick,
+         has_gauss, gauss_next) = _HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("Not a compatible snapshot")
+        offset = _HEADER.size
+        
+        simulation.state = STATES[state]
+        simulation.lives = lives
+        simulation.score = score
+        simulation.seed = seed
+        
+        # Random number generator
+        rng_internal = array("I")
+        rng_internal.frombytes(data[offset:offset + 625 * 4])
+        offset += 625 * 4
+        simulation.rng.setstate((3, tuple(rng_internal), gauss_next if has_gauss else None))
+        
+        # Paddle
+        paddle = simulation.paddle
+        paddle.x, paddle.y, paddle.width, paddle.previous_x, paddle.previous_y = \
+            _PADDLE.unpack_from(data, offset)
+        offset += _PADDLE.size
+        
+        # Balls (existing ball objects are reused)
+        count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        balls = simulation.balls
+        simulation.release_balls(balls[count:])
+        while len(balls) < count:
+            balls.append(simulation.create_ball(0, 0))
+        for ball in balls:
+            (ball.x, ball.y, ball.speed_x, ball.speed_y,
+             ball.previous_x, ball.previous_y, ball.is_launched) = _BALL.unpack_from(data, offset)
+            offset += _BALL.size
+        
+        # Items (recycled through the item pools)
+        count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        simulation.release_items()
+        for _ in range(count):
+            x, y, previous_x, previous_y, item_type = _ITEM.unpack_from(data, offset)
+            offset += _ITEM.size
+            simulation.create_item(x, y, ITEM_TYPES[item_type])
+            item = simulation.items[-1]
+            item.previous_x, item.previous_y = previous_x, previous_y
+        
+        # Bricks
+        count, = _COUNT.unpack_from(data, offset)
+        layout_size, = _COUNT.unpack_from(data, offset + _COUNT.size)
+        offset += _COUNT.size * 2
+        if layout is None:
+            layout = data[offset:offset + layout_size]
+        offset += layout_size
+        hits = array("H")
+        hits.frombytes(data[offset:offset + count * 2])
+        offset += count * 2
+        active = data[offset:offset + count]
+        offset += count
+        
+        same_level = (simulation.level_number == level_number and
+                      len(simulation.bricks) == count and
+                      self._get_layout(simulation.bricks) == layout)
+        if same_level:
+            # Same layout: only update bricks whose state changed
+            level = simulation.level
+            for brick, brick_hits, brick_active in zip(simulation.bricks, hits, active):
+                brick_active = bool(brick_active)
+                if brick.current_hits != brick_hits or brick.active != brick_active:
+                    level.set_brick_state(brick, brick_hits, brick_active)
+        else:
+            # Different level: rebuild it from the stored layout
+            level = Level(simulation.config, level_number, simulation.rng)
+            bricks = _unpack_brick_layout(bytes(layout), count, level.make_brick_class(Brick))
+            for brick, brick_hits, brick_active in zip(bricks, hits, active):
+                brick.restore_hits(brick_hits, bool(brick_active))
+            simulation.level_number = level_number
+            simulation.level = level
+            simulation.bricks = level.set_bricks(bricks)
+        
+        if simulation.batch_collision_manager is not None:
+            simulation.batch_collision_manager.invalidate()
+        
+        # Pending timers
+        count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        scheduler = simulation.scheduler
+        scheduler.clear()
+        scheduler.tick = tick
+        simulation.active_effects.clear()
+        for _ in range(count):
+            due_tick, name_length, arg_count = _TIMER.unpack_from(data, offset)
+            offset += _TIMER.size
+            name = bytes(data[offset:offset + name_length]).decode()
+            offset += name_length
+            args = []
+            for _ in range(arg_count):
+                arg_length = data[offset]
+                args.append(bytes(data[offset + 1:offset + 1 + arg_length]).decode())
+                offset += 1 + arg_length
+            
+            event = scheduler.schedule(due_tick - tick, getattr(simulation, name), *args)
+            if name == "_end_timed_effect":
+                simulation.active_effects[args[0]] = event
+
+class RewindBuffer:
+    """
+    RewindBuffer keeps snapshots of the most recent steps in a ring buffer,
+    so the simulation can be rewound or jump to any of those steps.
+    Entries are (layout, snapshot) pairs from SnapshotManager.save_split, so
+    the snapshots of one level share a single copy of its brick layout.
+    """
+    def __init__(self, capacity):
+        self.snapshots = deque(maxlen=capacity)
+        self.snapshot_manager = SnapshotManager()
+    
+    def record(self, simulation):
+        """Take a snapshot of the current step"""
+        self.snapshots.append(self.snapshot_manager.save_split(simulation))
+    
+    def rewind(self, simulation, steps):
+        """
+        Go back the given number of recorded steps (as far as the buffer allows)
+        Newer snapshots are dropped, so recording continues from the restored step.
+        Returns the number of steps actually rewound
+        """
+        if not self.snapshots:
+            return 0
+        steps = min(steps, len(self.snapshots) - 1)
+        for _ in range(steps):
+            self.snapshots.pop()
+        layout, data = self.snapshots[-1]
+        self.snapshot_manager.restore(simulation, data, layout)
+        return steps
+    
+    def jump(self, simulation, index):
+        """Restore the snapshot at the given buffer index (0 is the oldest) without dropping any"""
+        layout, data = self.snapshots[index]
+        self.snapshot_manager.restore(simulation, data, layout)
+    
+    def clear(self):
+        """Drop all snapshots"""
+        self.snapshots.clear()
+    
+    def __len__(self):
+        return len(self.snapshots)
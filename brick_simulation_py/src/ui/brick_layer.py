@@ -0,0 +1,65 @@
+"""
+Brick layer - keeps the brick field pre-rendered on an offscreen surface
+"""
+import pygame
+
+class BrickLayer:
+    """
+    BrickLayer holds the background and every live brick drawn on one surface.
+    Bricks only change when they are hit, so the layer is redrawn in full only
+    when a new set of bricks appears (new level, snapshot restore); otherwise
+    just the bricks the level reports as changed are repainted.
+    The game copies regions of the layer to the screen to erase moving objects.
+    """
+    def __init__(self, config, background=(0, 0, 0), atlas=None):
+        self.background = background
+        self.atlas = atlas  # TextureAtlas brick sprites are drawn from, if any
+        self.surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)).convert()
+        self.level = None  # Level the layer shows
+        self.bricks = None  # That level's brick list when the layer was drawn
+    
+    def sync(self, level):
+        """
+        Bring the layer up to date with level
+        Returns the Rects of the layer that changed (the whole layer when redrawn)
+        """
+        if level is not self.level or level.bricks is not self.bricks:
+            self.redraw(level)
+            return [self.surface.get_rect()]
+        
+        changed = level.changed_bricks
+        if not changed:
+            return []
+        
+        surface = self.surface
+        rects = []
+        for brick in changed:
+            rect = pygame.Rect(brick.x, brick.y, brick.width, brick.height)
+            surface.fill(self.background, rect)
+            rects.append(rect)
+        self._draw_bricks([brick for brick in changed if brick.is_active()])
+        changed.clear()
+        return rects
+    
+    def redraw(self, level):
+        """Draw the background and all of level's live bricks from scratch"""
+        self.level = level
+        self.bricks = level.bricks
+        level.changed_bricks = []
+        
+        self.surface.fill(self.background)
+        self._draw_bricks(level.live_bricks)
+    
+    def _draw_bricks(self, bricks):
+        """Draw bricks on the layer, sprites in one batch"""
+        surface = self.surface
+        atlas = self.atlas
+        blits = []
+        for brick in bricks:
+            blit = brick.get_blit(atlas)
+            if blit is None:
+                brick.render(surface)
+            else:
+                blits.append(blit)
+        if blits:
+            surface.blits(blits, doreturn=False)
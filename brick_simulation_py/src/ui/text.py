@@ -2,7 +2,7 @@
 Text UI component - handles text rendering and messages
 """
 import pygame
-from ..utils.helpers import draw_text
+from ..utils.helpers import draw_text, render_text
 
 class TextRenderer:
     """
@@ -11,26 +11,38 @@ class TextRenderer:
     def __init__(self, config):
         self.config = config
         self.messages = []  # List of (text, position, size, color, duration, start_time)
+        self._hud = {}  # {HUD field: (value, surface, rect)}, re-rendered when the value changes
         
     def draw_score(self, screen, score):
-        """Draw the score at the top left of the screen"""
-        draw_text(screen, f"Score: {score}", 
-                 self.config.FONT_SIZE_SMALL,
-                 10, 20, self.config.TEXT_COLOR, align="left")
+        """Draw the score at the top left of the screen; returns the Rect drawn"""
+        return self._draw_hud_field(screen, "score", score, "Score: {}", 10, "left")
     
     def draw_lives(self, screen, lives):
-        """Draw the lives at the top right of the screen"""
-        draw_text(screen, f"Lives: {lives}",
-                 self.config.FONT_SIZE_SMALL,
-                 self.config.SCREEN_WIDTH - 10, 20, 
-                 self.config.TEXT_COLOR, align="right")
+        """Draw the lives at the top right of the screen; returns the Rect drawn"""
+        return self._draw_hud_field(screen, "lives", lives, "Lives: {}",
+                             self.config.SCREEN_WIDTH - 10, "right")
     
     def draw_level(self, screen, level):
-        """Draw the current level at the top center of the screen"""
-        draw_text(screen, f"Level {level}", 
-                 self.config.FONT_SIZE_SMALL,
-                 self.config.SCREEN_WIDTH // 2, 20, 
-                 self.config.TEXT_COLOR, align="center")
+        """Draw the current level at the top center of the screen; returns the Rect drawn"""
+        return self._draw_hud_field(screen, "level", level, "Level {}",
+                             self.config.SCREEN_WIDTH // 2, "center")
+    
+    def _draw_hud_field(self, screen, field, value, text_format, x, align):
+        """Draw a HUD line at the top of the screen, rendering it only when value changes"""
+        cached = self._hud.get(field)
+        if cached is None or cached[0] != value:
+            surface = render_text(text_format.format(value), self.config.FONT_SIZE_SMALL,
+                                  self.config.TEXT_COLOR)
+            rect = surface.get_rect()
+            rect.centery = 20
+            if align == "left":
+                rect.left = x
+            elif align == "right":
+                rect.right = x
+            else:
+                rect.centerx = x
+            cached = self._hud[field] = (value, surface, rect)
+        return screen.blit(cached[1], cached[2])
     
     def draw_message(self, screen, text, size, y=None, color=None, align="center"):
         """Draw a message on the screen"""
@@ -68,27 +80,29 @@ class TextRenderer:
                         if current_time - msg['start_time'] < msg['duration']]
     
     def draw_timed_messages(self, screen):
-        """Draw all active timed messages"""
+        """Draw all active timed messages; returns the list of Rects drawn"""
+        rects = []
         for msg in self.messages:
             # Make the message fade out towards the end of its duration
             elapsed = pygame.time.get_ticks() - msg['start_time']
             remaining = msg['duration'] - elapsed
             
+            # Rendered once at full opacity through the text cache; a fading
+            # message gets its own copy whose alpha changes every frame
+            surface = render_text(msg['text'], msg['size'], msg['color'])
+            
             # If less than 500ms left, start fading
             if remaining < 500:
-                alpha = int(255 * remaining / 500)
-            else:
-                alpha = 255
-                
-            # Create a copy of the color with the new alpha
-            color = list(msg['color'])
-            if len(color) == 3:
-                color.append(alpha)
-            else:
-                color[3] = alpha
-                
-            draw_text(screen, msg['text'], msg['size'], 
-                     self.config.SCREEN_WIDTH // 2, msg['y'], color)
+                faded = msg.get('faded')
+                if faded is None:
+                    faded = msg['faded'] = surface.copy()
+                faded.set_alpha(max(0, int(255 * remaining / 500)))
+                surface = faded
+            
+            rect = surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, msg['y']))
+            screen.blit(surface, rect)
+            rects.append(rect)
+        return rects
     
     def draw_game_over(self, screen, score):
         """Draw the game over screen"""
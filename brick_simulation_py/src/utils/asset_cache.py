@@ -0,0 +1,90 @@
+"""
+Asset cache - process-wide cache of decoded images, shared by every component
+"""
+from collections import OrderedDict
+
+# Size charged for remembering that a file doesn't exist
+MISSING_ENTRY_BYTES = 64
+
+class AssetCache:
+    """
+    AssetCache keeps decoded assets keyed by path, so each file is read and
+    decoded once per process no matter how many objects use it.
+    Missing files are remembered too, so asking again doesn't touch the disk.
+    Memory is bounded: when the cached surfaces add up to more than max_bytes
+    the least recently used entries are dropped (objects that already hold a
+    surface keep it; the cache just forgets it).
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()  # {key: (asset or None, size in bytes)}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key, loader):
+        """
+        Return the cached asset for key, calling loader() to load it on a miss
+        loader returns the asset, or None if the file doesn't exist; if it raises,
+        nothing is cached and the exception propagates
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        
+        self.misses += 1
+        asset = loader()
+        self.put(key, asset)
+        return asset
+    
+    def put(self, key, asset):
+        """Store an asset (None records a missing file)"""
+        size = self._get_size(asset)
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        self.entries[key] = (asset, size)
+        self.total_bytes += size
+        self._evict()
+    
+    def resize(self, max_bytes):
+        """Change the memory limit, evicting entries if needed"""
+        self.max_bytes = max_bytes
+        self._evict()
+    
+    def _evict(self):
+        """Drop least recently used entries until under the memory limit"""
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+    
+    def _get_size(self, asset):
+        """Approximate memory used by an asset"""
+        if asset is None:
+            return MISSING_ENTRY_BYTES
+        if hasattr(asset, "get_bytesize"):
+            width, height = asset.get_size()
+            return width * height * asset.get_bytesize()
+        return len(asset) if hasattr(asset, "__len__") else MISSING_ENTRY_BYTES
+    
+    def clear(self):
+        """Forget all cached assets"""
+        self.entries.clear()
+        self.total_bytes = 0
+    
+    def __contains__(self, key):
+        return key in self.entries
+    
+    def __len__(self):
+        return len(self.entries)
+
+# The cache shared by the whole process
+asset_cache = AssetCache()
+
+# Sprites scaled to the size they are drawn at, keyed by (sprite, width, height)
+scaled_cache = AssetCache()
+
+# Rendered text surfaces, keyed by (text, size, color)
+text_cache = AssetCache(max_bytes=4 * 1024 * 1024)
@@ -0,0 +1,168 @@
+"""
+Asset pack - all game assets in one file with an index, read through mmap
+"""
+import argparse
+import io
+import mmap
+import os
+import struct
+
+MAGIC = b"BRICPAK1"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # Magic, format version, number of entries
+ENTRY = struct.Struct("<QQH")  # Data offset, data size, name length (the UTF-8 name follows)
+
+class AssetPack:
+    """
+    AssetPack reads a pack written by write_pack.
+    The file is memory-mapped and only its index is parsed up front; get()
+    returns a memoryview slice of the mapping, so nothing is copied or read
+    from disk until an entry is actually decoded.
+    Entry names are paths relative to the asset directory, with "/" separators
+    (e.g. "images/bricks/normal.png").
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # {name: (offset, size)}
+        with open(path, "rb") as pack_file:
+            try:
+                self._data = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Filesystems without mmap support (e.g. some virtual ones): read it once
+                self._data = pack_file.read()
+        self._view = memoryview(self._data)
+        self._read_index()
+    
+    def _read_index(self):
+        """Parse the header and the index of entries"""
+        magic, version, count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} asset pack")
+        position = HEADER.size
+        for _ in range(count):
+            offset, size, name_length = ENTRY.unpack_from(self._data, position)
+            position += ENTRY.size
+            name = bytes(self._view[position:position + name_length]).decode("utf-8")
+            position += name_length
+            self.entries[name] = (offset, size)
+    
+    def get(self, name):
+        """Contents of an entry as a zero-copy memoryview, or None if it isn't in the pack"""
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        offset, size = entry
+        return self._view[offset:offset + size]
+    
+    def open(self, name):
+        """A read-only file object over an entry, or None if it isn't in the pack"""
+        data = self.get(name)
+        return EntryReader(data) if data is not None else None
+    
+    def has_directory(self, directory):
+        """Check if the pack holds any entry under directory (e.g. "images")"""
+        prefix = directory.rstrip("/") + "/"
+        return any(name.startswith(prefix) for name in self.entries)
+    
+    def close(self):
+        """Release the mapping (slices returned by get() must no longer be in use)"""
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+    
+    def __contains__(self, name):
+        return name in self.entries
+    
+    def __len__(self):
+        return len(self.entries)
+
+class EntryReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a slice of the pack.
+    Decoders read the entry straight out of the mapping in the chunks they
+    ask for, so the entry is never copied as a whole.
+    """
+    def __init__(self, data):
+        self._data = data
+        self._position = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def readinto(self, buffer):
+        chunk = self._data[self._position:self._position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._position += size
+        return size
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._data)
+        self._position = max(0, offset)
+        return self._position
+    
+    def tell(self):
+        return self._position
+
+def write_pack(path, asset_dir):
+    """
+    Write every file under asset_dir into a pack at path
+    Returns the number of entries written
+    """
+    files = []
+    for directory, subdirectories, names in os.walk(asset_dir):
+        subdirectories.sort()
+        for file_name in sorted(names):
+            file_path = os.path.join(directory, file_name)
+            if os.path.abspath(file_path) != os.path.abspath(path):
+                name = os.path.relpath(file_path, asset_dir).replace(os.sep, "/")
+                files.append((name.encode("utf-8"), file_path))
+    
+    # Data starts right after the index, so offsets are known before writing
+    offset = HEADER.size + sum(ENTRY.size + len(name) for name, _ in files)
+    index = []
+    for name, file_path in files:
+        size = os.path.getsize(file_path)
+        index.append(ENTRY.pack(offset, size, len(name)) + name)
+        offset += size
+    
+    with open(path, "wb") as pack_file:
+        pack_file.write(HEADER.pack(MAGIC, VERSION, len(files)))
+        pack_file.write(b"".join(index))
+        for _, file_path in files:
+            with open(file_path, "rb") as asset_file:
+                pack_file.write(asset_file.read())
+    return len(files)
+
+# The pack the game loads assets from, if one was opened (see open_pack)
+asset_pack = None
+
+def open_pack(path):
+    """
+    Use the pack at path for loading assets
+    Returns the pack, or None if there is no pack there (assets then load
+    from loose files)
+    """
+    global asset_pack
+    if asset_pack is not None and asset_pack.path == path:
+        return asset_pack
+    asset_pack = AssetPack(path) if os.path.exists(path) else None
+    return asset_pack
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the game's images, fonts and sounds into one file")
+    parser.add_argument("--assets", default="assets", help="Asset directory to pack")
+    parser.add_argument("--output", default="assets.pack", help="Pack file to write")
+    args = parser.parse_args()
+    
+    count = write_pack(args.output, args.assets)
+    print(f"Wrote {args.output}: {count} assets, {os.path.getsize(args.output) / 1024:.1f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,80 @@ Helper utilities for Bric game
 """
 import os
 import pygame
+from .asset_cache import asset_cache, scaled_cache, text_cache
+from . import asset_pack
+
+_fonts = {}  # {size: Font}
+
+FONT_FILE = "default.ttf"  # Used instead of the system font when it is in assets/fonts/
+
+def open_asset(name):
+    """
+    Open an asset by its name under the assets directory (e.g. "images/ball/ball.png")
+    Returns a file object read from the asset pack if one is open, else the
+    path of the loose file, or None if the asset exists in neither.
+    """
+    pack = asset_pack.asset_pack
+    if pack is not None:
+        source = pack.open(name)
+        if source is not None:
+            return source
+    asset_path = os.path.join("assets", *name.split("/"))
+    return asset_path if os.path.exists(asset_path) else None
+
+def has_assets(directory):
+    """Check if there are any assets under directory (e.g. "images"), packed or loose"""
+    pack = asset_pack.asset_pack
+    if pack is not None and pack.has_directory(directory):
+        return True
+    asset_path = os.path.join("assets", directory)
+    return os.path.isdir(asset_path) and bool(os.listdir(asset_path))
 
 def load_image(filename, alpha=True):
     """
     Attempts to load an image from the assets directory.
     Returns None if the file doesn't exist.
+    Images are decoded once per process and then served from the shared asset cache.
     """
+    name = "images/" + filename
     try:
-        asset_path = os.path.join("assets", "images", filename)
-        if not os.path.exists(asset_path):
-            return None
-        
-        if alpha:
-            return pygame.image.load(asset_path).convert_alpha()
-        else:
-            return pygame.image.load(asset_path).convert()
+        return asset_cache.get((name, alpha), lambda: _read_image(name, alpha))
     except (pygame.error, FileNotFoundError):
         return None
+
+def _read_image(name, alpha):
+    """Read and decode an image, None if it doesn't exist"""
+    source = open_asset(name)
+    if source is None:
+        return None
+    
+    # The name hint tells pygame the format when decoding from a file object
+    image = pygame.image.load(source, name)
+    if alpha:
+        return image.convert_alpha()
+    else:
+        return image.convert()
+
+def load_font(filename, size):
+    """
+    Load a font file from the assets directory at the given size.
+    Returns None if the file doesn't exist.
+    """
+    source = open_asset("fonts/" + filename)
+    if source is None:
+        return None
+    try:
+        return pygame.font.Font(source, size)
+    except (pygame.error, OSError):
+        return None
+
+def scale_sprite(sprite, width, height):
+    """
+    Return sprite scaled to width x height, from the shared scaled-sprite cache
+    Objects of the same size share one scaled surface, so drawing never scales.
+    """
+    size = (int(width), int(height))
+    return scaled_cache.get((sprite, size), lambda: pygame.transform.scale(sprite, size))
         
 def calculate_brick_position(row, col, config):
     """
@@ -35,12 +92,31 @@ def clamp(value, min_value, max_value):
     """
     return max(min(value, max_value), min_value)
 
+def get_font(size):
+    """
+    Return the default font at the given size: FONT_FILE from the assets if
+    there is one, else the system font.
+    Fonts are created once per size and reused.
+    """
+    font = _fonts.get(size)
+    if font is None:
+        font = load_font(FONT_FILE, size) or pygame.font.SysFont(None, size)
+        _fonts[size] = font
+    return font
+
+def render_text(text, size, color=(255, 255, 255)):
+    """
+    Return a surface with the text rendered in the default font.
+    Surfaces are cached by (text, size, color), so unchanged text isn't rendered again.
+    """
+    color = tuple(color)
+    return text_cache.get((text, size, color), lambda: get_font(size).render(text, True, color))
+
 def draw_text(screen, text, size, x, y, color=(255, 255, 255), align="center"):
     """
     Draw text on the screen with specified alignment.
     """
-    font = pygame.font.SysFont(None, size)
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(text, size, color)
     text_rect = text_surface.get_rect()
     
     if align == "center":
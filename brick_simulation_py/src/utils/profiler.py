@@ -0,0 +1,158 @@
+"""
+Frame profiler - times each phase of a frame and reports percentiles and hitches
+"""
+import json
+import time
+from array import array
+
+# Phases in the order they happen during a frame
+PHASES = ("events", "paddle", "balls", "items", "scheduler", "draw_objects", "draw_ui", "flip")
+
+class FrameProfiler:
+    """
+    FrameProfiler records how long each phase of a frame takes.
+    Phases are timed as laps: mark(phase) charges the time since the previous
+    mark to that phase, so instrumenting a frame costs one clock read per phase.
+    Phases that run several times per frame (e.g. simulation steps) add up.
+    The last `capacity` frames are kept in fixed-size ring buffers, one per
+    phase, so the profiler can stay on all the time without growing.
+    """
+    def __init__(self, capacity=600, hitch_ms=25.0, phases=PHASES):
+        self.capacity = capacity
+        self.hitch_ms = hitch_ms  # Frames longer than this count as hitches
+        self.phases = list(phases)  # New phases are added the first time they are marked
+        self.samples = {}  # {phase: array of ms per frame}, plus "work" and "frame"
+        for phase in self.phases + ["work", "frame"]:
+            self.samples[phase] = array("d", bytes(8 * capacity))
+        self.index = 0  # Next slot in the ring buffers
+        self.frame_count = 0
+        self.hitches = 0  # Total since the profiler was created
+        self._current = dict.fromkeys(self.phases, 0.0)
+        self._frame_ms = 0.0
+        self._frame_start = self._lap = time.perf_counter()
+    
+    def begin_frame(self, frame_ms=0.0):
+        """
+        Start timing a new frame
+        frame_ms is the time since the previous frame (e.g. from clock.tick)
+        """
+        for phase in self._current:
+            self._current[phase] = 0.0
+        self._frame_ms = frame_ms
+        self._frame_start = self._lap = time.perf_counter()
+    
+    def mark(self, phase):
+        """Charge the time since the previous mark to phase"""
+        now = time.perf_counter()
+        elapsed = (now - self._lap) * 1000.0
+        self._lap = now
+        if phase in self._current:
+            self._current[phase] += elapsed
+        else:
+            self._add_phase(phase)
+            self._current[phase] = elapsed
+    
+    def skip(self):
+        """Restart the lap without charging the time to any phase"""
+        self._lap = time.perf_counter()
+    
+    def end_frame(self):
+        """Finish the frame and store its timings"""
+        work = (time.perf_counter() - self._frame_start) * 1000.0
+        frame = max(self._frame_ms, work)
+        index = self.index
+        for phase, elapsed in self._current.items():
+            self.samples[phase][index] = elapsed
+        self.samples["work"][index] = work
+        self.samples["frame"][index] = frame
+        
+        if frame > self.hitch_ms:
+            self.hitches += 1
+        self.index = (index + 1) % self.capacity
+        self.frame_count += 1
+    
+    def _add_phase(self, phase):
+        """Start tracking a phase that wasn't known before"""
+        self.phases.append(phase)
+        self.samples[phase] = array("d", bytes(8 * self.capacity))
+    
+    def _window(self, phase):
+        """Samples of the stored frames for a phase, oldest first"""
+        samples = self.samples[phase]
+        if self.frame_count < self.capacity:
+            return samples[:self.frame_count]
+        return samples[self.index:] + samples[:self.index]
+    
+    def stats(self, phase):
+        """Mean, p50, p95, p99 and max (ms) of a phase over the stored frames"""
+        values = sorted(self._window(phase))
+        if not values:
+            return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        
+        def percentile(fraction):
+            return values[min(len(values) - 1, int(fraction * len(values)))]
+        
+        return {
+            "mean": sum(values) / len(values),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "max": values[-1],
+        }
+    
+    def summary(self):
+        """Statistics for every phase plus frame totals and hitch counts"""
+        return {
+            "frames": self.frame_count,
+            "window": min(self.frame_count, self.capacity),
+            "hitch_ms": self.hitch_ms,
+            "hitches": self.hitches,
+            "window_hitches": sum(1 for frame in self._window("frame") if frame > self.hitch_ms),
+            "work": self.stats("work"),
+            "frame": self.stats("frame"),
+            "phases": {phase: self.stats(phase) for phase in self.phases},
+        }
+    
+    def export(self, path):
+        """Write the summary and the raw per-frame samples to a JSON file"""
+        data = self.summary()
+        data["samples"] = {phase: list(self._window(phase)) for phase in self.samples}
+        with open(path, "w") as profile_file:
+            json.dump(data, profile_file, indent=2)
+    
+    def overlay_lines(self):
+        """Short text lines describing the current timings, for an on-screen overlay"""
+        summary = self.summary()
+        frame = summary["frame"]
+        lines = [f"frame p50 {frame['p50']:.1f}  p95 {frame['p95']:.1f}  p99 {frame['p99']:.1f} ms  "
+                 f"hitches {summary['window_hitches']}/{summary['window']}"]
+        for phase, stats in summary["phases"].items():
+            lines.append(f"{phase:<13} p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  "
+                         f"p99 {stats['p99']:.2f}")
+        return lines
+
+class StartupTimer:
+    """
+    StartupTimer records named milestones during startup (imports, game
+    creation, first frame) as milliseconds since it was created
+    """
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.marks = []  # [(name, ms since start)]
+    
+    def mark(self, name):
+        """Record that a milestone was reached now"""
+        self.marks.append((name, (time.perf_counter() - self.start) * 1000.0))
+    
+    def as_dict(self):
+        """{milestone: ms since start}"""
+        return dict(self.marks)
+    
+    def report_lines(self):
+        """One line per milestone with its time and the time since the previous one"""
+        lines = []
+        previous = 0.0
+        for name, ms in self.marks:
+            lines.append(f"{name:<22} {ms:8.1f} ms  (+{ms - previous:.1f})")
+            previous = ms
+        return lines
@@ -0,0 +1,106 @@
+"""
+Startup timing report
+Measures import time and time to first frame of the game in fresh processes,
+for the plain source tree and for the web bundle built by build_web.py,
+with and without deferred startup.
+
+Usage: python startup_report.py [--bundle bric_game.zip] [--repeats N]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MILESTONES = ("import pygame", "import game", "display", "game created", "first frame", "startup finished")
+
+def measure(defer_startup):
+    """Start the game in this process and return {milestone: ms since start}"""
+    import time
+    start = time.perf_counter()
+    sys.path.insert(0, os.getcwd())
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    
+    import pygame
+    from src.utils.profiler import StartupTimer
+    timer = StartupTimer(start)
+    timer.mark("import pygame")
+    from src import config
+    from src.game import Game
+    timer.mark("import game")
+    
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    timer.mark("display")
+    game = Game(config, seed=0, defer_startup=defer_startup)
+    timer.mark("game created")
+    game.run_frame(0, [], present=lambda: timer.mark("first frame"))
+    timer.mark("startup finished")
+    return timer.as_dict()
+
+def run_scenario(directory, defer_startup, repeats, environment=None):
+    """
+    Median time of each startup step (ms from the previous milestone) over
+    repeats fresh processes started in directory
+    """
+    runs = []
+    for _ in range(repeats):
+        command = [sys.executable, os.path.abspath(__file__), "--child"]
+        if defer_startup:
+            command.append("--defer")
+        output = subprocess.run(command, cwd=directory, env=environment, check=True,
+                                capture_output=True, text=True).stdout
+        times = json.loads(output.strip().splitlines()[-1])
+        previous = 0.0
+        steps = {}
+        for name in MILESTONES:
+            steps[name] = times[name] - previous
+            previous = times[name]
+        steps["total"] = previous
+        runs.append(steps)
+    return {name: statistics.median(run[name] for run in runs) for name in MILESTONES + ("total",)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Bric Game startup times")
+    parser.add_argument("--bundle", default=os.path.join(ROOT, "bric_game.zip"),
+                        help="Web bundle to measure as well (see build_web.py)")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per scenario (median is shown)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--defer", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        print(json.dumps(measure(args.defer)))
+        return
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        # The browser compiles the game's sources on every load, so run them from
+        # a copy without cached bytecode and don't let the runs write any
+        source_dir = os.path.join(work_dir, "source")
+        shutil.copytree(os.path.join(ROOT, "src"), os.path.join(source_dir, "src"),
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        environment = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+        scenarios = [
+            ("source, eager", run_scenario(source_dir, False, args.repeats, environment)),
+            ("source, deferred", run_scenario(source_dir, True, args.repeats, environment)),
+        ]
+        if os.path.exists(args.bundle):
+            bundle_dir = os.path.join(work_dir, "bundle")
+            with zipfile.ZipFile(args.bundle) as archive:
+                archive.extractall(bundle_dir)
+            scenarios.append(("bundle, deferred", run_scenario(bundle_dir, True, args.repeats)))
+        else:
+            print(f"No bundle at {args.bundle}; run build_web.py to include it\n")
+    
+    print(f"{'ms per step (median of ' + str(args.repeats) + ')':<36}" +
+          "".join(f"{name:>18}" for name, _ in scenarios))
+    for milestone in MILESTONES + ("total",):
+        print(f"{milestone:<36}" + "".join(f"{times[milestone]:>18.1f}" for _, times in scenarios))
+
+if __name__ == "__main__":
+    main()
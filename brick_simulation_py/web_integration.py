@@ -2,17 +2,24 @@
 Web integration module for the Bric Game
 This module adapts the Pygame-based game for running in a web browser using Pyodide
 """
-import asyncio
+import sys
+import time
+_import_start = time.perf_counter()
 import pygame
 from src import config
 from src.game import Game
+from src.utils.profiler import StartupTimer
+
+# Startup milestones, logged to the console once the first frame is up
+startup_timer = StartupTimer(_import_start)
+startup_timer.mark("imports")
 
 # Flag to track if we're running in the browser
 is_browser = False
 
 try:
     from pyodide import create_proxy
-    from js import document, window, requestAnimationFrame, console
+    from js import document, window, requestAnimationFrame, cancelAnimationFrame, console
     is_browser = True
 except ImportError:
     pass  # Not running in browser/Pyodide
@@ -22,6 +29,23 @@ canvas = None
 ctx = None
 game = None
 running = False
+last_timestamp = None  # requestAnimationFrame timestamp of the previous frame
+
+# JavaScript proxies are created once and destroyed explicitly in stop_web_game_loop;
+# a proxy that is never destroyed keeps its Python function alive forever
+frame_proxy = None  # The requestAnimationFrame callback, reused every frame
+frame_request = None  # Id of the pending animation frame request
+handler_proxies = {}  # {event name: proxy of its listener}
+
+# Frame buffer shared with the canvas: one typed array and the ImageData wrapping it,
+# created on the first frame and refilled in place every frame after that
+frame_array = None
+frame_image = None
+uploaded_state = None  # Game state shown by the last full upload
+
+# Channel masks of a 32-bit surface whose bytes are already in canvas (RGBA) order
+RGBA_MASKS = ((0x000000FF, 0x0000FF00, 0x00FF0000, 0xFF000000) if sys.byteorder == "little"
+              else (0xFF000000, 0x00FF0000, 0x0000FF00, 0x000000FF))
 
 def init_web():
     """Initialize the web environment for the game"""
@@ -35,21 +59,22 @@ def init_web():
     pygame.display.init()
     pygame.font.init()
     
-    # Create a pygame Surface that matches the canvas size
-    surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    # Create a pygame Surface that matches the canvas size, with its bytes in
+    # canvas (RGBA) order so frames can be handed over without conversion
+    surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT),
+                             pygame.SRCALPHA, 32, masks=RGBA_MASKS)
     
     # Store the surface in pygame's display system
     pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), 
                           pygame.SRCALPHA, 
                           surface=surface)
     
-    # Initialize the game
-    game = Game(config)
-    
-    # Set up event handling for web
-    setup_event_handlers()
+    # Initialize the game; sprites, atlas, rewind buffer and pools are set up
+    # after the first frame is on screen
+    game = Game(config, defer_startup=True)
+    startup_timer.mark("game created")
     
-    # Start the game loop
+    # Start the game loop (this also sets up event handling for web)
     start_web_game_loop()
 
 def setup_event_handlers():
@@ -65,7 +90,8 @@ def setup_event_handlers():
             'p': pygame.K_p,
             'P': pygame.K_p,
             'Enter': pygame.K_RETURN,
-            'Escape': pygame.K_ESCAPE
+            'Escape': pygame.K_ESCAPE,
+            'F3': pygame.K_F3
         }
         
         key = key_map.get(event.key, None)
@@ -95,81 +121,149 @@ def setup_event_handlers():
             # Prevent default browser behavior
             event.preventDefault()
     
-    # Create proxies for the event handlers
-    keydown_proxy = create_proxy(keydown_handler)
-    keyup_proxy = create_proxy(keyup_handler)
-    
-    # Attach the event listeners
-    document.addEventListener('keydown', keydown_proxy)
-    document.addEventListener('keyup', keyup_proxy)
-
-def process_pygame_events():
-    """Process and handle pygame events in the web context"""
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            global running
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            game._handle_key_press(event.key)
-
-def render_to_canvas():
-    """Copy the pygame surface to the HTML canvas"""
+    # Create proxies for the event handlers and attach the event listeners
+    for event_name, handler in (('keydown', keydown_handler), ('keyup', keyup_handler)):
+        proxy = create_proxy(handler)
+        handler_proxies[event_name] = proxy
+        document.addEventListener(event_name, proxy)
+
+def remove_event_handlers():
+    """Detach the keyboard listeners and free their proxies"""
+    for event_name, proxy in handler_proxies.items():
+        document.removeEventListener(event_name, proxy)
+        proxy.destroy()
+    handler_proxies.clear()
+
+def get_frame_bytes(surface):
+    """
+    The surface's pixels as RGBA bytes: a view of the pixel memory itself when
+    the surface is already laid out that way, otherwise one converted copy
+    """
+    if (surface.get_bytesize() == 4 and surface.get_pitch() == surface.get_width() * 4
+            and surface.get_masks() == RGBA_MASKS):
+        return surface.get_buffer()
+    return pygame.image.tostring(surface, 'RGBA')
+
+def get_upload_rects():
+    """
+    Regions of the frame the canvas needs: None for the whole frame, otherwise
+    a list of Rects (empty when nothing changed)
+    While playing these are the game's dirty rectangles. The other screens
+    (start, pause, level cleared, game over) only change while timed messages
+    are fading out over them, so once those are gone they are uploaded once
+    until the state changes.
+    """
+    global uploaded_state
+    state = game.simulation.state
+    rects = game.dirty_rects
+    if rects is None:
+        if state == uploaded_state and state != "playing" and not game.show_profiler:
+            return []
+        # Keep uploading while messages are shown, plus once after the last one expires
+        uploaded_state = None if game.text_renderer.messages else state
+        return None
+    
+    uploaded_state = state
+    # Changes covering most of the screen are cheaper to send in one go
+    if sum(rect.width * rect.height for rect in rects) > config.SCREEN_WIDTH * config.SCREEN_HEIGHT // 2:
+        return None
+    return rects
+
+def render_to_canvas(rects=None):
+    """
+    Copy the pygame surface to the HTML canvas
+    With rects, only those regions are copied and drawn
+    """
+    global frame_array, frame_image
+    
     # Get the pygame surface
     surface = pygame.display.get_surface()
     
-    # Convert the surface to an image data URL
-    image_data = pygame.image.tostring(surface, 'RGBA')
-    
-    # Create an ImageData object and put it on the canvas
-    import js
-    uint8_array = js.Uint8ClampedArray.new(len(image_data))
-    for i in range(len(image_data)):
-        uint8_array[i] = image_data[i]
+    # The typed array and ImageData are allocated once; ImageData keeps a
+    # reference to the array, so refilling the array updates the image
+    if frame_image is None:
+        import js
+        frame_array = js.Uint8ClampedArray.new(config.SCREEN_WIDTH * config.SCREEN_HEIGHT * 4)
+        frame_image = js.ImageData.new(frame_array, config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
     
-    image_data = js.ImageData.new(
-        uint8_array, 
-        config.SCREEN_WIDTH,
-        config.SCREEN_HEIGHT
-    )
+    if rects is None:
+        # Copy the whole frame into the typed array in one bulk transfer
+        frame_array.assign(get_frame_bytes(surface))
+        ctx.putImageData(frame_image, 0, 0)
+        return
     
-    ctx.putImageData(image_data, 0, 0)
+    # Copy the rows each region spans (one contiguous block per region) and
+    # draw just the region with the dirty-rectangle form of putImageData
+    pixels = memoryview(get_frame_bytes(surface))
+    pitch = surface.get_width() * 4
+    screen_rect = surface.get_rect()
+    for rect in rects:
+        rect = rect.clip(screen_rect)
+        if not rect.width or not rect.height:
+            continue
+        start = rect.top * pitch
+        end = rect.bottom * pitch
+        frame_array.subarray(start, end).assign(pixels[start:end])
+        ctx.putImageData(frame_image, 0, 0, rect.x, rect.y, rect.width, rect.height)
+
+def present_frame():
+    """Copy the regions of the frame that changed to the canvas"""
+    render_to_canvas(get_upload_rects())
+    if startup_timer is not None and not game.startup_finished:
+        startup_timer.mark("first frame")
 
 def web_game_loop(timestamp):
-    """Main game loop for the web version"""
-    global running
+    """Main game loop for the web version, called once per animation frame"""
+    global running, last_timestamp, frame_request, startup_timer
     
     if not running:
         return
     
-    # Process events
-    process_pygame_events()
+    # Time since the previous animation frame (display refresh rates vary)
+    frame_ms = 0 if last_timestamp is None else timestamp - last_timestamp
+    last_timestamp = timestamp
     
-    # Update game state
-    if game.state == "playing":
-        game._update()
-    
-    # Process scheduled events
-    game._process_scheduled_events()
-    
-    # Render game
-    game._render()
+    # Same frame step as the desktop game, with the canvas upload as presentation
+    if not game.run_frame(frame_ms, pygame.event.get(), present_frame):
+        # Stop scheduling frames; the proxy is freed by stop_web_game_loop,
+        # not from inside its own call
+        running = False
+        frame_request = None
+        return
     
-    # Copy to canvas
-    render_to_canvas()
+    # Report startup times once the deferred startup work is done
+    if startup_timer is not None:
+        startup_timer.mark("deferred startup")
+        console.log("Startup times:\n" + "\n".join(startup_timer.report_lines()))
+        startup_timer = None
     
-    # Schedule next frame
-    request_id = requestAnimationFrame(create_proxy(web_game_loop))
+    # Schedule next frame with the same callback proxy
+    frame_request = requestAnimationFrame(frame_proxy)
 
 def start_web_game_loop():
     """Start the game loop for the web version"""
-    global running
+    global running, last_timestamp, frame_proxy, frame_request
+    if running:
+        return
     running = True
-    requestAnimationFrame(create_proxy(web_game_loop))
+    last_timestamp = None
+    if not handler_proxies:
+        setup_event_handlers()
+    if frame_proxy is None:
+        frame_proxy = create_proxy(web_game_loop)
+    frame_request = requestAnimationFrame(frame_proxy)
 
 def stop_web_game_loop():
-    """Stop the game loop for the web version"""
-    global running
+    """Stop the game loop for the web version and free its proxies"""
+    global running, frame_proxy, frame_request
     running = False
+    if frame_request is not None:
+        cancelAnimationFrame(frame_request)
+        frame_request = None
+    if frame_proxy is not None:
+        frame_proxy.destroy()
+        frame_proxy = None
+    remove_event_handlers()
 
 # Export functions for JavaScript to call
 if is_browser:
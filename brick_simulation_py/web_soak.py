@@ -0,0 +1,203 @@
+"""
+Soak test for the web version's game loop
+Runs the web_integration frame loop for a long time against stand-in `js` and
+`pyodide` modules and reports memory growth measured with tracemalloc, plus
+any JavaScript proxies left alive after the loop is stopped.
+
+Usage: python web_soak.py [--frames N] [--warmup N] [--max-growth-kb KB]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+import types
+
+# Add the current directory to path to allow importing the src package
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+class StubProxy:
+    """Stands in for a pyodide proxy: callable until destroyed"""
+    created = 0
+    live = 0
+    
+    def __init__(self, function):
+        self.function = function
+        self.destroyed = False
+        StubProxy.created += 1
+        StubProxy.live += 1
+    
+    def __call__(self, *args):
+        if self.destroyed:
+            raise RuntimeError("proxy called after destroy()")
+        return self.function(*args)
+    
+    def destroy(self):
+        if not self.destroyed:
+            self.destroyed = True
+            StubProxy.live -= 1
+
+class StubTypedArray:
+    """Stands in for a Uint8ClampedArray (or a subarray view of one)"""
+    def __init__(self, length, buffer=None, offset=0):
+        self.buffer = buffer if buffer is not None else bytearray(length)
+        self.offset = offset
+        self.length = length
+    
+    def subarray(self, start, end):
+        return StubTypedArray(end - start, self.buffer, self.offset + start)
+    
+    def assign(self, data):
+        data = memoryview(data).cast("B")
+        if len(data) != self.length:
+            raise ValueError("assign() size mismatch")
+        self.buffer[self.offset:self.offset + self.length] = data
+
+class StubContext:
+    """Stands in for a 2D canvas context"""
+    def __init__(self):
+        self.uploaded_bytes = 0
+    
+    def putImageData(self, image, dx, dy, x=0, y=0, width=None, height=None):
+        _, image_width, image_height = image
+        width = image_width if width is None else width
+        height = image_height if height is None else height
+        self.uploaded_bytes += width * height * 4
+
+class StubKeyEvent:
+    """Stands in for a browser KeyboardEvent"""
+    def __init__(self, key):
+        self.key = key
+    
+    def preventDefault(self):
+        pass
+
+class StubBrowser:
+    """The document, window and animation-frame queue the web module talks to"""
+    def __init__(self):
+        self.context = StubContext()
+        self.listeners = {}  # {event name: [listener, ...]}
+        self.frame_callback = None
+        self.frame_requests = 0
+    
+    def make_modules(self):
+        """The `js` and `pyodide` modules backed by this browser"""
+        canvas = types.SimpleNamespace(getContext=lambda kind: self.context)
+        document = types.SimpleNamespace(
+            getElementById=lambda element_id: canvas,
+            addEventListener=lambda name, listener: self.listeners.setdefault(name, []).append(listener),
+            removeEventListener=lambda name, listener: self.listeners.get(name, []).remove(listener))
+        js = types.ModuleType("js")
+        js.document = document
+        js.window = types.SimpleNamespace()
+        js.console = types.SimpleNamespace(log=print)
+        js.requestAnimationFrame = self.request_animation_frame
+        js.cancelAnimationFrame = self.cancel_animation_frame
+        js.Uint8ClampedArray = types.SimpleNamespace(new=StubTypedArray)
+        js.ImageData = types.SimpleNamespace(new=lambda array, width, height: (array, width, height))
+        pyodide = types.ModuleType("pyodide")
+        pyodide.create_proxy = StubProxy
+        return js, pyodide
+    
+    def request_animation_frame(self, callback):
+        self.frame_callback = callback
+        self.frame_requests += 1
+        return self.frame_requests
+    
+    def cancel_animation_frame(self, request_id):
+        if request_id == self.frame_requests:
+            self.frame_callback = None
+    
+    def run_frame(self, timestamp):
+        """Fire the pending animation frame, if any; returns False if none was pending"""
+        callback = self.frame_callback
+        if callback is None:
+            return False
+        self.frame_callback = None
+        callback(timestamp)
+        return True
+    
+    def press(self, key):
+        """Dispatch a key press and release to the document listeners"""
+        for name in ("keydown", "keyup"):
+            for listener in list(self.listeners.get(name, [])):
+                listener(StubKeyEvent(key))
+
+def start_game(browser):
+    """
+    Set up pygame and the web module the way init_web does, with a plain display
+    Returns the web module and the number of proxies it exported on import
+    """
+    js, pyodide = browser.make_modules()
+    sys.modules["js"] = js
+    sys.modules["pyodide"] = pyodide
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    
+    import pygame
+    import web_integration as web
+    from src import config
+    from src.game import Game
+    exported_proxies = StubProxy.live
+    
+    # init_web hands Pyodide's pygame a canvas-backed surface; here an ordinary
+    # display surface is used instead
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    web.canvas = js.document.getElementById('game-canvas')
+    web.ctx = web.canvas.getContext('2d')
+    web.game = Game(config, seed=0, defer_startup=True)
+    web.start_web_game_loop()
+    return web, exported_proxies
+
+def run_frames(web, browser, count, first_frame, frame_ms=1000 / 60):
+    """Run count animation frames, pressing keys now and then to keep the game going"""
+    for frame in range(first_frame, first_frame + count):
+        if frame % 120 == 0:
+            state = web.game.simulation.state
+            browser.press("Enter" if state == "game_over" else " ")
+        if not browser.run_frame(frame * frame_ms):
+            raise RuntimeError(f"the loop stopped scheduling frames at frame {frame}")
+    return first_frame + count
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak test the web game loop for memory leaks")
+    parser.add_argument("--frames", type=int, default=20000, help="Frames to measure")
+    parser.add_argument("--warmup", type=int, default=1200,
+                        help="Frames to run before measuring (caches and the rewind buffer fill up)")
+    parser.add_argument("--max-growth-kb", type=float, default=None,
+                        help="Exit with an error if memory grows by more than this")
+    parser.add_argument("--top", type=int, default=5, help="Allocation sites to list")
+    args = parser.parse_args()
+    
+    # Trace from the start, so memory that is only replaced (ring buffers,
+    # caches) during the measurement doesn't show up as growth
+    tracemalloc.start()
+    browser = StubBrowser()
+    web, exported_proxies = start_game(browser)
+    frame = run_frames(web, browser, args.warmup, 1)
+    
+    before = tracemalloc.take_snapshot()
+    proxies_before = StubProxy.created
+    uploaded_before = browser.context.uploaded_bytes
+    frame = run_frames(web, browser, args.frames, frame)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename")) / 1024
+    print(f"frames:            {args.frames} (after {args.warmup} warm-up frames)")
+    print(f"memory growth:     {growth:+.1f} KB ({growth * 1000 / args.frames:+.2f} KB per 1000 frames)")
+    print(f"proxies created:   {StubProxy.created - proxies_before} while measuring")
+    print(f"canvas uploads:    {(browser.context.uploaded_bytes - uploaded_before) / args.frames / 1024:.1f} KB per frame")
+    print("largest growth:")
+    for stat in after.compare_to(before, "lineno")[:args.top]:
+        print(f"  {stat.size_diff / 1024:+8.1f} KB  {stat.traceback}")
+    
+    # The functions exported to JavaScript (window.init_bric_game, ...) stay alive on purpose
+    web.stop_web_game_loop()
+    leaked_proxies = StubProxy.live - exported_proxies
+    print(f"proxies left alive after stop: {leaked_proxies}")
+    
+    if leaked_proxies or (args.max_growth_kb is not None and growth > args.max_growth_kb):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()